@@ -19,6 +19,8 @@ from app.models.payment_method import *
 from app.models.product_price import *
 from app.models.product_rate import *
 from app.models.product import *
+from app.models.product_listing import *
+from app.models.resource_version import *
 from app.models.staff import *
 from app.models.user import *
 from app.models.user_token import *
@@ -0,0 +1,48 @@
+"""Add full-text search vectors
+
+Revision ID: 1ef59a2b7ce3
+Revises: a22b78d3297a
+Create Date: 2026-10-18 09:12:04.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1ef59a2b7ce3'
+down_revision: Union[str, None] = 'a22b78d3297a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (text search config, searchable columns), mirrors search_vector_column() on the models
+SEARCH_VECTORS = {
+    'products': ('english', ['name', 'description']),
+    'categories': ('english', ['name', 'description']),
+    'brands': ('english', ['name', 'description']),
+    'customers': ('simple', ['name', 'phone_number', 'address']),
+    'colors': ('simple', ['name', 'code']),
+    'locations': ('simple', ['name']),
+    'payment_methods': ('simple', ['name', 'type', 'provider']),
+}
+
+
+def upgrade() -> None:
+    for table, (config, columns) in SEARCH_VECTORS.items():
+        document = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+        op.add_column(table, sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(f"to_tsvector('{config}'::regconfig, {document})", persisted=True),
+            nullable=True
+        ))
+        op.create_index(f'ix_{table}_search_vector', table, ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    for table in SEARCH_VECTORS:
+        op.drop_index(f'ix_{table}_search_vector', table_name=table, postgresql_using='gin')
+        op.drop_column(table, 'search_vector')
@@ -0,0 +1,47 @@
+"""Add trigram search indexes
+
+Revision ID: 3ce485aebc0a
+Revises: 1ef59a2b7ce3
+Create Date: 2026-10-18 10:02:51.530417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3ce485aebc0a'
+down_revision: Union[str, None] = '1ef59a2b7ce3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> searchable columns, mirrors __searchable_columns__ on the models
+SEARCHABLE_COLUMNS = {
+    'products': ['name'],
+    'categories': ['name'],
+    'brands': ['name'],
+    'customers': ['name', 'phone_number', 'address'],
+    'colors': ['name', 'code'],
+    'locations': ['name'],
+    'payment_methods': ['name', 'provider'],
+    'orders': ['order_number', 'order_status'],
+    'users': ['username', 'email'],
+    'media_storages': ['name'],
+}
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, columns in SEARCHABLE_COLUMNS.items():
+        for column in columns:
+            op.create_index(
+                f'ix_{table}_{column}_trgm', table, [column], unique=False,
+                postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'}
+            )
+
+
+def downgrade() -> None:
+    for table, columns in SEARCHABLE_COLUMNS.items():
+        for column in columns:
+            op.drop_index(f'ix_{table}_{column}_trgm', table_name=table, postgresql_using='gin')
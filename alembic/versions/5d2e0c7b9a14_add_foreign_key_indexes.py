@@ -0,0 +1,46 @@
+"""Add foreign key and hot predicate indexes
+
+Revision ID: 5d2e0c7b9a14
+Revises: 3ce485aebc0a
+Create Date: 2026-10-18 14:21:37.602318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e0c7b9a14'
+down_revision: Union[str, None] = '3ce485aebc0a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# index name -> (table, columns), mirrors index=True / Index() on the models
+INDEXES = {
+    'ix_carts_user_id': ('carts', ['user_id']),
+    'ix_carts_product_price_id': ('carts', ['product_price_id']),
+    'ix_product_prices_product_id': ('product_prices', ['product_id']),
+    'ix_order_details_order_id': ('order_details', ['order_id']),
+    'ix_orders_customer_id': ('orders', ['customer_id']),
+    'ix_orders_created_by': ('orders', ['created_by']),
+    'ix_order_histories_order_id': ('order_histories', ['order_id']),
+    'ix_customers_user_id': ('customers', ['user_id']),
+    'ix_staffs_user_id': ('staffs', ['user_id']),
+    'ix_notifications_target': ('notifications', ['target']),
+    'ix_media_storages_reference_id_entity_type': ('media_storages', ['reference_id', 'entity_type']),
+    'ix_product_rates_product_id': ('product_rates', ['product_id']),
+}
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable while the indexes build; it can't run in a transaction
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in INDEXES.items():
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, _) in INDEXES.items():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
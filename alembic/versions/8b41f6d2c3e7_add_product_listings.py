@@ -0,0 +1,55 @@
+"""Add product listings read model
+
+Revision ID: 8b41f6d2c3e7
+Revises: 5d2e0c7b9a14
+Create Date: 2026-10-18 16:05:12.480913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b41f6d2c3e7'
+down_revision: Union[str, None] = '5d2e0c7b9a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'product_listings',
+        sa.Column('product_id', sa.UUID(), nullable=False),
+        sa.Column('min_price', sa.Float(), nullable=True),
+        sa.Column('max_price', sa.Float(), nullable=True),
+        sa.Column('color_ids', postgresql.ARRAY(sa.UUID()), server_default='{}', nullable=False),
+        sa.Column('variant_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('avg_rate', sa.Float(), nullable=True),
+        sa.Column('rate_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('product_id')
+    )
+    # Backfill, afterwards the services keep the rows current
+    op.execute("""
+        INSERT INTO product_listings (product_id, min_price, max_price, color_ids, variant_count, avg_rate, rate_count)
+        SELECT p.id, pp.min_price, pp.max_price, coalesce(pp.color_ids, '{}'), coalesce(pp.variant_count, 0),
+               pr.avg_rate, coalesce(pr.rate_count, 0)
+        FROM products p
+        LEFT JOIN (
+            SELECT product_id, min(price) AS min_price, max(price) AS max_price,
+                   array_remove(array_agg(DISTINCT color_id), NULL) AS color_ids, count(*) AS variant_count
+            FROM product_prices GROUP BY product_id
+        ) pp ON pp.product_id = p.id
+        LEFT JOIN (
+            SELECT product_id, avg(rate) AS avg_rate, count(*) AS rate_count
+            FROM product_rates GROUP BY product_id
+        ) pr ON pr.product_id = p.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('product_listings')
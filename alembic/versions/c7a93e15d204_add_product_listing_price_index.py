@@ -0,0 +1,34 @@
+"""Add product listing price index
+
+Revision ID: c7a93e15d204
+Revises: 8b41f6d2c3e7
+Create Date: 2026-10-18 17:42:55.031266
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7a93e15d204'
+down_revision: Union[str, None] = '8b41f6d2c3e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the table writable while the index builds; it can't run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_product_listings_min_price', 'product_listings', ['min_price', 'product_id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_product_listings_min_price', table_name='product_listings',
+            postgresql_concurrently=True, if_exists=True
+        )
@@ -0,0 +1,42 @@
+"""Backfill product listings missing for seeded products
+
+Revision ID: d4f1a9b2c8e6
+Revises: c7a93e15d204
+Create Date: 2026-10-18 16:48:03.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f1a9b2c8e6'
+down_revision: Union[str, None] = 'c7a93e15d204'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The seeder wrote products without listing rows, build the ones that are missing
+    op.execute("""
+        INSERT INTO product_listings (product_id, min_price, max_price, color_ids, variant_count, avg_rate, rate_count)
+        SELECT p.id, pp.min_price, pp.max_price, coalesce(pp.color_ids, '{}'), coalesce(pp.variant_count, 0),
+               pr.avg_rate, coalesce(pr.rate_count, 0)
+        FROM products p
+        LEFT JOIN (
+            SELECT product_id, min(price) AS min_price, max(price) AS max_price,
+                   array_remove(array_agg(DISTINCT color_id), NULL) AS color_ids, count(*) AS variant_count
+            FROM product_prices GROUP BY product_id
+        ) pp ON pp.product_id = p.id
+        LEFT JOIN (
+            SELECT product_id, avg(rate) AS avg_rate, count(*) AS rate_count
+            FROM product_rates GROUP BY product_id
+        ) pr ON pr.product_id = p.id
+        WHERE NOT EXISTS (SELECT 1 FROM product_listings pl WHERE pl.product_id = p.id)
+    """)
+
+
+def downgrade() -> None:
+    # Nothing to undo, the rows match what the services maintain
+    pass
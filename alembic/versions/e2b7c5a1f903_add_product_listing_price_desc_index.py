@@ -0,0 +1,36 @@
+"""Add descending product listing price index
+
+Revision ID: e2b7c5a1f903
+Revises: d4f1a9b2c8e6
+Create Date: 2026-10-18 17:20:41.662910
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c5a1f903'
+down_revision: Union[str, None] = 'd4f1a9b2c8e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A backward scan of the ascending index yields NULLS FIRST, sort=price:desc wants NULLS LAST
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_product_listings_min_price_desc', 'product_listings',
+            [sa.text('min_price DESC NULLS LAST'), sa.text('product_id DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_product_listings_min_price_desc', table_name='product_listings',
+            postgresql_concurrently=True, if_exists=True
+        )
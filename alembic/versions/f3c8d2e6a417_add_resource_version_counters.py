@@ -0,0 +1,68 @@
+"""Add resource version counters for conditional GETs
+
+Revision ID: f3c8d2e6a417
+Revises: e2b7c5a1f903
+Create Date: 2026-10-18 18:05:12.407311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c8d2e6a417'
+down_revision: Union[str, None] = 'e2b7c5a1f903'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables served by the frontend conditional GET routes
+VERSIONED_TABLES = (
+    'products', 'product_prices', 'product_rates', 'product_listings',
+    'categories', 'brands', 'colors', 'locations', 'payment_methods',
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE resource_version_seq")
+    op.create_table(
+        'resource_versions',
+        sa.Column('table_name', sa.String(), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('changed_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('table_name')
+    )
+    # Deferred to commit and bumped once per table and transaction, so the counter row is only
+    # locked for the end of the commit and bulk statements don't update it once per row
+    op.execute("""
+        CREATE FUNCTION bump_resource_version() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF current_setting('resource_versions.' || TG_TABLE_NAME, true) = 'bumped' THEN
+                RETURN NULL;
+            END IF;
+            PERFORM set_config('resource_versions.' || TG_TABLE_NAME, 'bumped', true);
+            INSERT INTO resource_versions (table_name, version, changed_at)
+            VALUES (TG_TABLE_NAME, nextval('resource_version_seq'), now())
+            ON CONFLICT (table_name) DO UPDATE SET version = excluded.version, changed_at = excluded.changed_at;
+            RETURN NULL;
+        END
+        $$
+    """)
+    for table in VERSIONED_TABLES:
+        op.execute(f"""
+            CREATE CONSTRAINT TRIGGER bump_resource_version AFTER INSERT OR UPDATE OR DELETE ON {table}
+            DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION bump_resource_version()
+        """)
+        op.execute(f"""
+            INSERT INTO resource_versions (table_name, version, changed_at)
+            VALUES ('{table}', nextval('resource_version_seq'), now())
+        """)
+
+
+def downgrade() -> None:
+    for table in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS bump_resource_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_resource_version()")
+    op.drop_table('resource_versions')
+    op.execute("DROP SEQUENCE IF EXISTS resource_version_seq")
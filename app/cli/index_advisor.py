@@ -0,0 +1,107 @@
+"""
+Index advisor: EXPLAIN the app's known query shapes and report sequential scans on large tables.
+
+Usage:
+    python -m app.cli.index_advisor [--min-rows 10000] [--analyze]
+
+Exits with status 1 when a shape sequentially scans a table holding at least `--min-rows` rows.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import uuid
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from app.config.database import engine
+# Every model is imported so string relationships resolve when mappers configure
+from app.models.brand import Brand  # noqa: F401
+from app.models.cart import Cart
+from app.models.category import Category  # noqa: F401
+from app.models.color import Color  # noqa: F401
+from app.models.customer import Customer
+from app.models.location import Location  # noqa: F401
+from app.models.media_storage import MediaStorage
+from app.models.notification import Notification
+from app.models.order import Order
+from app.models.order_detail import OrderDetail
+from app.models.order_history import OrderHistory
+from app.models.payment_method import PaymentMethod  # noqa: F401
+from app.models.product import Product
+from app.models.product_price import ProductPrice
+from app.models.product_rate import ProductRate
+from app.models.staff import Staff
+from app.models.user import User
+from app.models.user_token import UserToken  # noqa: F401
+
+
+def query_shapes() -> dict:
+    """Representative statements for the lookups and listings the services run."""
+    some_id = uuid.uuid4()
+    return {
+        "product list": select(Product).order_by(Product.created_at.desc()).limit(10),
+        "product prices by product": select(ProductPrice).where(ProductPrice.product_id == some_id),
+        "product rates by product": select(ProductRate).where(ProductRate.product_id == some_id),
+        "carts by user": select(Cart).where(Cart.user_id == some_id),
+        "carts by product price": select(Cart).where(Cart.product_price_id == some_id),
+        "order list": select(Order).order_by(Order.created_at.desc()).limit(10),
+        "orders by customer": select(Order).where(Order.customer_id == some_id).order_by(Order.created_at.desc()),
+        "orders by creator": select(Order).where(Order.created_by == some_id).order_by(Order.created_at.desc()),
+        "order details by order": select(OrderDetail).where(OrderDetail.order_id == some_id),
+        "order histories by order": select(OrderHistory).where(OrderHistory.order_id == some_id),
+        "customer by user": select(Customer).where(Customer.user_id == some_id),
+        "staff by user": select(Staff).where(Staff.user_id == some_id),
+        "user by email": select(User).where(User.email == "someone@example.com"),
+        "notifications by target": select(Notification).where(Notification.target == "admin"),
+        "media by reference": select(MediaStorage).where(
+            MediaStorage.reference_id == some_id, MediaStorage.entity_type == "product"
+        ),
+    }
+
+
+def _seq_scans(plan: dict):
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", []):
+        yield from _seq_scans(child)
+
+
+async def advise(min_rows: int, analyze: bool) -> int:
+    findings = []
+    async with engine.connect() as connection:
+        table_rows = dict((await connection.execute(text(
+            "SELECT relname, reltuples::bigint FROM pg_class WHERE relkind = 'r'"
+        ))).all())
+
+        for name, stmt in query_shapes().items():
+            sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+            explain = "EXPLAIN (ANALYZE, FORMAT JSON) " if analyze else "EXPLAIN (FORMAT JSON) "
+            raw_plan = (await connection.execute(text(explain + sql))).scalar()
+            plan = (json.loads(raw_plan) if isinstance(raw_plan, str) else raw_plan)[0]["Plan"]
+
+            for table in _seq_scans(plan):
+                rows = table_rows.get(table, 0)
+                status = "SEQ SCAN" if rows >= min_rows else "seq scan (small table)"
+                print(f"{status:<24} {name:<28} {table} ~{rows} rows, cost {plan['Total Cost']}")
+                if rows >= min_rows:
+                    findings.append((name, table))
+        # EXPLAIN ANALYZE runs the statements, keep the advisor side effect free
+        await connection.rollback()
+
+    await engine.dispose()
+    print(f"\n{len(findings)} sequential scan(s) on tables with at least {min_rows} rows")
+    return 1 if findings else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report sequential scans in the app's known query shapes.")
+    parser.add_argument("--min-rows", type=int, default=10000, help="only flag tables with at least this many rows")
+    parser.add_argument("--analyze", action="store_true", help="run EXPLAIN ANALYZE instead of a plain EXPLAIN")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(advise(args.min_rows, args.analyze)))
+
+
+if __name__ == "__main__":
+    main()
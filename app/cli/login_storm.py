@@ -0,0 +1,92 @@
+"""
+Load test: catalog latency under a login storm.
+
+Measures the latency of an unrelated catalog endpoint on a running server twice, first
+on its own and then while `--logins` concurrent login requests hammer `/auth/login`.
+With bcrypt off the event loop the catalog p99 should stay close to the baseline.
+
+Usage:
+    python -m app.cli.login_storm [--base-url http://localhost:8000] [--catalog /frontend/categories]
+        [--logins 50] [--rounds 4] [--samples 200] [--max-slowdown 3]
+
+Exits with status 1 when the catalog p99 under the storm exceeds `--max-slowdown` times the baseline p99,
+or when some logins were rejected. Start the server with `RATE_LIMIT_ENABLED=false`, the login rate
+limits would otherwise answer most of the storm with 429 before bcrypt runs.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections import Counter
+
+import httpx
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def sample_catalog(client: httpx.AsyncClient, path: str, samples: int) -> list:
+    latencies = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        await client.get(path)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+async def login_storm(client: httpx.AsyncClient, credentials: dict, logins: int, rounds: int) -> Counter:
+    statuses = Counter()
+    for _ in range(rounds):
+        responses = await asyncio.gather(*(client.post("/auth/login", json=credentials) for _ in range(logins)))
+        statuses.update(response.status_code for response in responses)
+    return statuses
+
+
+def report(label: str, latencies: list) -> float:
+    p99 = percentile(latencies, 99)
+    print(f"{label:<16} p50 {statistics.median(latencies):8.1f}ms  p99 {p99:8.1f}ms  max {max(latencies):8.1f}ms")
+    return p99
+
+
+async def run(args) -> int:
+    credentials = {"username": args.username, "email": args.email, "password": args.password}
+    limits = httpx.Limits(max_connections=args.logins + 10)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60, limits=limits) as client:
+        await client.get(args.catalog)  # warm up
+        baseline = report("baseline", await sample_catalog(client, args.catalog, args.samples))
+
+        storm = asyncio.create_task(login_storm(client, credentials, args.logins, args.rounds))
+        await asyncio.sleep(0.1)
+        under_storm = report("login storm", await sample_catalog(client, args.catalog, args.samples))
+        statuses = await storm
+
+    slowdown = under_storm / baseline if baseline else float("inf")
+    print(f"login statuses   {dict(statuses)}")
+    print(f"\np99 slowdown under the login storm: x{slowdown:.1f} (limit x{args.max_slowdown})")
+    if set(statuses) != {200}:
+        # Rejected logins (429 from the rate limiter, 503 from a full hashing queue) never reach bcrypt
+        print("not every login succeeded, the storm was lighter than requested")
+        return 1
+    return 1 if slowdown > args.max_slowdown else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare catalog latency with and without a concurrent login storm.")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--catalog", default="/frontend/categories", help="catalog endpoint to sample")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--email", default="admin@example.com")
+    parser.add_argument("--password", default="admin@123")
+    parser.add_argument("--logins", type=int, default=50, help="concurrent logins per round")
+    parser.add_argument("--rounds", type=int, default=4, help="login rounds in the storm")
+    parser.add_argument("--samples", type=int, default=200, help="catalog requests per measurement")
+    parser.add_argument("--max-slowdown", type=float, default=3.0, help="allowed p99 ratio, storm over baseline")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
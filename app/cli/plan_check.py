@@ -0,0 +1,321 @@
+"""
+Query plan regression check for the hot queries.
+
+Seeds a realistically sized dataset inside a transaction, runs ANALYZE, captures
+`EXPLAIN (FORMAT JSON)` for the statements behind the hot endpoints and checks plan
+properties: required index usage, no sequential scans where an index is expected,
+no nested loops over large row estimates and an estimated cost bound. The plan outline
+is compared with the committed snapshot in `plan_snapshots/` and any change is printed
+as a diff. The transaction is rolled back at the end, so the database is left untouched.
+`tests/test_query_plans.py` runs the same checks under pytest.
+
+Usage:
+    python -m app.cli.plan_check [--scale 10000] [--update]
+
+`--update` rewrites the snapshots after an intended plan change. Exits with status 1 on failure.
+"""
+import argparse
+import asyncio
+import difflib
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from sqlalchemy import select, func, and_, text
+from sqlalchemy.dialects import postgresql
+
+from app.config.database import engine
+# Every model is imported so string relationships resolve when mappers configure
+from app.models.brand import Brand  # noqa: F401
+from app.models.cart import Cart
+from app.models.category import Category  # noqa: F401
+from app.models.color import Color  # noqa: F401
+from app.models.customer import Customer  # noqa: F401
+from app.models.location import Location  # noqa: F401
+from app.models.media_storage import MediaStorage  # noqa: F401
+from app.models.notification import Notification, notification_seen_users
+from app.models.order import Order
+from app.models.order_detail import OrderDetail  # noqa: F401
+from app.models.order_history import OrderHistory
+from app.models.payment_method import PaymentMethod  # noqa: F401
+from app.models.product import Product
+from app.models.product_listing import ProductListing
+from app.models.product_price import ProductPrice
+from app.models.product_rate import ProductRate  # noqa: F401
+from app.models.staff import Staff  # noqa: F401
+from app.models.user import User
+from app.models.user_token import UserToken  # noqa: F401
+from app.responses.paginated_response import PaginationParam
+from app.schemas.product import PriceRangeParam
+from app.services.base_service import apply_sort
+from app.services.product import _apply_price_range, _by_price, _product_list_stmt
+
+SNAPSHOT_DIR = Path(__file__).parent / "plan_snapshots"
+
+# Each statement fills the table from generate_series(1, :scale); the arrays pick parents round-robin
+SEED_STATEMENTS = [
+    """INSERT INTO users (id, username, password, email, role, is_active)
+       SELECT gen_random_uuid(), 'plan_user_' || g, 'x', 'plan_user_' || g || '@example.com', 2, true
+       FROM generate_series(1, :scale) g""",
+    """INSERT INTO customers (id, name, user_id)
+       SELECT gen_random_uuid(), 'customer ' || g, u.id
+       FROM (SELECT id, row_number() OVER () g FROM users) u(id, g)""",
+    """INSERT INTO categories (id, name) SELECT gen_random_uuid(), 'category ' || g FROM generate_series(1, 50) g""",
+    """INSERT INTO brands (id, name) SELECT gen_random_uuid(), 'brand ' || g FROM generate_series(1, 50) g""",
+    """INSERT INTO colors (id, code, name) SELECT gen_random_uuid(), 'c' || g, 'color ' || g FROM generate_series(1, 20) g""",
+    """INSERT INTO products (id, name, description, is_active, category_id, brand_id, created_at)
+       SELECT gen_random_uuid(), 'product ' || g, 'description of product ' || g, true,
+              (ARRAY(SELECT id FROM categories))[1 + g % 50], (ARRAY(SELECT id FROM brands))[1 + g % 50],
+              now() - g * interval '1 minute'
+       FROM generate_series(1, :scale) g""",
+    """INSERT INTO product_prices (id, price, color_id, size, product_id)
+       SELECT gen_random_uuid(), 10 + s * 5, (ARRAY(SELECT id FROM colors))[1 + (p.g + s) % 20], 'size ' || s, p.id
+       FROM (SELECT id, row_number() OVER () g FROM products) p(id, g), generate_series(1, 3) s""",
+    """INSERT INTO product_listings (product_id, min_price, max_price, color_ids, variant_count)
+       SELECT product_id, min(price), max(price), array_agg(DISTINCT color_id), count(*)
+       FROM product_prices GROUP BY product_id
+       ON CONFLICT (product_id) DO NOTHING""",
+    """INSERT INTO carts (id, user_id, product_price_id, qty)
+       SELECT gen_random_uuid(), (ARRAY(SELECT id FROM users))[1 + g % :scale],
+              (ARRAY(SELECT id FROM product_prices))[1 + g % (3 * :scale)], 1
+       FROM generate_series(1, :scale) g""",
+    """INSERT INTO orders (id, order_date, order_number, customer_id, amount, order_status, created_by, created_at)
+       SELECT gen_random_uuid(), now() - g * interval '1 minute', 'PLAN-' || g,
+              c.ids[1 + g % :scale], 100, 'pending', u.ids[1 + g % :scale], now() - g * interval '1 minute'
+       FROM generate_series(1, 2 * :scale) g,
+            (SELECT ARRAY(SELECT id FROM customers)) c(ids), (SELECT ARRAY(SELECT id FROM users)) u(ids)""",
+    """INSERT INTO order_histories (id, order_id, order_status)
+       SELECT gen_random_uuid(), o.id, status
+       FROM orders o, unnest(ARRAY['pending', 'accepted', 'done']) status""",
+    """INSERT INTO notifications (id, description, type, target, date, created_at)
+       SELECT gen_random_uuid(), 'notification ' || g, 'order',
+              CASE WHEN g % 2 = 0 THEN 'admin' ELSE 'customer:' || (ARRAY(SELECT id FROM users))[1 + g % :scale] END,
+              now(), now() - g * interval '1 minute'
+       FROM generate_series(1, :scale) g""",
+    """INSERT INTO notification_seen_users (notification_id, user_id)
+       SELECT n.id, (SELECT id FROM users ORDER BY id LIMIT 1)
+       FROM notifications n WHERE n.target = 'admin'""",
+]
+
+SEEDED_TABLES = (
+    "users", "customers", "categories", "brands", "colors", "products", "product_prices",
+    "product_listings", "carts", "orders", "order_histories", "notifications", "notification_seen_users",
+)
+
+
+@dataclass
+class PlanCheck:
+    name: str
+    build: Callable[[dict], object]
+    # Indexes that must appear in the plan
+    uses_indexes: tuple = ()
+    # Tables that must not be read with a sequential scan
+    no_seq_scan: tuple = ()
+    # Largest row estimate allowed on either side of a nested loop
+    max_nested_loop_rows: int = 10000
+    max_cost: Optional[float] = None
+    findings: list = field(default_factory=list)
+
+
+def plan_checks() -> list[PlanCheck]:
+    """The statements behind get_products (by date and by price in both directions), get_carts, get_orders, get_unseen_notifications and get_order_histories."""
+    return [
+        PlanCheck(
+            "get_products",
+            lambda ids: select(Product, func.count().over().label("total_items"))
+            .order_by(Product.created_at.desc(), Product.id.desc()).limit(10),
+        ),
+        PlanCheck(
+            "get_products.product_prices",
+            lambda ids: select(ProductPrice).where(ProductPrice.product_id.in_(ids["product_ids"])),
+            uses_indexes=("ix_product_prices_product_id",),
+            no_seq_scan=("product_prices",),
+            max_cost=1000,
+        ),
+        PlanCheck(
+            "get_products.by_price",
+            lambda ids: _products_by_price("price:asc", PriceRangeParam(price_max=50)),
+            uses_indexes=("ix_product_listings_min_price",),
+            no_seq_scan=("product_listings",),
+        ),
+        PlanCheck(
+            "get_products.by_price_desc",
+            lambda ids: _products_by_price("price:desc"),
+            uses_indexes=("ix_product_listings_min_price_desc",),
+            no_seq_scan=("product_listings",),
+        ),
+        PlanCheck(
+            "get_carts",
+            lambda ids: select(Cart).join(Cart.user).where(User.id == ids["user_id"]),
+            uses_indexes=("ix_carts_user_id",),
+            no_seq_scan=("carts", "users"),
+            max_cost=1000,
+        ),
+        PlanCheck(
+            "get_orders",
+            lambda ids: select(Order, func.count().over().label("total_items"))
+            .order_by(Order.created_at.desc(), Order.id.desc()).limit(10),
+        ),
+        PlanCheck(
+            "get_orders.by_customer",
+            lambda ids: select(Order).where(Order.customer_id == ids["customer_id"]).order_by(Order.created_at.desc()),
+            uses_indexes=("ix_orders_customer_id",),
+            no_seq_scan=("orders",),
+            max_cost=1000,
+        ),
+        PlanCheck(
+            "get_unseen_notifications",
+            lambda ids: select(Notification).where(
+                ~Notification.id.in_(
+                    select(notification_seen_users.c.notification_id).where(and_(
+                        notification_seen_users.c.user_id == ids["user_id"],
+                        Notification.target == f"customer:{ids['user_id']}"
+                    )).scalar_subquery()
+                ),
+                Notification.target == f"customer:{ids['user_id']}",
+            ).order_by(Notification.created_at.desc()).limit(10),
+            uses_indexes=("ix_notifications_target",),
+        ),
+        PlanCheck(
+            "get_order_histories",
+            lambda ids: select(OrderHistory).join(Order)
+            .where(OrderHistory.order_id == ids["order_id"], Order.created_by == ids["user_id"])
+            .order_by(OrderHistory.created_at.asc()),
+            uses_indexes=("ix_order_histories_order_id",),
+            no_seq_scan=("order_histories", "orders"),
+            max_cost=1000,
+        ),
+    ]
+
+
+def _products_by_price(sort: str, price_range: PriceRangeParam = PriceRangeParam()):
+    """The storefront list statement for a price sort, as built by the product service with `with_total=false`."""
+    pagination = PaginationParam(sort=sort, with_total="false")
+    stmt = _apply_price_range(_product_list_stmt(by_price=_by_price(pagination, price_range)), price_range)
+    return apply_sort(stmt, Product, pagination, Product.created_at).limit(10)
+
+
+def _walk(plan: dict, depth: int = 0):
+    yield depth, plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child, depth + 1)
+
+
+def plan_outline(plan: dict) -> str:
+    """Cost-free outline of the plan tree, stable enough to diff between runs."""
+    lines = []
+    for depth, node in _walk(plan):
+        line = node["Node Type"]
+        if "Relation Name" in node:
+            line += f" on {node['Relation Name']}"
+        if "Index Name" in node:
+            line += f" using {node['Index Name']}"
+        lines.append("  " * depth + line)
+    return "\n".join(lines) + "\n"
+
+
+def _nodes_under_limit(plan: dict, limited: bool = False):
+    """Yield (node, limited) pairs, `limited` when a Limit above the node stops its scans early."""
+    yield plan, limited
+    limited = limited or plan["Node Type"] == "Limit"
+    for child in plan.get("Plans", []):
+        yield from _nodes_under_limit(child, limited)
+
+
+def check_plan(check: PlanCheck, plan: dict):
+    nodes = [node for _, node in _walk(plan)]
+    # Row estimates ignore an enclosing LIMIT, a nested loop feeding one only runs for the first rows
+    limited_nodes = {id(node) for node, limited in _nodes_under_limit(plan) if limited}
+    used_indexes = {node["Index Name"] for node in nodes if "Index Name" in node}
+
+    for index in check.uses_indexes:
+        if index not in used_indexes:
+            check.findings.append(f"expected index {index} is not used")
+    for node in nodes:
+        if node["Node Type"] == "Seq Scan" and node["Relation Name"] in check.no_seq_scan:
+            check.findings.append(f"sequential scan on {node['Relation Name']}")
+        if node["Node Type"] == "Nested Loop" and id(node) not in limited_nodes:
+            rows = max(child["Plan Rows"] for child in node["Plans"])
+            if rows > check.max_nested_loop_rows:
+                check.findings.append(f"nested loop over ~{rows} rows (limit {check.max_nested_loop_rows})")
+    if check.max_cost is not None and plan["Total Cost"] > check.max_cost:
+        check.findings.append(f"estimated cost {plan['Total Cost']} above {check.max_cost}")
+
+
+def compare_snapshot(check: PlanCheck, outline: str, update: bool):
+    snapshot = SNAPSHOT_DIR / f"{check.name}.txt"
+    if update:
+        SNAPSHOT_DIR.mkdir(exist_ok=True)
+        snapshot.write_text(outline)
+        return
+    if not snapshot.exists():
+        check.findings.append(f"no snapshot at {snapshot}, run with --update to record one")
+        return
+    expected = snapshot.read_text()
+    if outline != expected:
+        diff = difflib.unified_diff(
+            expected.splitlines(keepends=True), outline.splitlines(keepends=True),
+            fromfile=f"{check.name} (snapshot)", tofile=f"{check.name} (current)"
+        )
+        check.findings.append("plan changed:\n" + "".join(diff))
+
+
+async def check_plans(connection, scale: int, update: bool = False) -> list[PlanCheck]:
+    """
+    Seed, analyze and check every plan on `connection`, returning the checks with their findings.
+
+    Everything runs in one transaction that is rolled back before returning.
+    """
+    checks = plan_checks()
+    transaction = await connection.begin()
+    try:
+        for statement in SEED_STATEMENTS:
+            await connection.execute(text(statement), {"scale": scale})
+        for table in SEEDED_TABLES:
+            await connection.execute(text(f"ANALYZE {table}"))
+
+        ids = {
+            "user_id": await connection.scalar(select(User.id).order_by(User.id).limit(1)),
+            "customer_id": await connection.scalar(select(Order.customer_id).limit(1)),
+            "order_id": await connection.scalar(select(Order.id).limit(1)),
+            "product_ids": list(await connection.scalars(select(Product.id).limit(10))),
+        }
+
+        for check in checks:
+            stmt = check.build(ids)
+            sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+            raw_plan = await connection.scalar(text("EXPLAIN (FORMAT JSON) " + sql))
+            plan = (json.loads(raw_plan) if isinstance(raw_plan, str) else raw_plan)[0]["Plan"]
+
+            check_plan(check, plan)
+            compare_snapshot(check, plan_outline(plan), update)
+    finally:
+        await transaction.rollback()
+    return checks
+
+
+async def run(scale: int, update: bool) -> int:
+    async with engine.connect() as connection:
+        checks = await check_plans(connection, scale, update)
+    await engine.dispose()
+
+    failed = [check for check in checks if check.findings]
+    for check in checks:
+        print(f"{'FAIL' if check.findings else 'ok':<5} {check.name}")
+        for finding in check.findings:
+            print(f"      {finding}")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the plans of the hot queries against expectations and snapshots.")
+    parser.add_argument("--scale", type=int, default=10000, help="rows seeded into the main tables")
+    parser.add_argument("--update", action="store_true", help="rewrite the plan snapshots")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.scale, args.update)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Measure connection pool occupancy under a mixed login and catalog load, in process.
+
+Drives the app through an ASGI transport (no server needed) against the configured database
+and reports how many pooled connections are checked out over time and how long each checkout
+is held. Compare `DB_RELEASE_AFTER_READS=true` (the default) with `false` to see what
+releasing read-only connections before bcrypt and serialization saves. The catalog cache and
+rate limits are switched off so every request reaches the database.
+
+Usage:
+    DB_RELEASE_AFTER_READS=false python -m app.cli.pool_occupancy [--seconds 10]
+        [--logins 20] [--readers 20] [--catalog /frontend/products?limit=50]
+
+Needs a seeded database (POST /seeds) with the admin user.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ["CATALOG_CACHE_ENABLED"] = "false"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+import httpx  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.config.database import engine  # noqa: E402
+from app.config.settings import get_settings  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+class HoldTimes:
+    """Checkout to checkin time of every pooled connection."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.held_ms = []
+        self._checked_out = {}
+
+    def __enter__(self):
+        event.listen(self.pool, "checkout", self._checkout)
+        event.listen(self.pool, "checkin", self._checkin)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.pool, "checkout", self._checkout)
+        event.remove(self.pool, "checkin", self._checkin)
+
+    def _checkout(self, dbapi_connection, connection_record, connection_proxy):
+        self._checked_out[id(connection_record)] = time.perf_counter()
+
+    def _checkin(self, dbapi_connection, connection_record):
+        started = self._checked_out.pop(id(connection_record), None)
+        if started is not None:
+            self.held_ms.append((time.perf_counter() - started) * 1000)
+
+
+async def sample_occupancy(pool, deadline: float, samples: list):
+    while time.perf_counter() < deadline:
+        samples.append(pool.checkedout())
+        await asyncio.sleep(0.002)
+
+
+async def worker(client: httpx.AsyncClient, request, deadline: float, latencies: list):
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await request(client)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def run(args):
+    credentials = {"username": args.username, "email": args.email, "password": args.password}
+    pool = engine.sync_engine.pool
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://pool-occupancy", timeout=120) as client:
+        # warm up the pool and the statement caches
+        await client.get(args.catalog)
+        (await client.post("/auth/login", json=credentials)).raise_for_status()
+
+        login_latencies, catalog_latencies, occupancy = [], [], []
+        deadline = time.perf_counter() + args.seconds
+        with HoldTimes(pool) as holds:
+            await asyncio.gather(
+                sample_occupancy(pool, deadline, occupancy),
+                *(worker(client, lambda c: c.post("/auth/login", json=credentials), deadline, login_latencies)
+                  for _ in range(args.logins)),
+                *(worker(client, lambda c: c.get(args.catalog), deadline, catalog_latencies)
+                  for _ in range(args.readers)),
+            )
+
+    settings = get_settings()
+    print(f"DB_RELEASE_AFTER_READS={str(settings.DB_RELEASE_AFTER_READS).lower()}  "
+          f"pool {settings.DB_POOL_SIZE}+{settings.DB_MAX_OVERFLOW}  "
+          f"{args.logins} login and {args.readers} catalog clients for {args.seconds}s")
+    print(f"checked out     mean {statistics.mean(occupancy):6.2f}  p95 {percentile(occupancy, 95):4}  "
+          f"max {max(occupancy):4}")
+    print(f"hold per checkout  mean {statistics.mean(holds.held_ms):7.1f}ms  p95 {percentile(holds.held_ms, 95):7.1f}ms  "
+          f"({len(holds.held_ms)} checkouts)")
+    print(f"checkout wait   mean {pool.metrics.wait_total_ms / max(pool.metrics.checkouts, 1):7.1f}ms  "
+          f"max {pool.metrics.wait_max_ms:7.1f}ms  timeouts {pool.metrics.timeouts}")
+    for label, latencies in (("login", login_latencies), ("catalog", catalog_latencies)):
+        print(f"{label:<8} {len(latencies) / args.seconds:7.1f} req/s  p50 {statistics.median(latencies):7.1f}ms  "
+              f"p99 {percentile(latencies, 99):7.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report pool occupancy under concurrent logins and catalog reads.")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--logins", type=int, default=20, help="concurrent login clients")
+    parser.add_argument("--readers", type=int, default=20, help="concurrent catalog clients")
+    parser.add_argument("--catalog", default="/frontend/products?limit=50", help="catalog endpoint to read")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--email", default="admin@example.com")
+    parser.add_argument("--password", default="admin@123")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark `field:value` search on customers with and without its trigram index.
+
+Seeds `--rows` customers with random names inside a transaction, then times the statement
+`GET /backend/customers?search=name:<term>` runs (first page of 10 with the window total) for
+`--terms` random three character terms, `--repeat` times each: first with `ix_customers_name_trgm`
+in place, then with it dropped, which is the plan the unindexed ILIKE search had. The transaction
+is rolled back at the end, so the database is left untouched; the index drop holds an exclusive
+lock on customers until then, so don't point this at a live database.
+
+Measured on local Postgres 18 with one CPU, 1,000,000 rows, 20 terms x 5 runs, median 7,278
+matches per term (statement time through SQLAlchemy and asyncpg, not the HTTP request):
+
+    trigram index  p50  25.0ms  p95  68.8ms  max 221.6ms
+    no index       p50 479.1ms  p95 563.7ms  max 598.7ms
+
+Usage:
+    python -m app.cli.search_benchmark [--rows 1000000] [--terms 20] [--repeat 5]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import select, func, text
+
+from app.config.database import engine
+# Every model is imported so string relationships resolve when mappers configure
+from app.models.brand import Brand  # noqa: F401
+from app.models.cart import Cart  # noqa: F401
+from app.models.category import Category  # noqa: F401
+from app.models.color import Color  # noqa: F401
+from app.models.customer import Customer
+from app.models.location import Location  # noqa: F401
+from app.models.media_storage import MediaStorage  # noqa: F401
+from app.models.notification import Notification  # noqa: F401
+from app.models.order import Order  # noqa: F401
+from app.models.order_detail import OrderDetail  # noqa: F401
+from app.models.order_history import OrderHistory  # noqa: F401
+from app.models.payment_method import PaymentMethod  # noqa: F401
+from app.models.product import Product  # noqa: F401
+from app.models.product_listing import ProductListing  # noqa: F401
+from app.models.product_price import ProductPrice  # noqa: F401
+from app.models.product_rate import ProductRate  # noqa: F401
+from app.models.resource_version import ResourceVersion  # noqa: F401
+from app.models.staff import Staff  # noqa: F401
+from app.models.user import User  # noqa: F401
+from app.models.user_token import UserToken  # noqa: F401
+from app.responses.paginated_response import PaginationParam
+from app.services.base_service import apply_search_and_filters, apply_sort
+
+SEED_CUSTOMERS = """
+    INSERT INTO customers (id, name, address, phone_number)
+    SELECT gen_random_uuid(), 'customer ' || md5(g::text), 'street ' || g, '0' || (10000000 + g)
+    FROM generate_series(1, :rows) g
+"""
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def search_statement(term: str):
+    """The first page get_customers runs for `search=name:<term>`, total included."""
+    pagination = PaginationParam(search=f"name:{term}")
+    stmt = apply_search_and_filters(select(Customer), Customer, pagination)
+    stmt = apply_sort(stmt, Customer, pagination, Customer.created_at)
+    return stmt.add_columns(func.count().over().label("total_items")).offset(0).limit(pagination.limit)
+
+
+async def time_searches(connection, terms: list, repeat: int) -> tuple[list, list]:
+    latencies, matches = [], []
+    for term in terms:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rows = (await connection.execute(search_statement(term))).all()
+            latencies.append((time.perf_counter() - started) * 1000)
+        matches.append(rows[0].total_items if rows else 0)
+    return latencies, matches
+
+
+def report(label: str, latencies: list, matches: list):
+    print(f"{label:<14} p50 {statistics.median(latencies):8.1f}ms  p95 {percentile(latencies, 95):8.1f}ms  "
+          f"max {max(latencies):8.1f}ms  (median {statistics.median(matches):.0f} matches per term)")
+
+
+async def run(args):
+    terms = ["".join(random.choices("0123456789abcdef", k=3)) for _ in range(args.terms)]
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            started = time.perf_counter()
+            await connection.execute(text(SEED_CUSTOMERS), {"rows": args.rows})
+            await connection.execute(text("ANALYZE customers"))
+            print(f"seeded {args.rows} customers in {time.perf_counter() - started:.0f}s")
+
+            report("trigram index", *await time_searches(connection, terms, args.repeat))
+            await connection.execute(text("DROP INDEX ix_customers_name_trgm"))
+            report("no index", *await time_searches(connection, terms, args.repeat))
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time customer name:value search with and without its trigram index.")
+    parser.add_argument("--rows", type=int, default=1000000, help="customers to seed")
+    parser.add_argument("--terms", type=int, default=20, help="random search terms")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per term")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Microbenchmark of list page serialization per response class.
+
+For every response model with a `to_dict` fast path, builds a page of in-memory entities and
+times both ways of turning it into the response body:
+
+- models: `from_entity` per row, then FastAPI's `jsonable_encoder` and `JSONResponse`,
+  which is what list endpoints did before the fast path
+- rows: `to_dict` per row and `RowsJSONResponse` (orjson), what `fetch_paginated_data` does now
+
+No database is needed. `from_entity` is built on `to_dict` now, so comparing the two bodies here
+proves nothing; tests/test_encoding.py checks the rows path against pages captured from the
+serializers as they were before the fast path.
+
+Usage:
+    python -m app.cli.serialization_benchmark [--rows 100] [--iterations 200]
+"""
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+# Every model is imported so string relationships resolve when mappers configure
+from app.models.brand import Brand
+from app.models.cart import Cart  # noqa: F401
+from app.models.category import Category
+from app.models.color import Color
+from app.models.customer import Customer
+from app.models.location import Location
+from app.models.media_storage import MediaStorage  # noqa: F401
+from app.models.notification import Notification
+from app.models.order import Order
+from app.models.order_detail import OrderDetail  # noqa: F401
+from app.models.order_history import OrderHistory  # noqa: F401
+from app.models.payment_method import PaymentMethod
+from app.models.product import Product
+from app.models.product_listing import ProductListing
+from app.models.product_price import ProductPrice
+from app.models.product_rate import ProductRate  # noqa: F401
+from app.models.resource_version import ResourceVersion  # noqa: F401
+from app.models.staff import Staff  # noqa: F401
+from app.models.user import User
+from app.models.user_token import UserToken  # noqa: F401
+from app.responses.brand import BrandDataResponse
+from app.responses.category import CategoryDataResponse
+from app.responses.color import ColorDataResponse
+from app.responses.customer import CustomerDataResponse
+from app.responses.notification import NotificationDataResponse
+from app.responses.order import OrderDataResponse
+from app.responses.paginated_response import PaginatedResponse
+from app.responses.product import ProductDataResponse, ProductListingDataResponse
+from app.responses.product_price_response import ProductPriceDataResponse
+from app.utils.encoding import RowsJSONResponse
+
+STARTED_AT = datetime(2024, 5, 1, 12, 30, 5, 123456)
+
+
+def _id(*parts) -> uuid.UUID:
+    """Stable id per entity, so a page renders the same bytes on every run (see tests/test_encoding.py)."""
+    return uuid.uuid5(uuid.NAMESPACE_URL, "/".join(str(part) for part in parts))
+
+
+def _colors() -> list:
+    return [
+        Color(id=_id("color", index), code=f"#0000{index:02d}", name=f"Color {index}", highlight=f"Highlight {index}")
+        for index in range(3)
+    ]
+
+
+def _product(index: int, colors: list, category: Category, brand: Brand) -> Product:
+    return Product(
+        id=_id("product", index), name=f"Product {index}", description=f"Description of product {index}", attachment=None,
+        category_id=category.id, category=category, brand_id=brand.id, brand=brand, is_active=True,
+        product_prices=[
+            ProductPrice(id=_id("product-price", index, size), color_id=color.id, color=color, size=f"Size {size}", price=10.5 + index + size)
+            for size, color in enumerate(colors)
+        ],
+    )
+
+
+def products(rows: int) -> list:
+    colors = _colors()
+    category = Category(id=_id("category"), name="Sofas", description="Sofas", attachment=None)
+    brand = Brand(id=_id("brand"), name="Brand", description="Brand", attachment=None)
+    return [_product(index, colors, category, brand) for index in range(rows)]
+
+
+def product_listings(rows: int) -> list:
+    entities = products(rows)
+    for index, product in enumerate(entities):
+        prices = [price.price for price in product.product_prices]
+        product.listing = ProductListing(
+            product_id=product.id, min_price=min(prices), max_price=max(prices),
+            color_ids=[price.color_id for price in product.product_prices], variant_count=len(prices),
+            avg_rate=3 + (index % 7) / 3, rate_count=index,
+        )
+    return entities
+
+
+def product_prices(rows: int) -> list:
+    colors = _colors()
+    return [
+        ProductPrice(id=_id("product-price", index), color_id=colors[index % 3].id, color=colors[index % 3], size="M", price=9.99 + index)
+        for index in range(rows)
+    ]
+
+
+def orders(rows: int) -> list:
+    location = Location(id=_id("location"), name="Phnom Penh")
+    payment_method = PaymentMethod(id=_id("payment-method"), name="Cash")
+    return [
+        Order(
+            id=_id("order", index), order_date=STARTED_AT + timedelta(minutes=index), order_number=f"ORD-{index}",
+            customer_id=_id("customer", index), customer=Customer(name=f"Customer {index}"),
+            location_id=location.id, location=location, location_price=1.5, amount=120.25 + index,
+            payment_method_id=payment_method.id, payment_method=payment_method, payment_attachment=None,
+            order_status="pending", note=None, staff=None,
+        )
+        for index in range(rows)
+    ]
+
+
+def customers(rows: int) -> list:
+    return [
+        Customer(
+            id=_id("customer", index), name=f"Customer {index}", gender=index % 2, phone_number=f"0{10000000 + index}",
+            address=f"Street {index}", created_at=STARTED_AT + timedelta(seconds=index),
+            user=User(username=f"customer{index}", email=f"customer{index}@example.com", is_active=True),
+        )
+        for index in range(rows)
+    ]
+
+
+def notifications(rows: int) -> list:
+    return [
+        Notification(
+            id=_id("notification", index), date=STARTED_AT + timedelta(minutes=index), from_user_id=_id("user", index),
+            description=f"Order {index} accepted", type="order", target="admin",
+        )
+        for index in range(rows)
+    ]
+
+
+def lookups(entity):
+    def build(rows: int) -> list:
+        if entity is Color:
+            return [Color(id=_id("color", index), code=f"#{index:06d}", name=f"Color {index}", highlight="x") for index in range(rows)]
+        return [entity(id=_id(entity.__tablename__, index), name=f"Name {index}", description=f"Description {index}", attachment=None)
+                for index in range(rows)]
+    return build
+
+
+BENCHMARKS = (
+    (ProductDataResponse, products),
+    (ProductListingDataResponse, product_listings),
+    (ProductPriceDataResponse, product_prices),
+    (OrderDataResponse, orders),
+    (CustomerDataResponse, customers),
+    (NotificationDataResponse, notifications),
+    (CategoryDataResponse, lookups(Category)),
+    (BrandDataResponse, lookups(Brand)),
+    (ColorDataResponse, lookups(Color)),
+)
+
+
+def _envelope(data: list) -> PaginatedResponse:
+    return PaginatedResponse(data=data, page=1, limit=len(data), total_items=len(data), total_pages=1,
+                             message="Data fetched successfully")
+
+
+def render_models(model, entities) -> bytes:
+    return JSONResponse(content=jsonable_encoder(_envelope([model.from_entity(entity) for entity in entities]))).body
+
+
+def render_rows(model, entities) -> bytes:
+    return RowsJSONResponse(content=dict(_envelope([model.to_dict(entity) for entity in entities]))).body
+
+
+def best_of(render, model, entities, iterations: int) -> float:
+    """Fastest of `iterations` runs in microseconds, the least disturbed by the rest of the machine."""
+    best = float("inf")
+    for _ in range(iterations):
+        started = time.perf_counter()
+        render(model, entities)
+        best = min(best, time.perf_counter() - started)
+    return best * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time model-based and dict-based list serialization per response class.")
+    parser.add_argument("--rows", type=int, default=100, help="rows per page")
+    parser.add_argument("--iterations", type=int, default=200, help="timed renders per path")
+    args = parser.parse_args()
+
+    print(f"{'response class':<28} {'models':>10} {'rows':>10} {'speedup':>8}")
+    for model, build in BENCHMARKS:
+        entities = build(args.rows)
+        models_us = best_of(render_models, model, entities, args.iterations)
+        rows_us = best_of(render_rows, model, entities, args.iterations)
+        print(f"{model.__name__:<28} {models_us:8.0f}us {rows_us:8.0f}us {models_us / rows_us:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+import asyncio
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Iterable, Optional, Union
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config.database import async_session_maker, is_replica_session
+from app.config.settings import get_settings
+from app.models.brand import Brand
+from app.models.category import Category
+from app.models.color import Color
+from app.models.product import Product
+from app.models.product_price import ProductPrice
+from app.models.product_rate import ProductRate
+
+settings = get_settings()
+
+# Serialized product detail by product id
+PRODUCT_NAMESPACE = "product"
+# Encoded product list and listing card pages by pagination parameters
+PRODUCT_PAGE_NAMESPACE = "product_page"
+# Facet counts by search and filter signature
+PRODUCT_FACET_NAMESPACE = "product_facet"
+NAMESPACES = (PRODUCT_NAMESPACE, PRODUCT_PAGE_NAMESPACE, PRODUCT_FACET_NAMESPACE)
+
+# Rows denormalized into every product response, a change to any of them drops the whole catalog
+SHARED_ENTITIES = (Brand, Category, Color)
+
+
+class CatalogCache:
+    """
+    Store for serialized catalog responses, keyed by namespace and key.
+
+    The default is in-process; subclass it and install it with `set_catalog_cache`
+    to share entries (and invalidations) across workers, e.g. through Redis.
+    """
+
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    async def set(self, namespace: str, key: str, value: Any):
+        raise NotImplementedError
+
+    async def invalidate(self, namespace: str, key: str):
+        raise NotImplementedError
+
+    async def clear(self, namespace: str):
+        raise NotImplementedError
+
+
+class InMemoryCatalogCache(CatalogCache):
+    """Per-worker LRU per namespace whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: dict[str, OrderedDict[str, tuple[float, Any]]] = {}
+
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        entries = self._entries.get(namespace)
+        entry = entries.get(key) if entries else None
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return value
+
+    async def set(self, namespace: str, key: str, value: Any):
+        entries = self._entries.setdefault(namespace, OrderedDict())
+        entries[key] = (time.monotonic() + self.ttl, value)
+        entries.move_to_end(key)
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+    async def invalidate(self, namespace: str, key: str):
+        self._entries.get(namespace, {}).pop(key, None)
+
+    async def clear(self, namespace: str):
+        self._entries.pop(namespace, None)
+
+
+_catalog_cache: CatalogCache = InMemoryCatalogCache(settings.CATALOG_CACHE_SIZE, settings.CATALOG_CACHE_TTL_SECONDS)
+_hits = Counter()
+_misses = Counter()
+_pending_invalidations = set()
+# time.monotonic() of the last commit that dropped entries in this worker
+_last_invalidated = float("-inf")
+
+
+def get_catalog_cache() -> CatalogCache:
+    return _catalog_cache
+
+
+def set_catalog_cache(cache: CatalogCache):
+    global _catalog_cache
+    _catalog_cache = cache
+
+
+async def cached(namespace: str, key: str, session: AsyncSession,
+                 build: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+    """
+    Return the cached value or build it with `session`, store and return it; `None` results are not cached.
+
+    For `READ_YOUR_WRITES_SECONDS` after an invalidation a replica may still serve the old rows,
+    so a miss on a replica session is built on the primary instead of caching stale data until the TTL.
+    """
+    if not settings.CATALOG_CACHE_ENABLED:
+        return await build(session)
+
+    value = await _catalog_cache.get(namespace, key)
+    if value is not None:
+        _hits[namespace] += 1
+        return value
+
+    _misses[namespace] += 1
+    if is_replica_session(session) and _replica_may_lag():
+        async with async_session_maker() as primary:
+            value = await build(primary)
+    else:
+        value = await build(session)
+    if value is not None:
+        await _catalog_cache.set(namespace, key, value)
+    return value
+
+
+def _replica_may_lag() -> bool:
+    return time.monotonic() < _last_invalidated + settings.READ_YOUR_WRITES_SECONDS
+
+
+def mark_catalog_changed(session: Union[Session, AsyncSession], product_ids: Iterable = (), shared: bool = False):
+    """
+    Record catalog rows written in the session's transaction, their entries are dropped on commit.
+
+    ORM changes are collected at flush. Core statements (bulk price updates, listing refreshes)
+    never reach the flush hook, so the services issuing them call this themselves.
+    """
+    changes = session.info.setdefault("catalog_changes", {"product_ids": set(), "shared": False})
+    changes["product_ids"].update(str(product_id) for product_id in product_ids if product_id is not None)
+    changes["shared"] = changes["shared"] or shared
+
+
+def catalog_cache_status() -> dict:
+    """Hit and miss counters per namespace in this worker."""
+    status = {}
+    for namespace in NAMESPACES:
+        lookups = _hits[namespace] + _misses[namespace]
+        status[namespace] = {
+            "hits": _hits[namespace],
+            "misses": _misses[namespace],
+            "hit_ratio": round(_hits[namespace] / lookups, 4) if lookups else 0.0,
+        }
+    return {"enabled": settings.CATALOG_CACHE_ENABLED, "backend": type(_catalog_cache).__name__, **status}
+
+
+# Product writes, price and rate changes and brand/category/color renames made through the ORM are
+# collected at flush, Core writes through `mark_catalog_changed`; the affected entries are dropped
+# once the change is committed.
+@event.listens_for(Session, "after_flush")
+def _collect_catalog_changes(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Product):
+            mark_catalog_changed(session, [obj.id])
+        elif isinstance(obj, (ProductPrice, ProductRate)):
+            mark_catalog_changed(session, [obj.product_id])
+        elif isinstance(obj, SHARED_ENTITIES):
+            mark_catalog_changed(session, shared=True)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_catalog(session):
+    global _last_invalidated
+    changes = session.info.pop("catalog_changes", None)
+    if not changes:
+        return
+    _last_invalidated = time.monotonic()
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    if changes["shared"]:
+        coroutines = [_catalog_cache.clear(namespace) for namespace in NAMESPACES]
+    else:
+        coroutines = [_catalog_cache.clear(PRODUCT_PAGE_NAMESPACE), _catalog_cache.clear(PRODUCT_FACET_NAMESPACE)]
+        coroutines += [_catalog_cache.invalidate(PRODUCT_NAMESPACE, product_id) for product_id in changes["product_ids"]]
+    for coroutine in coroutines:
+        task = loop.create_task(coroutine)
+        _pending_invalidations.add(task)
+        task.add_done_callback(_pending_invalidations.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_catalog_changes(session):
+    session.info.pop("catalog_changes", None)
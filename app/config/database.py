@@ -1,18 +1,38 @@
 from typing import AsyncGenerator
+
+from fastapi import Request
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from app.config.instrumentation import install_sql_instrumentation
+from app.config.pool import engine_options
+from app.config.replica import reads_from_primary
+from app.config.session import ReleasableSession
 from app.config.settings import get_settings
 
 settings = get_settings()
 
 # Create SQLAlchemy engine with asyncpg dialect
-engine = create_async_engine(settings.DATABASE_URI, echo=True)
+engine = create_async_engine(settings.DATABASE_URI, echo=settings.SQL_ECHO, **engine_options(settings))
+install_sql_instrumentation(engine.sync_engine)
+
+# Read-only engine for list and catalog reads, the primary itself when no replica is configured
+if settings.DATABASE_READ_URI == settings.DATABASE_URI:
+    read_engine = engine
+else:
+    read_engine = create_async_engine(settings.DATABASE_READ_URI, echo=settings.SQL_ECHO, **engine_options(settings))
+    install_sql_instrumentation(read_engine.sync_engine)
 
 # Set up the sessionmaker for async sessions
 async_session_maker = sessionmaker(
     bind=engine,
-    class_=AsyncSession,
+    class_=ReleasableSession,
+    expire_on_commit=False
+)
+
+read_session_maker = sessionmaker(
+    bind=read_engine,
+    class_=ReleasableSession,
     expire_on_commit=False
 )
 
@@ -21,3 +41,15 @@ Base = declarative_base()
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         yield session
+
+
+def is_replica_session(session: AsyncSession) -> bool:
+    """True for sessions bound to a separate read replica."""
+    return read_engine is not engine and session.bind is read_engine
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Session on the read replica, or on the primary right after the client wrote something."""
+    maker = async_session_maker if reads_from_primary(request) else read_session_maker
+    async with maker() as session:
+        yield session
@@ -0,0 +1,181 @@
+import logging
+import random
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config.custom_exceptions import CustomHTTPException
+from app.config.settings import get_settings
+
+logger = logging.getLogger("app.sql")
+settings = get_settings()
+
+
+class QueryStats:
+    """SQL statistics collected for a single request."""
+
+    __slots__ = ("count", "total_ms", "slowest_ms", "slowest_statement", "shapes", "budget")
+
+    def __init__(self):
+        self.budget: Optional[int] = None
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.shapes = Counter()
+
+    def record(self, statement: str, elapsed_ms: float):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+        if settings.SQL_N_PLUS_ONE_THRESHOLD:
+            self.shapes[statement_shape(statement)] += 1
+
+    def repeated_statements(self) -> list[tuple[str, int]]:
+        """Statement shapes run at least `SQL_N_PLUS_ONE_THRESHOLD` times, the usual sign of an N+1 loop."""
+        threshold = settings.SQL_N_PLUS_ONE_THRESHOLD
+        return [(shape, count) for shape, count in self.shapes.most_common() if threshold and count >= threshold]
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.total_ms:.2f};desc="{self.count} queries", '
+            f'db-slowest;dur={self.slowest_ms:.2f}'
+        )
+
+
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\$\d+(?:\s*,\s*\$\d+)*\s*\)")
+_PLACEHOLDER = re.compile(r"\$\d+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so the same query issued with different parameters compares equal."""
+    shape = _PLACEHOLDER_LIST.sub("(?)", statement)
+    return _WHITESPACE.sub(" ", _PLACEHOLDER.sub("?", shape)).strip()
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Stats of the request being served, None outside a request."""
+    return _query_stats.get()
+
+
+def install_sql_instrumentation(engine: Engine):
+    """Time every statement run on `engine` and feed the per-request stats and slow-query log."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _query_stats.get()
+        if settings.SQL_QUERY_BUDGET_STRICT and stats is not None and stats.budget is not None \
+                and stats.count >= stats.budget:
+            # Fail before the statement runs, so the request's transaction never reaches its commit
+            _log_budget_exceeded(stats, stats.count + 1)
+            raise CustomHTTPException(
+                status_code=500,
+                message=f"Query budget exceeded: more than {stats.budget} queries"
+            )
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed_ms)
+
+        if elapsed_ms >= settings.SQL_SLOW_QUERY_MS and random.random() < settings.SQL_SLOW_QUERY_SAMPLE_RATE:
+            logger.warning(
+                "slow_query duration_ms=%.2f statement=%s", elapsed_ms, " ".join(statement.split()),
+                extra={"duration_ms": round(elapsed_ms, 2), "statement": statement}
+            )
+
+
+def _log_budget_exceeded(stats: QueryStats, queries: int):
+    logger.warning(
+        "query_budget_exceeded queries=%d budget=%d repeated=%s",
+        queries, stats.budget, stats.repeated_statements(),
+        extra={"queries": queries, "budget": stats.budget}
+    )
+
+
+def query_budget(max_queries: int):
+    """
+    Route dependency capping the number of SQL statements a request may issue.
+
+    Usage: `@router.get("", dependencies=[query_budget(5)])`. Going over the budget is logged
+    with the repeated statement shapes once the request is done. With `SQL_QUERY_BUDGET_STRICT=true`
+    (local and test runs) the statement that would go over raises a 500 before it runs instead, so a
+    query regression cannot go unnoticed and a write never commits ahead of the failure.
+    """
+
+    async def enforce_query_budget():
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.budget = max_queries
+        yield
+        if stats is not None and stats.count > max_queries:
+            _log_budget_exceeded(stats, stats.count)
+
+    return Depends(enforce_query_budget)
+
+
+class SQLInstrumentationMiddleware:
+    """
+    Collect SQL stats per request, expose them as a `Server-Timing` header and log a summary line.
+
+    Written as a plain ASGI middleware so the stats context wraps the whole request,
+    including dependencies, without the extra task `BaseHTTPMiddleware` spawns.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _query_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start" and settings.SQL_SERVER_TIMING:
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing().encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _query_stats.reset(token)
+            for shape, count in stats.repeated_statements():
+                logger.warning(
+                    "n_plus_one path=%s count=%d statement=%s", scope["path"], count, shape,
+                    extra={"path": scope["path"], "count": count, "statement": shape}
+                )
+            if stats.count:
+                logger.info(
+                    "request_sql path=%s queries=%d db_ms=%.2f slowest_ms=%.2f duration_ms=%.2f",
+                    scope["path"], stats.count, stats.total_ms, stats.slowest_ms,
+                    (time.perf_counter() - started) * 1000,
+                    extra={
+                        "path": scope["path"],
+                        "queries": stats.count,
+                        "db_ms": round(stats.total_ms, 2),
+                        "slowest_ms": round(stats.slowest_ms, 2),
+                        "slowest_statement": stats.slowest_statement,
+                    }
+                )
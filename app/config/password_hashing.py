@@ -0,0 +1,72 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.config.custom_exceptions import CustomHTTPException
+from app.config.settings import get_settings
+
+settings = get_settings()
+
+
+class PasswordHashPool:
+    """
+    Bounded thread pool for bcrypt work.
+
+    bcrypt hashing and verification take a few hundred milliseconds of CPU and release the GIL,
+    so running them on worker threads keeps the event loop serving other requests. At most
+    `workers` operations run at once; callers beyond that wait in line, and once `max_queue`
+    callers are waiting new ones are turned away with a 503 instead of piling up.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = asyncio.Semaphore(workers)
+        self.running = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+
+    async def run(self, func, *args):
+        if self.queued >= self.max_queue:
+            self.rejected += 1
+            raise CustomHTTPException(status_code=503, message="Too many password operations in progress, try again shortly")
+
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        started = time.perf_counter()
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+        wait_ms = (time.perf_counter() - started) * 1000
+        self.wait_total_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+
+        self.running += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self._slots.release()
+
+    def status(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "running": self.running,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_avg_ms": round(self.wait_total_ms / self.completed, 2) if self.completed else 0.0,
+            "wait_max_ms": round(self.wait_max_ms, 2),
+        }
+
+
+password_hash_pool = PasswordHashPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_QUEUE)
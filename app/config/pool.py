@@ -0,0 +1,96 @@
+import bisect
+import os
+import time
+import uuid
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.config.settings import Settings
+
+# Upper bounds (ms) of the checkout wait histogram buckets, the last bucket is open ended
+CHECKOUT_WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """Checkout wait histogram and timeout counter of one connection pool in this worker."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.wait_buckets = [0] * (len(CHECKOUT_WAIT_BUCKETS_MS) + 1)
+
+    def record_checkout(self, wait_ms: float):
+        self.checkouts += 1
+        self.wait_total_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+        self.wait_buckets[bisect.bisect_left(CHECKOUT_WAIT_BUCKETS_MS, wait_ms)] += 1
+
+    def histogram(self) -> dict:
+        labels = [f"le_{bound}ms" for bound in CHECKOUT_WAIT_BUCKETS_MS] + ["inf"]
+        return dict(zip(labels, self.wait_buckets))
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """`AsyncAdaptedQueuePool` that records how long each checkout waited and how many timed out."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        self.metrics.record_checkout((time.perf_counter() - started) * 1000)
+        return connection
+
+
+def engine_options(settings: Settings) -> dict:
+    """
+    Keyword arguments for `create_async_engine` built from the `DB_*` settings.
+
+    With `DB_PGBOUNCER=true` asyncpg's prepared statement caches are disabled and statements
+    get unique names, since PgBouncer in transaction mode may route each transaction
+    to a different server connection.
+    """
+    connect_args = {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    if settings.DB_PGBOUNCER:
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+def pool_status(pool: InstrumentedQueuePool) -> dict:
+    """Live pool state plus the checkout metrics; every uvicorn worker reports its own pool."""
+    metrics = pool.metrics
+    return {
+        "pid": os.getpid(),
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "checkouts": metrics.checkouts,
+        "timeouts": metrics.timeouts,
+        "wait_avg_ms": round(metrics.wait_total_ms / metrics.checkouts, 2) if metrics.checkouts else 0.0,
+        "wait_max_ms": round(metrics.wait_max_ms, 2),
+        "wait_histogram": metrics.histogram(),
+    }
@@ -0,0 +1,125 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config.revocation import get_token_denylist, token_timestamp
+from app.config.settings import get_settings
+from app.models.user import User
+
+settings = get_settings()
+
+# User columns the principal is built from, a change to any of them invalidates the cache entry
+PRINCIPAL_COLUMNS = ("role", "is_active", "password")
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """What request handling needs to know about the authenticated user."""
+    id: UUID
+    role: int
+    # None when the principal was built from token claims alone
+    is_active: Optional[bool]
+
+
+class PrincipalCache:
+    """
+    Store for user principals keyed by user id.
+
+    The default is in-process; subclass it and install it with `set_principal_cache`
+    to share principals (and invalidations) across workers, e.g. through Redis.
+    """
+
+    async def get(self, user_id: str) -> Optional[UserPrincipal]:
+        raise NotImplementedError
+
+    async def set(self, principal: UserPrincipal):
+        raise NotImplementedError
+
+    async def invalidate(self, user_id: str):
+        raise NotImplementedError
+
+
+class InMemoryPrincipalCache(PrincipalCache):
+    """Per-worker LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, UserPrincipal]] = OrderedDict()
+
+    async def get(self, user_id: str) -> Optional[UserPrincipal]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at < time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return principal
+
+    async def set(self, principal: UserPrincipal):
+        user_id = str(principal.id)
+        self._entries[user_id] = (time.monotonic() + self.ttl, principal)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, user_id: str):
+        self._entries.pop(user_id, None)
+
+
+_principal_cache: PrincipalCache = InMemoryPrincipalCache(settings.USER_CACHE_SIZE, settings.USER_CACHE_TTL_SECONDS)
+_pending_invalidations = set()
+
+
+def get_principal_cache() -> PrincipalCache:
+    return _principal_cache
+
+
+def set_principal_cache(cache: PrincipalCache):
+    global _principal_cache
+    _principal_cache = cache
+
+
+# Password resets, role changes and deactivations go through the ORM; collect the touched users
+# at flush, drop their cache entries and revoke their outstanding tokens once the change is committed.
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session, flush_context):
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, User) and (
+                obj in session.deleted
+                or any(inspect(obj).attrs[column].history.has_changes() for column in PRINCIPAL_COLUMNS)
+        ):
+            session.info.setdefault("changed_user_ids", set()).add(str(obj.id))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session):
+    user_ids = session.info.pop("changed_user_ids", None)
+    if not user_ids:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    revoked_at = token_timestamp()
+    for user_id in user_ids:
+        for coroutine in (
+                _principal_cache.invalidate(user_id),
+                get_token_denylist().revoke(user_id, revoked_at),
+        ):
+            task = loop.create_task(coroutine)
+            _pending_invalidations.add(task)
+            task.add_done_callback(_pending_invalidations.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session):
+    session.info.pop("changed_user_ids", None)
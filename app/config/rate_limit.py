@@ -0,0 +1,149 @@
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Depends, Request
+
+from app.config.custom_exceptions import CustomHTTPException
+from app.config.settings import get_settings
+
+settings = get_settings()
+logger = logging.getLogger("app.rate_limit")
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket holding up to `capacity` requests, refilled evenly over `per_seconds`."""
+    capacity: int
+    per_seconds: float
+
+    @property
+    def refill_rate(self) -> float:
+        return self.capacity / self.per_seconds
+
+
+class RateLimitStore:
+    """
+    Token bucket storage keyed by an arbitrary string.
+
+    The default is in-process; subclass it and install it with `set_rate_limit_store`
+    so all workers share the same buckets, e.g. through Redis.
+    """
+
+    async def hit(self, key: str, limit: RateLimit) -> float:
+        """Take one token from the bucket, return 0 when allowed or the seconds until a token is available."""
+        raise NotImplementedError
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """Per-worker buckets; the least recently used ones are dropped past `maxsize` keys."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def hit(self, key: str, limit: RateLimit) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (limit.capacity, now))
+        tokens = min(limit.capacity, tokens + (now - updated_at) * limit.refill_rate)
+
+        if tokens >= 1:
+            tokens -= 1
+            retry_after = 0.0
+        else:
+            retry_after = (1 - tokens) / limit.refill_rate
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.maxsize:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+_rate_limit_store: RateLimitStore = InMemoryRateLimitStore(settings.RATE_LIMIT_MAX_KEYS)
+
+
+def get_rate_limit_store() -> RateLimitStore:
+    return _rate_limit_store
+
+
+def set_rate_limit_store(store: RateLimitStore):
+    global _rate_limit_store
+    _rate_limit_store = store
+
+
+def client_ip(request: Request) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def body_accounts(*fields: str) -> Callable[[Request], Awaitable[list]]:
+    """Account identifiers taken from JSON body fields, e.g. the username and email of a login."""
+
+    async def accounts(request: Request) -> list:
+        try:
+            body = await request.json()
+        except ValueError:
+            return []
+        if not isinstance(body, dict):
+            return []
+        return [str(body[field]).lower() for field in fields if body.get(field)]
+
+    return accounts
+
+
+def query_accounts(*params: str) -> Callable[[Request], Awaitable[list]]:
+    """Account identifiers taken from query parameters, e.g. the email of a password reset."""
+
+    async def accounts(request: Request) -> list:
+        return [request.query_params[param].lower() for param in params if request.query_params.get(param)]
+
+    return accounts
+
+
+def rate_limit(scope: str, per_ip: RateLimit, per_account: Optional[RateLimit] = None,
+               accounts: Optional[Callable[[Request], Awaitable[list]]] = None, account_per_ip: bool = True):
+    """
+    Route dependency limiting requests per client IP and, optionally, per targeted account.
+
+    Usage: `@router.post("/login", dependencies=[rate_limit("login", RateLimit(20, 60), ...)])`.
+    Route level dependencies resolve before the endpoint's own, so a limited request is answered
+    with a 429 and a `Retry-After` header before any database or bcrypt work happens.
+
+    Account buckets are keyed by account and client IP by default. A bucket per account alone
+    would let anyone lock a user out of login by spending that account's tokens from their own
+    address; the cost is that guessing one account's password from many addresses is only capped
+    by each address's buckets. Pass `account_per_ip=False` for identifiers only the legitimate
+    client knows, such as a reset token, where a lockout can only be caused by its holder.
+    """
+
+    async def enforce_rate_limit(request: Request):
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+
+        store = get_rate_limit_store()
+        ip = client_ip(request)
+        buckets = [(f"{scope}:ip:{ip}", per_ip)]
+        if per_account is not None and accounts is not None:
+            account_suffix = f":ip:{ip}" if account_per_ip else ""
+            buckets += [
+                (f"{scope}:account:{account}{account_suffix}", per_account) for account in await accounts(request)
+            ]
+
+        for key, limit in buckets:
+            retry_after = await store.hit(key, limit)
+            if retry_after:
+                logger.warning("rate_limited key=%s retry_after=%.1f", key, retry_after)
+                raise CustomHTTPException(
+                    status_code=429,
+                    message="Too many requests, please try again later",
+                    headers={"Retry-After": str(math.ceil(retry_after))}
+                )
+
+    return Depends(enforce_rate_limit)
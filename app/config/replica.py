@@ -0,0 +1,49 @@
+import time
+
+from fastapi import Request
+
+from app.config.settings import get_settings
+
+settings = get_settings()
+
+# Cookie holding the epoch second until which the client reads from the primary
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+_WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def reads_from_primary(request: Request) -> bool:
+    """True while the client is inside the read-your-writes window opened by its last write."""
+    try:
+        return float(request.cookies.get(READ_PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pin a client to the primary for `READ_YOUR_WRITES_SECONDS` after a successful write.
+
+    Successful write responses set a short-lived cookie; `get_read_session` sees it and
+    reads from the primary so the client never gets a replica that has not caught up yet.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in _WRITE_METHODS or not settings.READ_YOUR_WRITES_SECONDS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = int(time.time()) + settings.READ_YOUR_WRITES_SECONDS
+                cookie = (
+                    f"{READ_PRIMARY_COOKIE}={until}; Max-Age={settings.READ_YOUR_WRITES_SECONDS}; "
+                    f"Path=/; HttpOnly; SameSite=Lax"
+                )
+                message = {**message, "headers": [*message.get("headers", []), (b"set-cookie", cookie.encode())]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -0,0 +1,62 @@
+import time
+from typing import Optional
+
+from app.config.settings import get_settings
+
+settings = get_settings()
+
+
+def token_timestamp() -> int:
+    """Current epoch seconds, the unit of the `iat` claim and of revocation times."""
+    return int(time.time())
+
+
+class TokenDenylist:
+    """
+    Compact revocation list: for each user, the moment before which their access tokens are revoked.
+
+    Entries only need to outlive the longest-lived token, so the list stays small.
+    The default is in-process; install a shared implementation with `set_token_denylist`
+    so a revocation made on one worker is seen by all of them.
+    """
+
+    async def revoke(self, user_id: str, revoked_at: int):
+        raise NotImplementedError
+
+    async def is_revoked(self, user_id: str, issued_at: Optional[int]) -> bool:
+        raise NotImplementedError
+
+
+class InMemoryTokenDenylist(TokenDenylist):
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, int]] = {}
+
+    async def revoke(self, user_id: str, revoked_at: int):
+        self._entries[user_id] = (time.monotonic() + self.ttl, revoked_at)
+
+    async def is_revoked(self, user_id: str, issued_at: Optional[int]) -> bool:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return False
+        expires_at, revoked_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[user_id]
+            return False
+        # Tokens without `iat` predate the denylist and can't prove they were issued afterwards
+        return issued_at is None or issued_at < revoked_at
+
+
+# Refresh tokens are signed like access tokens and outlive them, so entries last as long as they do
+_token_denylist: TokenDenylist = InMemoryTokenDenylist(
+    max(settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60, settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400)
+)
+
+
+def get_token_denylist() -> TokenDenylist:
+    return _token_denylist
+
+
+def set_token_denylist(denylist: TokenDenylist):
+    global _token_denylist
+    _token_denylist = denylist
@@ -1,5 +1,6 @@
 import logging
 from datetime import datetime, timedelta
+from uuid import UUID
 
 import jwt
 from fastapi import Depends, status
@@ -11,6 +12,9 @@ from sqlalchemy.future import select
 
 from app.config.custom_exceptions import CustomHTTPException
 from app.config.database import get_session
+from app.config.password_hashing import password_hash_pool
+from app.config.principal_cache import UserPrincipal, get_principal_cache
+from app.config.revocation import get_token_denylist, token_timestamp
 from app.config.settings import get_settings
 from app.constants.roles import Roles
 from app.models.user import User
@@ -30,14 +34,14 @@ bearer_token = HTTPBearer(
 )
 
 
-def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    return pwd_ctx.hash(password)
+async def hash_password(password: str) -> str:
+    """Hash a password using bcrypt, off the event loop."""
+    return await password_hash_pool.run(pwd_ctx.hash, password)
 
 
-def verify_password(plain_pass: str, hashed_pass: str) -> bool:
-    """Verify a plain password against a hashed password."""
-    return pwd_ctx.verify(plain_pass, hashed_pass)
+async def verify_password(plain_pass: str, hashed_pass: str) -> bool:
+    """Verify a plain password against a hashed password, off the event loop."""
+    return await password_hash_pool.run(pwd_ctx.verify, plain_pass, hashed_pass)
 
 
 def is_password_strong_enough(password: str) -> bool:
@@ -79,6 +83,7 @@ def generate_token(user: User, expiry: timedelta, options: dict = None):
     payload = {
         "sub": str(user_id),
         "role": role,
+        "iat": token_timestamp(),
         "exp": expire,
         "dict": dict() if options is None else options
     }
@@ -101,15 +106,33 @@ async def get_token_user(token: str, db: AsyncSession):
             # Extract the user ID from the token payload
             user_id = payload.get('sub')  # 'sub' is the user ID, assumed to be a UUID
 
-            # Query the database to verify the user exists
-            stmt = select(User).where(User.id == user_id)
-            result = await db.execute(stmt)
-            user = result.scalar()
+            # Tokens issued before a password, role or status change are no longer accepted
+            if await get_token_denylist().is_revoked(user_id, payload.get('iat')):
+                raise CustomHTTPException(status_code=401, message="Token has been revoked")
 
-            if not user:
-                raise CustomHTTPException(status_code=404, message="User not found")
+            # The signed role claim is enough to authorize, handlers needing the row use get_current_user_entity
+            role = Roles.get_value(payload.get('role'))
+            if settings.AUTH_CLAIMS_ONLY and role is not None:
+                return UserPrincipal(id=UUID(user_id), role=role, is_active=None)
 
-            return user  # Return the user if found
+            principal_cache = get_principal_cache()
+            principal = await principal_cache.get(user_id)
+            if not principal:
+                # Query the database to verify the user exists
+                stmt = select(User.id, User.role, User.is_active).where(User.id == user_id)
+                result = await db.execute(stmt)
+                user = result.first()
+
+                if not user:
+                    raise CustomHTTPException(status_code=404, message="User not found")
+
+                principal = UserPrincipal(id=user.id, role=user.role, is_active=user.is_active)
+                await principal_cache.set(principal)
+
+            # Deactivated users are rejected whether the principal came from the cache or the row
+            if principal.is_active is False:
+                raise CustomHTTPException(status_code=401, message="User is inactive")
+            return principal  # Return the user if found
 
         except (ValueError, TypeError) as e:
             logging.error(f"Token decoding error: {str(e)}")
@@ -141,7 +164,16 @@ async def get_current_user(token: str = Depends(token_scheme), db: AsyncSession
     raise CustomHTTPException(status_code=401, message="Not authorized")
 
 
-async def get_backend_user(current_user: User = Depends(get_current_user)):
+async def get_current_user_entity(current_user: UserPrincipal = Depends(get_current_user),
+                                  db: AsyncSession = Depends(get_session)) -> User:
+    """The full users row of the authenticated user, for the few routes that need more than the principal."""
+    user = await db.get(User, current_user.id)
+    if not user:
+        raise CustomHTTPException(status_code=404, message="User not found")
+    return user
+
+
+async def get_backend_user(current_user: UserPrincipal = Depends(get_current_user)):
     if current_user.role not in [Roles.ADMIN, Roles.USER, Roles.SUPER_ADMIN]:
         raise CustomHTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -150,7 +182,7 @@ async def get_backend_user(current_user: User = Depends(get_current_user)):
     return current_user
 
 
-async def get_frontend_user(current_user: User = Depends(get_current_user)):
+async def get_frontend_user(current_user: UserPrincipal = Depends(get_current_user)):
     if current_user.role not in [Roles.CUSTOMER]:
         raise CustomHTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,87 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransactionOrigin
+
+from app.config.settings import get_settings
+
+settings = get_settings()
+
+# Session.info flag set once the current transaction has written or locked anything
+_WROTE = "transaction_wrote"
+
+
+class _TrackingSession(Session):
+    """Sync session behind `ReleasableSession`, tracks whether the current transaction wrote."""
+
+
+@event.listens_for(_TrackingSession, "after_transaction_create")
+def _reset_write_flag(session, transaction):
+    if transaction.parent is None:
+        session.info.pop(_WROTE, None)
+
+
+@event.listens_for(_TrackingSession, "after_flush")
+def _mark_flush_as_write(session, flush_context):
+    session.info[_WROTE] = True
+
+
+class ReleasableSession(AsyncSession):
+    """
+    `AsyncSession` that can hand its pooled connection back between the read phase and slow non-DB work.
+
+    Nothing happens on its own: like any `AsyncSession` it checks out a connection on its first
+    statement and keeps it until the request ends. Services call `release_connection` at the
+    points where they are done reading and about to spend time elsewhere. If the autobegun
+    transaction has only read, it is committed there and the connection goes back to the pool;
+    rows are buffered and `expire_on_commit` is off, so loaded objects stay usable. Writes, Core
+    DML or textual SQL, `FOR UPDATE` reads and explicit `begin()` blocks keep their transaction.
+
+    Only the paths that call `release_connection` benefit: list pages before serialization
+    (`fetch_paginated_data`), login before bcrypt and the two password resets before hashing.
+    Every other route holds its connection for the whole request, as before.
+    """
+
+    sync_session_class = _TrackingSession
+
+    async def execute(self, statement, *args, **kwargs):
+        result = await super().execute(statement, *args, **kwargs)
+        self._track(statement)
+        return result
+
+    async def scalar(self, statement, *args, **kwargs):
+        result = await super().scalar(statement, *args, **kwargs)
+        self._track(statement)
+        return result
+
+    async def get(self, *args, **kwargs):
+        result = await super().get(*args, **kwargs)
+        if kwargs.get("with_for_update"):
+            self.sync_session.info[_WROTE] = True
+        return result
+
+    def _track(self, statement):
+        # Core DML and textual SQL, or a row lock: the transaction has to run to its own commit
+        if not getattr(statement, "is_select", False) or statement._for_update_arg is not None:
+            self.sync_session.info[_WROTE] = True
+
+    async def release(self):
+        """Commit the current transaction if it was autobegun and has only read, freeing the connection."""
+        transaction = self.sync_session.get_transaction()
+        if (
+                transaction is None
+                or transaction.origin is not SessionTransactionOrigin.AUTOBEGIN
+                or self.sync_session.info.get(_WROTE)
+                or self.new or self.dirty or self.deleted
+        ):
+            return
+        await self.commit()
+
+
+async def release_connection(session: AsyncSession):
+    """
+    Give the session's connection back to the pool if it has only read so far.
+
+    A no-op for plain `AsyncSession`s and with `DB_RELEASE_AFTER_READS=false`.
+    """
+    if settings.DB_RELEASE_AFTER_READS and isinstance(session, ReleasableSession):
+        await session.release()
@@ -23,6 +23,35 @@ class Settings(BaseSettings):
     PG_DB: str = os.environ.get("POSTGRES_DATABASE")
     DATABASE_URI: str = f"postgresql+asyncpg://{PG_USER}:{PG_PASSWORD}@{PG_HOST}:{PG_PORT}/{PG_DB}"
 
+    # Read replica, defaults to the primary when POSTGRES_READ_HOST is not set
+    PG_READ_HOST: str = os.environ.get("POSTGRES_READ_HOST", PG_HOST)
+    PG_READ_PORT: str = os.environ.get("POSTGRES_READ_PORT", PG_PORT)
+    DATABASE_READ_URI: str = f"postgresql+asyncpg://{PG_USER}:{PG_PASSWORD}@{PG_READ_HOST}:{PG_READ_PORT}/{PG_DB}"
+    # Seconds a client keeps reading from the primary after one of its own writes
+    READ_YOUR_WRITES_SECONDS: int = int(os.environ.get("READ_YOUR_WRITES_SECONDS", 5))
+
+    # Connection pool, sized per uvicorn worker: workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) <= max_connections
+    DB_POOL_SIZE: int = int(os.environ.get("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW: int = int(os.environ.get("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT: float = float(os.environ.get("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE: int = int(os.environ.get("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING: bool = os.environ.get("DB_POOL_PRE_PING", "false").lower() == "true"
+    DB_STATEMENT_CACHE_SIZE: int = int(os.environ.get("DB_STATEMENT_CACHE_SIZE", 100))
+    # Connect through PgBouncer in transaction mode (disables prepared statement caching)
+    DB_PGBOUNCER: bool = os.environ.get("DB_PGBOUNCER", "false").lower() == "true"
+    # Hand read-only connections back to the pool before bcrypt, serialization and other non-DB work
+    DB_RELEASE_AFTER_READS: bool = os.environ.get("DB_RELEASE_AFTER_READS", "true").lower() == "true"
+
+    # SQL instrumentation
+    SQL_ECHO: bool = os.environ.get("SQL_ECHO", "false").lower() == "true"
+    SQL_SERVER_TIMING: bool = os.environ.get("SQL_SERVER_TIMING", "true").lower() == "true"
+    SQL_SLOW_QUERY_MS: float = float(os.environ.get("SQL_SLOW_QUERY_MS", 200))
+    SQL_SLOW_QUERY_SAMPLE_RATE: float = float(os.environ.get("SQL_SLOW_QUERY_SAMPLE_RATE", 1.0))
+    # Flag a statement shape repeated this many times in one request as N+1, 0 disables
+    SQL_N_PLUS_ONE_THRESHOLD: int = int(os.environ.get("SQL_N_PLUS_ONE_THRESHOLD", 5))
+    # Fail requests that go over their query_budget() instead of only logging them
+    SQL_QUERY_BUDGET_STRICT: bool = os.environ.get("SQL_QUERY_BUDGET_STRICT", "false").lower() == "true"
+
     # JWT Secret Key
     JWT_SECRET: str = os.environ.get("JWT_SECRET_KEY", "your_jwt_secret_key")
     JWT_ALGORITHM: str = os.environ.get("ACCESS_TOKEN_ALGORITHM", "HS256")
@@ -30,6 +59,34 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_MINUTES: int = int(os.environ.get("REFRESH_TOKEN_EXPIRE_MINUTES", 1440))
     REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.environ.get("REFRESH_TOKEN_EXPIRE_DAYS", 30))
 
+    # Product detail and list page cache, invalidated on catalog writes
+    CATALOG_CACHE_ENABLED: bool = os.environ.get("CATALOG_CACHE_ENABLED", "true").lower() == "true"
+    CATALOG_CACHE_SIZE: int = int(os.environ.get("CATALOG_CACHE_SIZE", 5000))
+    CATALOG_CACHE_TTL_SECONDS: float = float(os.environ.get("CATALOG_CACHE_TTL_SECONDS", 300))
+
+    # Comma separated lower edges of the price buckets counted by the product facets endpoint
+    CATALOG_PRICE_BUCKETS: str = os.environ.get("CATALOG_PRICE_BUCKETS", "0,25,50,100,250,500,1000")
+
+    # Token bucket limits for the login and password reset routes, as requests per minute
+    RATE_LIMIT_ENABLED: bool = os.environ.get("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_TRUST_FORWARDED: bool = os.environ.get("RATE_LIMIT_TRUST_FORWARDED", "false").lower() == "true"
+    RATE_LIMIT_MAX_KEYS: int = int(os.environ.get("RATE_LIMIT_MAX_KEYS", 100000))
+    RATE_LIMIT_LOGIN_PER_IP: int = int(os.environ.get("RATE_LIMIT_LOGIN_PER_IP", 20))
+    RATE_LIMIT_LOGIN_PER_ACCOUNT: int = int(os.environ.get("RATE_LIMIT_LOGIN_PER_ACCOUNT", 5))
+    RATE_LIMIT_PASSWORD_RESET_PER_IP: int = int(os.environ.get("RATE_LIMIT_PASSWORD_RESET_PER_IP", 5))
+    RATE_LIMIT_PASSWORD_RESET_PER_ACCOUNT: int = int(os.environ.get("RATE_LIMIT_PASSWORD_RESET_PER_ACCOUNT", 3))
+
+    # bcrypt runs on a bounded thread pool; callers past the queue limit get a 503
+    PASSWORD_HASH_WORKERS: int = int(os.environ.get("PASSWORD_HASH_WORKERS", 4))
+    PASSWORD_HASH_MAX_QUEUE: int = int(os.environ.get("PASSWORD_HASH_MAX_QUEUE", 64))
+
+    # Authorize backend/frontend routes from the verified token claims alone, without loading the user
+    AUTH_CLAIMS_ONLY: bool = os.environ.get("AUTH_CLAIMS_ONLY", "false").lower() == "true"
+
+    # Authenticated user principal cache
+    USER_CACHE_SIZE: int = int(os.environ.get("USER_CACHE_SIZE", 10000))
+    USER_CACHE_TTL_SECONDS: float = float(os.environ.get("USER_CACHE_TTL_SECONDS", 60))
+
     # Email Config
     MAILTRAP_TEST_TOKEN: str = os.environ.get("MAILTRAP_TEST_TOKEN", "fake_mailtrap_token")
 
@@ -0,0 +1,16 @@
+class FilterOperators:
+    EQ = "eq"
+    NE = "ne"
+    GT = "gt"
+    GTE = "gte"
+    LT = "lt"
+    LTE = "lte"
+    BETWEEN = "between"
+    IN = "in"
+    IS_NULL = "isnull"
+
+    # Operator sets used by the models' __filterable_columns__
+    EQUALITY = (EQ, NE, IN)
+    RANGE = (EQ, NE, GT, GTE, LT, LTE, BETWEEN)
+    NULLABLE = (EQ, NE, IN, IS_NULL)
+    FLAG = (EQ,)
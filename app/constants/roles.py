@@ -13,3 +13,13 @@ class Roles:
             cls.SUPER_ADMIN: "SUPER_ADMIN"
         }
         return role_map.get(role_value, "UNKNOWN")
+
+    @classmethod
+    def get_value(cls, role_name):
+        value_map = {
+            "CUSTOMER": cls.CUSTOMER,
+            "USER": cls.USER,
+            "ADMIN": cls.ADMIN,
+            "SUPER_ADMIN": cls.SUPER_ADMIN
+        }
+        return value_map.get(role_name)
@@ -5,6 +5,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from app.config.custom_exceptions import ExceptionHandlerRegistry
+from app.config.instrumentation import SQLInstrumentationMiddleware
+from app.config.replica import ReadYourWritesMiddleware
+from app.config.settings import get_settings
 from app.config.swagger import custom_openapi
 from app.routes import auth
 from app.routes.backend.base_backend import backend_router
@@ -35,6 +38,8 @@ class MainApp:
     def __init__(self):
         self.app = create_application()
         self.configure_cors()
+        self.configure_read_replica()
+        self.configure_instrumentation()
         self.add_routes()
 
     def configure_cors(self):
@@ -50,6 +55,15 @@ class MainApp:
             allow_headers=["*"],  # Allows all headers to be sent in requests
         )
 
+    def configure_read_replica(self):
+        settings = get_settings()
+        if settings.DATABASE_READ_URI != settings.DATABASE_URI:
+            self.app.add_middleware(ReadYourWritesMiddleware)
+
+    def configure_instrumentation(self):
+        # Added last so it wraps CORS and sees the full request
+        self.app.add_middleware(SQLInstrumentationMiddleware)
+
     def add_routes(self):
         @self.app.get("/", include_in_schema=False)
         async def root():
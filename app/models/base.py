@@ -1,7 +1,8 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, DateTime, func, Computed, Index
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import deferred
 
 from app.config.database import Base
 
@@ -15,3 +16,26 @@ class BaseModel(Base):
     updated_at = Column(DateTime, nullable=True, onupdate=func.now())
     updated_by = Column(UUID(as_uuid=True), nullable=True)
     deleted_at = Column(DateTime, nullable=True)
+
+
+def search_vector_column(*columns: str, config: str = "simple"):
+    """
+    Generated `tsvector` over the given text columns, used by full-text search.
+
+    The column is deferred so list queries don't ship it, and the text search config
+    is kept in `info` so queries parse the search term with the same config.
+    """
+    document = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+    return deferred(Column(
+        TSVECTOR,
+        Computed(f"to_tsvector('{config}'::regconfig, {document})", persisted=True),
+        info={"search_config": config}
+    ))
+
+
+def trigram_indexes(table: str, columns) -> list[Index]:
+    """`pg_trgm` GIN indexes backing substring search on each of the `__searchable_columns__`."""
+    return [
+        Index(f"ix_{table}_{column}_trgm", column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"})
+        for column in columns
+    ]
@@ -9,8 +9,8 @@ from app.models.user import User # Ensure User is imported
 class Cart(BaseModel):
     __tablename__ = "carts"
 
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
-    product_price_id = Column(UUID(as_uuid=True), ForeignKey("product_prices.id"))
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), index=True)
+    product_price_id = Column(UUID(as_uuid=True), ForeignKey("product_prices.id"), index=True)
     qty = Column(Integer)
 
     user = relationship("User", back_populates="carts")
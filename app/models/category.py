@@ -1,15 +1,25 @@
-from sqlalchemy import Column, String, Text
+from sqlalchemy import Column, String, Text, Index
 from sqlalchemy.orm import relationship
 
-from app.models.base import BaseModel
+from app.constants.filter_operators import FilterOperators
+from app.models.base import BaseModel, search_vector_column, trigram_indexes
 
 
 class Category(BaseModel):
     __tablename__ = 'categories'
+    __searchable_columns__ = ("name",)
+    __filterable_columns__ = {
+        "created_at": FilterOperators.RANGE,
+    }
+    __table_args__ = (
+        Index("ix_categories_search_vector", "search_vector", postgresql_using="gin"),
+        *trigram_indexes("categories", __searchable_columns__),
+    )
 
     name = Column(String(100), nullable=False, unique=True)
     description = Column(Text, nullable=True)
     attachment = Column(String, nullable=True)
+    search_vector = search_vector_column("name", "description", config="english")
 
     # Reference Product model using a string to avoid circular imports
     products = relationship('Product', back_populates='category')
@@ -1,16 +1,27 @@
 # app/models/color.py
-from sqlalchemy import Column, String
+from sqlalchemy import Column, String, Index
 from sqlalchemy.orm import relationship
 
-from app.models.base import BaseModel
+from app.constants.filter_operators import FilterOperators
+from app.models.base import BaseModel, search_vector_column, trigram_indexes
 
 
 class Color(BaseModel):
     __tablename__ = 'colors'
+    __searchable_columns__ = ("name", "code")
+    __filterable_columns__ = {
+        "code": FilterOperators.EQUALITY,
+        "created_at": FilterOperators.RANGE,
+    }
+    __table_args__ = (
+        Index("ix_colors_search_vector", "search_vector", postgresql_using="gin"),
+        *trigram_indexes("colors", __searchable_columns__),
+    )
 
     code = Column(String(100), nullable=False)
     name = Column(String(100), nullable=False)
     highlight = Column(String)
+    search_vector = search_vector_column("name", "code")
 
     product_prices = relationship("ProductPrice", back_populates="color")
     order_details = relationship('OrderDetail', back_populates='color')
\ No newline at end of file
@@ -1,15 +1,27 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.base import BaseModel
+from app.constants.filter_operators import FilterOperators
+from app.models.base import BaseModel, search_vector_column, trigram_indexes
 
 
 class Customer(BaseModel):
     __tablename__ = "customers"
+    __searchable_columns__ = ("name", "phone_number", "address")
+    __filterable_columns__ = {
+        "gender": FilterOperators.EQUALITY,
+        "user_id": FilterOperators.NULLABLE,
+        "created_at": FilterOperators.RANGE,
+    }
+    __table_args__ = (
+        Index("ix_customers_search_vector", "search_vector", postgresql_using="gin"),
+        *trigram_indexes("customers", __searchable_columns__),
+    )
     name = Column(String, nullable=False)
     gender = Column(Integer)
     address = Column(String)
     phone_number = Column(String, nullable=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
+    search_vector = search_vector_column("name", "phone_number", "address")
     user = relationship("User", back_populates="customer")
     orders = relationship("Order", back_populates="customer")
@@ -1,16 +1,28 @@
-from sqlalchemy import Column, ForeignKey, Numeric, String, Float
+from sqlalchemy import Column, ForeignKey, Numeric, String, Float, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.models.base import BaseModel
+from app.constants.filter_operators import FilterOperators
+from app.models.base import BaseModel, search_vector_column, trigram_indexes
 
 
 class Location(BaseModel):
     __tablename__ = "locations"
+    __searchable_columns__ = ("name",)
+    __filterable_columns__ = {
+        "parent_id": FilterOperators.NULLABLE,
+        "price": FilterOperators.RANGE,
+        "created_at": FilterOperators.RANGE,
+    }
+    __table_args__ = (
+        Index("ix_locations_search_vector", "search_vector", postgresql_using="gin"),
+        *trigram_indexes("locations", __searchable_columns__),
+    )
 
     name = Column(String, nullable=False)
     price = Column(Numeric(10, 2))  # Changed Float to Numeric for precision
     parent_id = Column(UUID(as_uuid=True), ForeignKey("locations.id"))
+    search_vector = search_vector_column("name")
 
     # Define the children relationship (one-to-many)
     children = relationship("Location", backref="parent", remote_side="Location.id")
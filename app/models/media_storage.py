@@ -1,11 +1,22 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
-from app.models.base import BaseModel
+from app.constants.filter_operators import FilterOperators
+from app.models.base import BaseModel, trigram_indexes
 
 
 class MediaStorage(BaseModel):
     __tablename__ = "media_storages"
+    __searchable_columns__ = ("name",)
+    __filterable_columns__ = {
+        "entity_type": FilterOperators.EQUALITY,
+        "reference_id": FilterOperators.EQUALITY,
+        "created_at": FilterOperators.RANGE,
+    }
+    __table_args__ = (
+        *trigram_indexes("media_storages", __searchable_columns__),
+        Index("ix_media_storages_reference_id_entity_type", "reference_id", "entity_type"),
+    )
 
     name = Column(String, nullable=True)
     unique_name = Column(String, nullable=True)
@@ -4,6 +4,7 @@ from sqlalchemy import Column, ForeignKey, String, Table, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
+from app.constants.filter_operators import FilterOperators
 from app.models.base import BaseModel
 
 notification_seen_users = Table(
@@ -16,12 +17,18 @@ notification_seen_users = Table(
 
 class Notification(BaseModel):
     __tablename__ = "notifications"
+    __filterable_columns__ = {
+        "type": FilterOperators.EQUALITY,
+        "from_user_id": FilterOperators.EQUALITY,
+        "date": FilterOperators.RANGE,
+        "created_at": FilterOperators.RANGE,
+    }
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     from_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
     description = Column(String)
     date = Column(DateTime)
     type = Column(String)
-    target = Column(String)
+    target = Column(String, index=True)
 
     from_user = relationship("User", foreign_keys=[from_user_id])
     seen_users = relationship("User", secondary=notification_seen_users)
@@ -1,9 +1,10 @@
 import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, Float, event
+from sqlalchemy import Column, DateTime, ForeignKey, String, Float, Index, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.base import BaseModel
+from app.constants.filter_operators import FilterOperators
+from app.models.base import BaseModel, trigram_indexes
 from app.models.location import Location  # Ensure Location is imported
 from app.models.payment_method import PaymentMethod  # Ensure PaymentMethod is imported
 from app.models.order_detail import OrderDetail  # Ensure OrderDetail is imported
@@ -11,9 +12,24 @@ from app.models.order_detail import OrderDetail  # Ensure OrderDetail is importe
 
 class Order(BaseModel):
     __tablename__ = "orders"
+    __searchable_columns__ = ("order_number", "order_status")
+    __filterable_columns__ = {
+        "order_status": FilterOperators.EQUALITY,
+        "customer_id": FilterOperators.EQUALITY,
+        "location_id": FilterOperators.EQUALITY,
+        "payment_method_id": FilterOperators.EQUALITY,
+        "staff_id": FilterOperators.NULLABLE,
+        "amount": FilterOperators.RANGE,
+        "order_date": FilterOperators.RANGE,
+        "created_at": FilterOperators.RANGE,
+    }
+    __table_args__ = (
+        *trigram_indexes("orders", __searchable_columns__),
+        Index("ix_orders_created_by", "created_by"),
+    )
     order_date = Column(DateTime, nullable=False)
     order_number = Column(String, unique=True, nullable=True)
-    customer_id = Column(UUID(as_uuid=True), ForeignKey("customers.id"))
+    customer_id = Column(UUID(as_uuid=True), ForeignKey("customers.id"), index=True)
     location_id = Column(UUID(as_uuid=True), ForeignKey("locations.id"))
     location_price = Column(Float)
     amount = Column(Float)
@@ -8,7 +8,7 @@ from app.models.base import BaseModel
 class OrderDetail(BaseModel):
     __tablename__ = "order_details"
 
-    order_id = Column(UUID(as_uuid=True), ForeignKey("orders.id"))
+    order_id = Column(UUID(as_uuid=True), ForeignKey("orders.id"), index=True)
     product_id = Column(UUID(as_uuid=True), ForeignKey("products.id"))
     category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id"))
     brand_id = Column(UUID(as_uuid=True), ForeignKey("brands.id"))
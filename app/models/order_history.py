@@ -7,7 +7,7 @@ from app.models.base import BaseModel
 
 class OrderHistory(BaseModel):
     __tablename__ = "order_histories"
-    order_id = Column(UUID(as_uuid=True), ForeignKey("orders.id"))
+    order_id = Column(UUID(as_uuid=True), ForeignKey("orders.id"), index=True)
     order_status = Column(String)
 
     order = relationship("Order", back_populates="order_histories")
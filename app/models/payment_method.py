@@ -1,11 +1,23 @@
-from sqlalchemy import Boolean, Column, Float, String
+from sqlalchemy import Boolean, Column, Float, String, Index
 from sqlalchemy.orm import relationship
 
-from app.models.base import BaseModel
+from app.constants.filter_operators import FilterOperators
+from app.models.base import BaseModel, search_vector_column, trigram_indexes
 
 
 class PaymentMethod(BaseModel):
     __tablename__ = "payment_methods"
+    __searchable_columns__ = ("name", "provider")
+    __filterable_columns__ = {
+        "type": FilterOperators.EQUALITY,
+        "currency": FilterOperators.EQUALITY,
+        "is_active": FilterOperators.FLAG,
+        "created_at": FilterOperators.RANGE,
+    }
+    __table_args__ = (
+        Index("ix_payment_methods_search_vector", "search_vector", postgresql_using="gin"),
+        *trigram_indexes("payment_methods", __searchable_columns__),
+    )
 
     name = Column(String, nullable=False)
     description = Column(String) #Provides additional information about the payment method.
@@ -15,6 +27,7 @@ class PaymentMethod(BaseModel):
     currency = Column(String, default='USD') #Purpose: Denotes the currency in which transactions are processed.
     provider = Column(String) #Purpose: Names the service provider or gateway (e.g., Stripe, PayPal).
     attachment_qr = Column(String)
+    search_vector = search_vector_column("name", "type", "provider")
 
     # Relationship back to orders
     orders = relationship("Order", back_populates="payment_method")
@@ -1,12 +1,26 @@
-from sqlalchemy import Boolean, Column, ForeignKey, String
+from sqlalchemy import Boolean, Column, ForeignKey, String, Index
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
-from app.models.base import BaseModel
+from app.constants.filter_operators import FilterOperators
+from app.models.base import BaseModel, search_vector_column, trigram_indexes
+from app.models.product_listing import ProductListing
 
 
 class Product(BaseModel):
     __tablename__ = 'products'
+    __searchable_columns__ = ("name",)
+    __filterable_columns__ = {
+        "category_id": FilterOperators.EQUALITY,
+        "brand_id": FilterOperators.EQUALITY,
+        "is_active": FilterOperators.FLAG,
+        "created_at": FilterOperators.RANGE,
+    }
+    __table_args__ = (
+        Index("ix_products_search_vector", "search_vector", postgresql_using="gin"),
+        *trigram_indexes("products", __searchable_columns__),
+    )
 
     name = Column(String, nullable=False)
     description = Column(String)
@@ -15,8 +29,21 @@ class Product(BaseModel):
 
     category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id"))
     brand_id = Column(UUID(as_uuid=True), ForeignKey("brands.id"))
+    search_vector = search_vector_column("name", "description", config="english")
 
     category = relationship('Category', back_populates="products")
     brand = relationship('Brand', back_populates="products")
     product_prices = relationship("ProductPrice", back_populates="product", cascade="all, delete-orphan")
     order_details = relationship('OrderDetail', back_populates='product')
+    # Maintained by the services and removed by the database cascade, never written through the ORM
+    listing = relationship('ProductListing', uselist=False, viewonly=True)
+
+    @hybrid_property
+    def price(self):
+        """Lowest variant price, what `sort=price` orders by; queries must join `product_listings`."""
+        return self.listing.min_price if self.listing else None
+
+    @price.inplace.expression
+    @classmethod
+    def _price_expression(cls):
+        return ProductListing.min_price
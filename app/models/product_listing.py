@@ -0,0 +1,29 @@
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, Index, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+from app.config.database import Base
+
+
+class ProductListing(Base):
+    """
+    Listing card summary of a product, maintained by `app.services.product_listing`.
+
+    One row per product with the aggregates listing cards need, so product lists don't load
+    every product price and color, and ratings come without scanning product_rates.
+    """
+    __tablename__ = "product_listings"
+    __table_args__ = (
+        # Serves sort=price:asc and price_max without reading every listing row
+        Index("ix_product_listings_min_price", "min_price", "product_id"),
+        # sort=price:desc, NULLS LAST like the ascending index so unpriced products stay at the end
+        Index("ix_product_listings_min_price_desc", text("min_price DESC NULLS LAST"), text("product_id DESC")),
+    )
+
+    product_id = Column(UUID(as_uuid=True), ForeignKey("products.id", ondelete="CASCADE"), primary_key=True)
+    min_price = Column(Float)
+    max_price = Column(Float)
+    color_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False, server_default="{}")
+    variant_count = Column(Integer, nullable=False, server_default="0")
+    avg_rate = Column(Float)
+    rate_count = Column(Integer, nullable=False, server_default="0")
+    updated_at = Column(DateTime, nullable=False, server_default=func.now())
@@ -14,7 +14,7 @@ class ProductPrice(BaseModel):
     price = Column(Float)
     color_id = Column(UUID(as_uuid=True), ForeignKey("colors.id"))
     size = Column(String)
-    product_id = Column(UUID(as_uuid=True), ForeignKey("products.id"))
+    product_id = Column(UUID(as_uuid=True), ForeignKey("products.id"), index=True)
 
     color = relationship("Color", back_populates="product_prices")
     product = relationship("Product", back_populates="product_prices")
@@ -2,14 +2,21 @@ from sqlalchemy import Column, ForeignKey, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
+from app.constants.filter_operators import FilterOperators
 from app.models.base import BaseModel
 
 
 class ProductRate(BaseModel):
     __tablename__ = "product_rates"
+    __filterable_columns__ = {
+        "product_id": FilterOperators.EQUALITY,
+        "user_id": FilterOperators.EQUALITY,
+        "rate": FilterOperators.RANGE,
+        "created_at": FilterOperators.RANGE,
+    }
 
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
-    product_id = Column(UUID(as_uuid=True), ForeignKey("products.id"))
+    product_id = Column(UUID(as_uuid=True), ForeignKey("products.id"), index=True)
     rate = Column(Integer)
 
     user = relationship("User")
@@ -0,0 +1,18 @@
+from sqlalchemy import BigInteger, Column, DateTime, String, func
+
+from app.config.database import Base
+
+
+class ResourceVersion(Base):
+    """
+    Change counter per table, read by conditional GETs instead of aggregating the table.
+
+    Maintained by the `bump_resource_version` trigger: a deferred row trigger on each versioned
+    table that, once per committing transaction, sets `version` to the next value of the
+    `resource_version_seq` sequence. The sequence survives truncates, so a version is never reused.
+    """
+    __tablename__ = "resource_versions"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False)
+    changed_at = Column(DateTime, nullable=False, server_default=func.now())
@@ -11,6 +11,6 @@ class Staff(BaseModel):
     address = Column(String)
     phone_number = Column(String)
     salary = Column(Float)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
     user = relationship("User", back_populates="staff", uselist=False)
     orders = relationship("Order", back_populates="staff")
\ No newline at end of file
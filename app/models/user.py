@@ -1,11 +1,21 @@
 from sqlalchemy import Boolean, Column, DateTime, String, Integer
 from sqlalchemy.orm import relationship
-from app.models.base import BaseModel
+from app.constants.filter_operators import FilterOperators
+from app.models.base import BaseModel, trigram_indexes
 from app.models.staff import Staff  # Ensure Staff is imported
 
 
 class User(BaseModel):
     __tablename__ = 'users'
+    __searchable_columns__ = ("username", "email")
+    __filterable_columns__ = {
+        "role": FilterOperators.EQUALITY,
+        "is_active": FilterOperators.FLAG,
+        "created_at": FilterOperators.RANGE,
+    }
+    __table_args__ = (
+        *trigram_indexes("users", __searchable_columns__),
+    )
     username = Column(String(150), unique=True, nullable=False)
     password = Column(String(100), nullable=False)
     email = Column(String(255), unique=True, index=True)
@@ -22,12 +22,16 @@ class BrandDataResponse(BaseModel):
                 attachment=""
             )
 
-        return cls(
-            id=brand.id,
-            name=brand.name,
-            description=brand.description,
-            attachment=brand.attachment
-        )
+        return cls(**cls.to_dict(brand))
+
+    @classmethod
+    def to_dict(cls, brand: 'Brand') -> dict:
+        return {
+            "id": brand.id,
+            "name": brand.name,
+            "description": brand.description,
+            "attachment": brand.attachment,
+        }
 
 
 class BrandResponse(BaseResponse):
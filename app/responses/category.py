@@ -22,12 +22,16 @@ class CategoryDataResponse(BaseModel):
                 attachment=""
             )
 
-        return cls(
-            id=category.id,
-            name=category.name,
-            description=category.description,
-            attachment=category.attachment
-        )
+        return cls(**cls.to_dict(category))
+
+    @classmethod
+    def to_dict(cls, category: 'Category') -> dict:
+        return {
+            "id": category.id,
+            "name": category.name,
+            "description": category.description,
+            "attachment": category.attachment,
+        }
 
 
 class CategoryResponse(BaseResponse):
@@ -21,12 +21,16 @@ class ColorDataResponse(BaseModel):
                 highlight=""
             )
 
-        return cls(
-            id=color.id,
-            code=color.code,
-            name=color.name,
-            highlight=color.highlight
-        )
+        return cls(**cls.to_dict(color))
+
+    @classmethod
+    def to_dict(cls, color) -> dict:
+        return {
+            "id": color.id,
+            "code": color.code,
+            "name": color.name,
+            "highlight": color.highlight,
+        }
 
 
 class ColorResponse(BaseResponse):
@@ -33,17 +33,21 @@ class CustomerDataResponse(BaseModel):
                 created_at=None
             )
 
-        return cls(
-            id=customer.id,
-            name=customer.name,
-            username=customer.user.username,
-            email=customer.user.email,
-            gender=Genders.get_name(customer.gender),
-            phone_number=customer.phone_number,
-            address=customer.address,
-            active=customer.user.is_active,
-            created_at=customer.created_at
-        )
+        return cls(**cls.to_dict(customer))
+
+    @classmethod
+    def to_dict(cls, customer) -> dict:
+        return {
+            "id": customer.id,
+            "name": customer.name,
+            "username": customer.user.username if customer.user else None,
+            "email": customer.user.email if customer.user else None,
+            "gender": Genders.get_name(customer.gender),
+            "phone_number": customer.phone_number,
+            "address": customer.address,
+            "active": customer.user.is_active if customer.user else None,
+            "created_at": customer.created_at
+        }
 
 
 class CustomerResponse(BaseResponse):
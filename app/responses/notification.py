@@ -30,23 +30,28 @@ class NotificationDataResponse(BaseModel):
                 target=""
             )
 
+        return cls(**cls.to_dict(notification))
+
+    @classmethod
+    def to_dict(cls, notification) -> dict:
         env_timezone = settings.TIMEZONE
         local_tz = pytz.timezone(env_timezone)
 
+        local_dt = None
         if notification.date:
             if notification.date.tzinfo is None:
                 notification.date = pytz.utc.localize(notification.date)
 
-        local_dt = notification.date.astimezone(local_tz)
+            local_dt = notification.date.astimezone(local_tz)
 
-        return cls(
-            id=notification.id,
-            date=local_dt.strftime("%d-%m-%Y %I:%M %p"),
-            from_user_id=notification.from_user_id,
-            description=notification.description,
-            type=notification.type,
-            target=notification.target
-        )
+        return {
+            "id": notification.id,
+            "date": local_dt.strftime("%d-%m-%Y %I:%M %p") if local_dt else None,
+            "from_user_id": notification.from_user_id,
+            "description": notification.description,
+            "type": notification.type,
+            "target": notification.target
+        }
 
 
 class NotificationResponse(BaseResponse):
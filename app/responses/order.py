@@ -28,42 +28,48 @@ class OrderDataResponse(BaseModel):
 
     @classmethod
     def from_entity(cls, order: 'Order') -> 'OrderDataResponse':
+        return cls(**cls.to_dict(order))
+
+    @classmethod
+    def to_dict(cls, order: 'Order') -> dict:
         env_timezone = settings.TIMEZONE
         local_tz = pytz.timezone(env_timezone)
 
-        # Ensure created_at is timezone-aware
-        if order.order_date.tzinfo is None:
-            order.order_date = pytz.utc.localize(order.order_date)
+        # Ensure created_at is timezone-aware, order_date is only unloaded on sparse fieldsets
+        local_dt = None
+        if order.order_date is not None:
+            if order.order_date.tzinfo is None:
+                order.order_date = pytz.utc.localize(order.order_date)
 
-        # Convert to local timezone
-        local_dt = order.order_date.astimezone(local_tz)
+            # Convert to local timezone
+            local_dt = order.order_date.astimezone(local_tz)
 
-        return cls(
-            id=order.id,
-            order_date=local_dt.strftime("%d-%m-%Y %I:%M %p"),
-            order_number=order.order_number,
-            customer=KeyValueResponse(
-                key=str(order.customer_id),
-                value=order.customer.name if order.customer else None
-            ),
-            location=KeyValueResponse(
-                key=str(order.location_id),
-                value=order.location.name if order.location else None
-            ),
-            location_price=order.location_price,
-            amount=order.amount,
-            payment_method=KeyValueResponse(
-                key=str(order.payment_method_id),
-                value=order.payment_method.name if order.payment_method else None
-            ),
-            payment_attachment=order.payment_attachment,
-            order_status=order.order_status,
-            note=order.note,
-            staff=KeyValueResponse(
-                key=str(order.staff_id),
-                value=order.staff.name if order.staff else None
-            ) if order.staff else None
-        )
+        return {
+            "id": order.id,
+            "order_date": local_dt.strftime("%d-%m-%Y %I:%M %p") if local_dt else None,
+            "order_number": order.order_number,
+            "customer": {
+                "key": str(order.customer_id),
+                "value": order.customer.name if order.customer else None
+            },
+            "location": {
+                "key": str(order.location_id),
+                "value": order.location.name if order.location else None
+            },
+            "location_price": order.location_price,
+            "amount": order.amount,
+            "payment_method": {
+                "key": str(order.payment_method_id),
+                "value": order.payment_method.name if order.payment_method else None
+            },
+            "payment_attachment": order.payment_attachment,
+            "order_status": order.order_status,
+            "note": order.note,
+            "staff": {
+                "key": str(order.staff_id),
+                "value": order.staff.name if order.staff else None
+            } if order.staff else None
+        }
 
 
 class OrderResponse(BaseResponse):
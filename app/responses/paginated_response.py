@@ -1,4 +1,4 @@
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -9,8 +9,10 @@ class PaginatedResponse(BaseModel, Generic[T]):
     data: List[T]  # List of generic type T (data items)
     page: int  # Current page number
     limit: int  # Number of items per page (page size)
-    total_items: int  # Total number of items in the database
-    total_pages: int  # Total number of pages
+    total_items: Optional[int] = None  # Total number of items, omitted in cursor mode or with `with_total=false`
+    total_pages: Optional[int] = None  # Total number of pages, omitted when total_items is
+    is_total_estimated: bool = False  # True when total_items comes from the planner estimate
+    next_cursor: Optional[str] = None  # Opaque cursor for the next page, only set in cursor mode
     message: str = "Data fetched successfully"
 
     class Config:
@@ -19,7 +21,15 @@ class PaginatedResponse(BaseModel, Generic[T]):
 
 class PaginationParam(BaseModel):
     search: str = Field(default="", alias="search")
+    # Structured filters, e.g. `order_status:eq:pending,amount:between:10..500`
+    filter: str = Field(default="", alias="filter")
     sort: str = Field(default="created_at", alias="sort")
     is_page: bool = Field(default=True, alias="is_page")
     page: int = Field(default=1, alias="page")
     limit: int = Field(default=10, alias="limit")
+    # Sparse fieldsets: comma separated response keys, e.g. `id,name,attachment`
+    fields: str = Field(default="", alias="fields")
+    # Keyset pagination: send an empty `cursor=` for the first page, then the returned `next_cursor`
+    cursor: Optional[str] = Field(default=None, alias="cursor")
+    # Total counting: "true" (exact, default), "false" (skip) or "estimated" (pg_class.reltuples when unfiltered)
+    with_total: Optional[Literal["true", "false", "estimated"]] = Field(default=None, alias="with_total")
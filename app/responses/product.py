@@ -20,24 +20,96 @@ class ProductDataResponse(BaseModel):
 
     @classmethod
     def from_entity(cls, product: 'Product') -> 'ProductDataResponse':
-        return cls(
-            id=product.id,
-            name=product.name,
-            description=product.description,
-            attachment=product.attachment,
-            category=KeyValueResponse(
-                key=str(product.category_id),
-                value=product.category.name
-            ) if product.category else None,
-            brand=KeyValueResponse(
-                key=str(product.brand_id),
-                value=product.brand.name
-            ) if product.brand else None,
-            product_prices=[
-                ProductPriceDataResponse.from_entity(product_price) for product_price in product.product_prices
+        return cls(**cls.to_dict(product))
+
+    @classmethod
+    def to_dict(cls, product: 'Product') -> dict:
+        return {
+            "id": product.id,
+            "name": product.name,
+            "description": product.description,
+            "attachment": product.attachment,
+            "category": {
+                "key": str(product.category_id),
+                "value": product.category.name
+            } if product.category else None,
+            "product_prices": [
+                ProductPriceDataResponse.to_dict(product_price) for product_price in product.product_prices
             ] if product.product_prices else None,
-            is_active=product.is_active,
-        )
+            "brand": {
+                "key": str(product.brand_id),
+                "value": product.brand.name
+            } if product.brand else None,
+            "is_active": product.is_active,
+        }
+
+
+class ProductListingDataResponse(BaseModel):
+    """Listing card of a product, priced and rated from its `product_listings` row."""
+    id: str | UUID
+    name: str
+    description: str | None
+    attachment: str | None
+    category: KeyValueResponse | None
+    brand: KeyValueResponse | None
+    is_active: bool
+    min_price: float | None
+    max_price: float | None
+    color_ids: list[str] | None
+    variant_count: int | None
+    avg_rate: float | None
+    rate_count: int | None
+
+    @classmethod
+    def from_entity(cls, product: 'Product') -> 'ProductListingDataResponse':
+        return cls(**cls.to_dict(product))
+
+    @classmethod
+    def to_dict(cls, product: 'Product') -> dict:
+        listing = product.listing
+        return {
+            "id": product.id,
+            "name": product.name,
+            "description": product.description,
+            "attachment": product.attachment,
+            "category": {
+                "key": str(product.category_id),
+                "value": product.category.name
+            } if product.category else None,
+            "brand": {
+                "key": str(product.brand_id),
+                "value": product.brand.name
+            } if product.brand else None,
+            "is_active": product.is_active,
+            "min_price": listing.min_price if listing else None,
+            "max_price": listing.max_price if listing else None,
+            "color_ids": [str(color_id) for color_id in listing.color_ids] if listing else [],
+            "variant_count": listing.variant_count if listing else 0,
+            "avg_rate": round(listing.avg_rate, 2) if listing and listing.avg_rate is not None else None,
+            "rate_count": listing.rate_count if listing else 0,
+        }
+
+
+class FacetCountResponse(KeyValueResponse):
+    count: int
+
+
+class PriceBucketCountResponse(BaseModel):
+    min: float
+    max: float | None
+    count: int
+
+
+class ProductFacetsDataResponse(BaseModel):
+    total: int
+    categories: list[FacetCountResponse]
+    brands: list[FacetCountResponse]
+    colors: list[FacetCountResponse]
+    price_buckets: list[PriceBucketCountResponse]
+
+
+class ProductFacetsResponse(BaseResponse):
+    data: ProductFacetsDataResponse | None
 
 
 class ProductResponse(BaseResponse):
@@ -14,12 +14,16 @@ class ProductPriceDataResponse(BaseModel):
 
     @classmethod
     def from_entity(cls, product_price: 'ProductPrice') -> 'ProductPriceDataResponse':
-        return cls(
-            id=product_price.id,
-            color=KeyValueResponse(
-                key=str(product_price.color_id),
-                value=product_price.color.name
-            ) if product_price.color else None,
-            size=product_price.size,
-            price=product_price.price,
-        )
+        return cls(**cls.to_dict(product_price))
+
+    @classmethod
+    def to_dict(cls, product_price: 'ProductPrice') -> dict:
+        return {
+            "id": product_price.id,
+            "color": {
+                "key": str(product_price.color_id),
+                "value": product_price.color.name
+            } if product_price.color else None,
+            "size": product_price.size,
+            "price": product_price.price,
+        }
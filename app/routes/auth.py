@@ -2,7 +2,9 @@ from fastapi import APIRouter, Depends, Header, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.database import get_session
-from app.config.security import get_current_user
+from app.config.rate_limit import RateLimit, rate_limit, body_accounts, query_accounts
+from app.config.security import get_current_user, get_current_user_entity
+from app.config.settings import get_settings
 from app.constants.roles import Roles
 from app.responses.auth import TokenResponse
 from app.responses.user import UserResponse, UserDataResponse
@@ -10,6 +12,30 @@ from app.schemas.auth import LoginRequest, VerifyPasswordRequest
 from app.schemas.user import RegisterUserRequest
 from app.services import auth, user
 
+settings = get_settings()
+
+LOGIN_RATE_LIMIT = rate_limit(
+    "login",
+    per_ip=RateLimit(settings.RATE_LIMIT_LOGIN_PER_IP, 60),
+    per_account=RateLimit(settings.RATE_LIMIT_LOGIN_PER_ACCOUNT, 60),
+    accounts=body_accounts("username", "email"),
+)
+FORGOT_PASSWORD_RATE_LIMIT = rate_limit(
+    "forgot_password",
+    per_ip=RateLimit(settings.RATE_LIMIT_PASSWORD_RESET_PER_IP, 60),
+    per_account=RateLimit(settings.RATE_LIMIT_PASSWORD_RESET_PER_ACCOUNT, 60),
+    accounts=query_accounts("email"),
+)
+# The reset code is 6 digits, so guesses are limited per reset token as well, from any address:
+# only the holder of the token can spend its bucket
+VERIFY_PASSWORD_RATE_LIMIT = rate_limit(
+    "verify_password",
+    per_ip=RateLimit(settings.RATE_LIMIT_PASSWORD_RESET_PER_IP, 60),
+    per_account=RateLimit(settings.RATE_LIMIT_PASSWORD_RESET_PER_ACCOUNT, 60),
+    accounts=body_accounts("token"),
+    account_per_ip=False,
+)
+
 guest_router = APIRouter(
     prefix="/auth",
     tags=["Auth API"],
@@ -22,7 +48,8 @@ async def register_user(data: RegisterUserRequest, session: AsyncSession = Depen
     return await user.create_user_account(data, session)
 
 
-@guest_router.post("/login", status_code=status.HTTP_200_OK, response_model=TokenResponse)
+@guest_router.post("/login", status_code=status.HTTP_200_OK, response_model=TokenResponse,
+                   dependencies=[LOGIN_RATE_LIMIT])
 async def login(req: LoginRequest, session: AsyncSession = Depends(get_session)):
     return await auth.auth_login(req, session)
 
@@ -33,7 +60,7 @@ async def refresh(refresh_token: str = Header(None), session: AsyncSession = Dep
 
 
 @guest_router.get("/me", status_code=status.HTTP_200_OK, response_model=UserResponse)
-async def me(user: UserDataResponse = Depends(get_current_user)):
+async def me(user: UserDataResponse = Depends(get_current_user_entity)):
     return UserResponse(
         data=UserDataResponse(
             id=str(user.id),
@@ -47,12 +74,12 @@ async def me(user: UserDataResponse = Depends(get_current_user)):
     )
 
 
-@guest_router.post("/forgot-password", status_code=status.HTTP_200_OK)
+@guest_router.post("/forgot-password", status_code=status.HTTP_200_OK, dependencies=[FORGOT_PASSWORD_RATE_LIMIT])
 async def forgot_password(email: str, session: AsyncSession = Depends(get_session)):
     return await auth.auth_forgot_password(email, session)
 
 
-@guest_router.post("/verify-password", status_code=status.HTTP_200_OK)
+@guest_router.post("/verify-password", status_code=status.HTTP_200_OK, dependencies=[VERIFY_PASSWORD_RATE_LIMIT])
 async def verify_password(req: VerifyPasswordRequest, session: AsyncSession = Depends(get_session)):
     return await auth.auth_verify_password(req, session)
 
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config.database import get_session
+from app.config.database import get_session, get_read_session
 from app.responses.paginated_response import PaginationParam
 from app.services import category
 
@@ -14,7 +14,7 @@ category_router = APIRouter(
 
 @category_router.get("", status_code=200)
 async def get_categories(
-        session: AsyncSession = Depends(get_session),
+        session: AsyncSession = Depends(get_read_session),
         pagination: PaginationParam = Depends(PaginationParam)
 ):
     return await category.get_categories(session, pagination)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.database import get_session
@@ -18,6 +18,12 @@ async def get_customers(session: AsyncSession = Depends(get_session),
     return await customer.get_customers(session, pagination)
 
 
+@customer_router.get("/export", status_code=200)
+async def export_customers(export_format: str = Query(default="ndjson", alias="format"),
+                           pagination: PaginationParam = Depends(PaginationParam)):
+    return customer.export_customers(pagination, export_format)
+
+
 @customer_router.get("/{customer_id}", status_code=200)
 async def get_customer(customer_id: str, session: AsyncSession = Depends(get_session)):
     return await customer.get_customer(customer_id, session)
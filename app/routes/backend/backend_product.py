@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config.database import get_session
+from app.config.database import get_session, get_read_session
+from app.config.instrumentation import query_budget
 from app.responses.paginated_response import PaginationParam
 from app.schemas.product import ProductRequest
 from app.services import product
@@ -14,21 +15,27 @@ product_router = APIRouter(
 
 
 @product_router.get("", status_code=200)
-async def get_products(session: AsyncSession = Depends(get_session), pagination: PaginationParam = Depends(PaginationParam)):
+async def get_products(session: AsyncSession = Depends(get_read_session), pagination: PaginationParam = Depends(PaginationParam)):
     return await product.get_products(session, pagination)
 
 
+@product_router.get("/export", status_code=200)
+async def export_products(export_format: str = Query(default="ndjson", alias="format"),
+                          pagination: PaginationParam = Depends(PaginationParam)):
+    return product.export_products(pagination, export_format)
+
+
 @product_router.get("/{product_id}", status_code=200)
 async def get_product(product_id: str, session: AsyncSession = Depends(get_session)):
     return await product.get_product(product_id, session)
 
 
-@product_router.post("", status_code=201)
+@product_router.post("", status_code=201, dependencies=[query_budget(10)])
 async def create_product(req: ProductRequest, session: AsyncSession = Depends(get_session)):
     return await product.create_product(req, session)
 
 
-@product_router.put("/{product_id}", status_code=200)
+@product_router.put("/{product_id}", status_code=200, dependencies=[query_budget(13)])
 async def update_color(product_id: str, req: ProductRequest, session: AsyncSession = Depends(get_session)):
     return await product.update_product(product_id, req, session)
 
@@ -0,0 +1,39 @@
+from fastapi import APIRouter
+
+from app.config.catalog_cache import catalog_cache_status
+from app.config.database import engine, read_engine
+from app.config.password_hashing import password_hash_pool
+from app.config.pool import pool_status
+
+system_router = APIRouter(
+    prefix="/system",
+    tags=["Backend System API"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@system_router.get("/db-pool", status_code=200)
+async def get_db_pool_status():
+    return {
+        "data": {
+            "primary": pool_status(engine.pool),
+            "replica": pool_status(read_engine.pool) if read_engine is not engine else None,
+        },
+        "message": "Connection pool status fetched successfully"
+    }
+
+
+@system_router.get("/password-hashing", status_code=200)
+async def get_password_hashing_status():
+    return {
+        "data": password_hash_pool.status(),
+        "message": "Password hashing pool status fetched successfully"
+    }
+
+
+@system_router.get("/catalog-cache", status_code=200)
+async def get_catalog_cache_status():
+    return {
+        "data": catalog_cache_status(),
+        "message": "Catalog cache status fetched successfully"
+    }
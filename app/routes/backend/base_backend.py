@@ -11,6 +11,7 @@ from app.routes.backend.backend_order import order_router
 from app.routes.backend.backend_payment_method import payment_method_router
 from app.routes.backend.backend_product import product_router
 from app.routes.backend.backend_product_rate import product_rate_router
+from app.routes.backend.backend_system import system_router
 from app.routes.backend.backend_user import backend_user_router
 from app.routes.backend.notification_router import notification_router
 
@@ -32,3 +33,4 @@ backend_router.include_router(product_rate_router, tags=["Backend Product Rate A
 backend_router.include_router(location_router, tags=["Backend Location API"])
 backend_router.include_router(media_router, tags=["Backend Media Storage API"])
 backend_router.include_router(notification_router, tags=["Backend Notification API"])
+backend_router.include_router(system_router, tags=["Backend System API"])
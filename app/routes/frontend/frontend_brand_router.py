@@ -1,15 +1,21 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.database import get_session
+from app.config.instrumentation import query_budget
+from app.models.brand import Brand
 from app.responses.paginated_response import PaginationParam
 from app.services import brand
+from app.services.conditional import conditional_get
 
 frontend_brand_router = APIRouter(
     prefix="/brands",
     responses={404: {"description": "Not Found!"}},
 )
 
-@frontend_brand_router.get("", status_code=200)
-async def get_brands(session: AsyncSession = Depends(get_session), pagination: PaginationParam = Depends(PaginationParam)):
-    return await brand.get_brands(session, pagination)
\ No newline at end of file
+# Tables whose changes invalidate the cached responses
+BRAND_ENTITIES = (Brand,)
+
+@frontend_brand_router.get("", status_code=200, dependencies=[query_budget(4)])
+async def get_brands(request: Request, session: AsyncSession = Depends(get_session), pagination: PaginationParam = Depends(PaginationParam)):
+    return await conditional_get(request, session, BRAND_ENTITIES, lambda: brand.get_brands(session, pagination))
\ No newline at end of file
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.database import get_session
+from app.config.instrumentation import query_budget
 from app.config.security import get_frontend_user, get_current_user
 from app.schemas.cart import CartRequest
 from app.services.frontend import frontend_cart_service as cart
@@ -22,7 +23,7 @@ async def get_carts(user=Depends(get_current_user), session: AsyncSession = Depe
 async def add_cart(req: CartRequest, user=Depends(get_current_user), session: AsyncSession = Depends(get_session)):
     return await cart.add_cart(req, user, session)
 
-@frontend_cart_router.post("/all", status_code=201)
+@frontend_cart_router.post("/all", status_code=201, dependencies=[query_budget(10)])
 async def add_all_carts(req: list[CartRequest], user=Depends(get_current_user), session: AsyncSession = Depends(get_session)):
     return await cart.add_all_carts(req, user, session)
 
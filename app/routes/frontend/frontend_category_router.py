@@ -1,15 +1,21 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config.database import get_session
+from app.config.database import get_session, get_read_session
+from app.config.instrumentation import query_budget
+from app.models.category import Category
 from app.responses.paginated_response import PaginationParam
 from app.services import category
+from app.services.conditional import conditional_get
 
 frontend_category_router = APIRouter(
     prefix="/categories",
     responses={404: {"description": "Not Found!"}},
 )
 
-@frontend_category_router.get("", status_code=200)
-async def get_categories(session: AsyncSession = Depends(get_session), pagination: PaginationParam = Depends(PaginationParam)):
-    return await category.get_categories(session, pagination)
\ No newline at end of file
+# Tables whose changes invalidate the cached responses
+CATEGORY_ENTITIES = (Category,)
+
+@frontend_category_router.get("", status_code=200, dependencies=[query_budget(4)])
+async def get_categories(request: Request, session: AsyncSession = Depends(get_read_session), pagination: PaginationParam = Depends(PaginationParam)):
+    return await conditional_get(request, session, CATEGORY_ENTITIES, lambda: category.get_categories(session, pagination))
\ No newline at end of file
@@ -1,15 +1,21 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.database import get_session
+from app.config.instrumentation import query_budget
+from app.models.color import Color
 from app.responses.paginated_response import PaginationParam
 from app.services import color
+from app.services.conditional import conditional_get
 
 frontend_color_router = APIRouter(
     prefix="/colors",
     responses={404: {"description": "Not Found!"}},
 )
 
-@frontend_color_router.get("", status_code=200)
-async def get_colors(session: AsyncSession = Depends(get_session), pagination: PaginationParam = Depends(PaginationParam)):
-    return await color.get_colors(session, pagination)
+# Tables whose changes invalidate the cached responses
+COLOR_ENTITIES = (Color,)
+
+@frontend_color_router.get("", status_code=200, dependencies=[query_budget(4)])
+async def get_colors(request: Request, session: AsyncSession = Depends(get_session), pagination: PaginationParam = Depends(PaginationParam)):
+    return await conditional_get(request, session, COLOR_ENTITIES, lambda: color.get_colors(session, pagination))
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.database import get_session
+from app.config.instrumentation import query_budget
 from app.config.security import get_frontend_user
+from app.models.location import Location
 from app.responses.paginated_response import PaginationParam
 from app.services import location
+from app.services.conditional import conditional_get
 
 frontend_location_router = APIRouter(
     prefix="/locations",
@@ -12,13 +15,16 @@ frontend_location_router = APIRouter(
     responses={404: {"description": "Not Found!"}},
 )
 
+# Tables whose changes invalidate the cached responses
+LOCATION_ENTITIES = (Location,)
 
-@frontend_location_router.get("", status_code=200)
-async def get_locations(session: AsyncSession = Depends(get_session),
+
+@frontend_location_router.get("", status_code=200, dependencies=[query_budget(5)])
+async def get_locations(request: Request, session: AsyncSession = Depends(get_session),
                         pagination: PaginationParam = Depends(PaginationParam)):
-    return await location.get_locations(session, pagination)
+    return await conditional_get(request, session, LOCATION_ENTITIES, lambda: location.get_locations(session, pagination))
 
 
 @frontend_location_router.get("/location_id", status_code=200)
-async def get_location(location_id, session: AsyncSession = Depends(get_session)):
-    return await location.get_location(location_id, session)
+async def get_location(request: Request, location_id, session: AsyncSession = Depends(get_session)):
+    return await conditional_get(request, session, LOCATION_ENTITIES, lambda: location.get_location(location_id, session))
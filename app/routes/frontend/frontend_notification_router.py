@@ -1,7 +1,8 @@
 from fastapi import Depends, APIRouter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config.database import get_session
+from app.config.database import get_session, get_read_session
+from app.config.instrumentation import query_budget
 from app.config.security import get_frontend_user, get_current_user
 from app.responses.paginated_response import PaginationParam
 from app.services.notification import NotificationService
@@ -16,7 +17,7 @@ frontend_notification_router = APIRouter(
 @frontend_notification_router.get("/unseen", status_code=200)
 async def get_notifications_unseen(
         user=Depends(get_current_user),
-        session: AsyncSession = Depends(get_session),
+        session: AsyncSession = Depends(get_read_session),
         pagination: PaginationParam = Depends(PaginationParam)
 ):
     notification_service = NotificationService(session)
@@ -26,7 +27,7 @@ async def get_notifications_unseen(
 @frontend_notification_router.get("/seen", status_code=200)
 async def get_notifications_seen(
         user=Depends(get_current_user),
-        session: AsyncSession = Depends(get_session),
+        session: AsyncSession = Depends(get_read_session),
         pagination: PaginationParam = Depends(PaginationParam)
 ):
     notification_service = NotificationService(session)
@@ -43,7 +44,7 @@ async def mark_notification_as_seen(
     return await notification_service.mark_as_seen(notification_id, user.id, is_admin=False)
 
 
-@frontend_notification_router.post("/seen-all", status_code=201)
+@frontend_notification_router.post("/seen-all", status_code=201, dependencies=[query_budget(5)])
 async def mark_notification_as_all_seen(
         user=Depends(get_current_user),
         session: AsyncSession = Depends(get_session)
@@ -1,22 +1,28 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.database import get_session
+from app.config.instrumentation import query_budget
+from app.models.payment_method import PaymentMethod
 from app.responses.paginated_response import PaginationParam
 from app.services import payment_method
+from app.services.conditional import conditional_get
 
 frontend_payment_method_router = APIRouter(
     prefix="/payment_methods",
     responses={404: {"description": "Not Found!"}},
 )
 
+# Tables whose changes invalidate the cached responses
+PAYMENT_METHOD_ENTITIES = (PaymentMethod,)
 
-@frontend_payment_method_router.get("", status_code=200)
-async def get_payments(session: AsyncSession = Depends(get_session),
+
+@frontend_payment_method_router.get("", status_code=200, dependencies=[query_budget(4)])
+async def get_payments(request: Request, session: AsyncSession = Depends(get_session),
                        pagination: PaginationParam = Depends(PaginationParam)):
-    return await payment_method.get_payment_methods(session, pagination)
+    return await conditional_get(request, session, PAYMENT_METHOD_ENTITIES, lambda: payment_method.get_payment_methods(session, pagination))
 
 
 @frontend_payment_method_router.get("/{payment_method_id}", status_code=200)
-async def get_payment(payment_method_id, session: AsyncSession = Depends(get_session)):
-    return await payment_method.get_payment_method(payment_method_id, session)
+async def get_payment(request: Request, payment_method_id, session: AsyncSession = Depends(get_session)):
+    return await conditional_get(request, session, PAYMENT_METHOD_ENTITIES, lambda: payment_method.get_payment_method(payment_method_id, session))
@@ -1,21 +1,46 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config.database import get_session
+from app.config.database import get_session, get_read_session
+from app.config.instrumentation import query_budget
+from app.models.product import Product
+from app.models.product_listing import ProductListing
+from app.models.product_price import ProductPrice
+from app.models.product_rate import ProductRate
+from app.models.category import Category
+from app.models.brand import Brand
+from app.models.color import Color
 from app.responses.paginated_response import PaginationParam
+from app.schemas.product import PriceRangeParam
 from app.services import product
+from app.services.conditional import conditional_get
 
 frontend_product_router = APIRouter(
     prefix="/products",
     tags=["Frontend Product API"]
 )
 
+# Tables whose changes invalidate the cached responses
+PRODUCT_ENTITIES = (Product, ProductPrice, ProductRate, ProductListing, Category, Brand, Color)
+# A detail only depends on its own product and price rows, plus the lookups it denormalizes
+PRODUCT_DETAIL_ENTITIES = (Category, Brand, Color)
 
-@frontend_product_router.get("", status_code=200)
-async def get_products(session: AsyncSession = Depends(get_session), pagination: PaginationParam = Depends(PaginationParam)):
-    return await product.get_products(session, pagination)
 
+@frontend_product_router.get("", status_code=200, dependencies=[query_budget(8)])
+async def get_products(request: Request, session: AsyncSession = Depends(get_read_session), pagination: PaginationParam = Depends(PaginationParam),
+                       price_range: PriceRangeParam = Depends(PriceRangeParam)):
+    return await conditional_get(request, session, PRODUCT_ENTITIES, lambda: product.get_product_listings(session, pagination, price_range))
 
-@frontend_product_router.get("/{product_id}", status_code=200)
-async def get_product(product_id, session: AsyncSession = Depends(get_session)):
-    return await product.get_product(product_id, session)
+
+@frontend_product_router.get("/facets", status_code=200, dependencies=[query_budget(4)])
+async def get_product_facets(request: Request, session: AsyncSession = Depends(get_read_session), pagination: PaginationParam = Depends(PaginationParam),
+                             price_range: PriceRangeParam = Depends(PriceRangeParam)):
+    return await conditional_get(request, session, PRODUCT_ENTITIES, lambda: product.get_product_facets(session, pagination, price_range))
+
+
+@frontend_product_router.get("/{product_id}", status_code=200, dependencies=[query_budget(8)])
+async def get_product(request: Request, product_id, session: AsyncSession = Depends(get_session)):
+    rows = ((Product, Product.id == product_id), (ProductPrice, ProductPrice.product_id == product_id))
+    return await conditional_get(
+        request, session, PRODUCT_DETAIL_ENTITIES, lambda: product.get_product(product_id, session), rows=rows
+    )
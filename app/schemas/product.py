@@ -10,6 +10,12 @@ class ProductPriceRequest(BaseModel):
     price: float = 0.0
 
 
+class PriceRangeParam(BaseModel):
+    # Products with at least one variant priced inside [price_min, price_max]
+    price_min: Optional[float] = Field(default=None, ge=0, alias="price_min")
+    price_max: Optional[float] = Field(default=None, ge=0, alias="price_max")
+
+
 class ProductRequest(BaseModel):
     name: str | UUID = Field(default="Table Set")
     description: str = None
@@ -9,6 +9,8 @@ from sqlalchemy.future import select
 from starlette.responses import JSONResponse
 
 from app.config.custom_exceptions import CustomHTTPException
+from app.config.revocation import get_token_denylist
+from app.config.session import release_connection
 from app.config.security import generate_token, verify_password, get_token_payload, hash_password
 from app.config.settings import get_settings
 from app.models.user import User
@@ -28,7 +30,9 @@ async def auth_login(request: LoginRequest, session: AsyncSession) -> TokenRespo
         if not user_exist:
             raise CustomHTTPException(status_code=400, message="Email or username not found.")
 
-        if not verify_password(request.password, user_exist.password):
+        # Don't hold a pooled connection through bcrypt
+        await release_connection(session)
+        if not await verify_password(request.password, user_exist.password):
             raise CustomHTTPException(status_code=400, message="Invalid password.")
 
         access_token_expiry = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -62,6 +66,9 @@ async def auth_refresh(refresh_token: str, session: AsyncSession) -> TokenRespon
     if not user_id:
         raise CustomHTTPException(status_code=400, message="Invalid refresh token.")
 
+    if await get_token_denylist().is_revoked(user_id, payload.get("iat")):
+        raise CustomHTTPException(status_code=401, message="Token has been revoked.")
+
     stmt = select(User).where(User.id == user_id)
     result = await session.execute(stmt)
     user = result.scalar()
@@ -182,7 +189,14 @@ async def auth_reset_new_password(user_id: UUID, new_password: str, session: Asy
     if not user:
         raise CustomHTTPException(status_code=404, message="User not found.")
 
-    user.password = hash_password(new_password)
+    # Hash without holding a connection, then lock and re-check the row in the write transaction
+    await release_connection(session)
+    password = await hash_password(new_password)
+    user = await session.get(User, user.id, with_for_update=True, populate_existing=True)
+    if not user:
+        raise CustomHTTPException(status_code=404, message="User not found.")
+
+    user.password = password
     await session.commit()
 
     return {
@@ -1,10 +1,18 @@
 from typing import List, Union, TypeVar, Optional
 
-from sqlalchemy import select, func, cast, String
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, func, tuple_, and_, or_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.custom_exceptions import CustomHTTPException
+from app.config.session import release_connection
 from app.responses.base import BaseResponse
 from app.responses.paginated_response import PaginatedResponse, PaginationParam
+from app.services.filters import apply_filters
+from app.services.projection import parse_fields, apply_projection, serialize_partial
+from app.services.search import apply_search, apply_field_search
+from app.utils.cursor import encode_cursor, decode_cursor
+from app.utils.encoding import RowsJSONResponse
 
 T = TypeVar("T")
 
@@ -17,9 +25,11 @@ async def fetch_paginated_data(
         data_response_model=None,
         order_by_field=None,
         message: str = "Data fetched successfully",
-) -> Union[PaginatedResponse, BaseResponse, List[T]]:
+        load_options: Optional[dict] = None,
+) -> Union[PaginatedResponse, BaseResponse, ORJSONResponse, List[T]]:
     """
     Fetch data with pagination or without pagination based on the `pagination.is_page` flag.
+    When `pagination.cursor` is set (empty for the first page) keyset pagination is used instead of OFFSET.
 
     Args:
         session: The async SQLAlchemy session
@@ -27,6 +37,7 @@ async def fetch_paginated_data(
         pagination: Pagination parameters
         data_response_model: The Pydantic model for the data response
         order_by_field: Field to order the data by (e.g., entity.created_at)
+        load_options: Loader options keyed by the response key they feed, skipped when `fields` omits the key
 
     Returns:
         PaginatedResponse or BaseResponse or List of data response model
@@ -37,6 +48,7 @@ async def fetch_paginated_data(
         :param data_response_model:
         :param order_by_field:
         :param message:
+        :param load_options:
     """
     # Create the base query if stmt is not provided
     if stmt is None:
@@ -44,63 +56,281 @@ async def fetch_paginated_data(
     else:
         stmt = stmt
 
-    # Apply search filter if provided
-    if pagination.search:
-        search_term = pagination.search.split(":")
-        if len(search_term) == 2:
-            field, value = search_term
-            search_value = f"%{value}%"
-            if hasattr(entity, field):
-                stmt = stmt.where(getattr(entity, field).ilike(search_value))
-        else:
-            search_value = f"%{pagination.search}%"
-            stmt = stmt.where(
-                (cast(entity.id, String).ilike(search_value)) | (entity.name.ilike(search_value))
-            )
+    stmt = apply_search_and_filters(stmt, entity, pagination)
 
-    # Apply sorting
-    if pagination.sort:
-        sort_term = pagination.sort.split(":")
-        if len(sort_term) == 2:
-            field, direction = sort_term
-        else:
-            field, direction = pagination.sort, "desc"
+    # Keyset mode: seek past the cursor instead of OFFSET and skip the count query
+    if pagination.is_page and pagination.cursor is not None:
+        return await _fetch_keyset_page(
+            session=session,
+            stmt=stmt,
+            entity=entity,
+            pagination=pagination,
+            data_response_model=data_response_model,
+            order_by_field=order_by_field,
+            message=message,
+            load_options=load_options
+        )
 
-        sort_field = getattr(entity, field, order_by_field)
-        if direction.lower() == "asc":
-            stmt = stmt.order_by(sort_field.asc())
-        else:
-            stmt = stmt.order_by(sort_field.desc())
+    # Apply sparse fieldsets, only the requested columns and relationships are loaded
+    fields = parse_fields(pagination.fields)
+    stmt = apply_projection(stmt, entity, fields, load_options)
+
+    # Apply sorting
+    stmt = apply_sort(stmt, entity, pagination, order_by_field)
 
     if pagination.is_page:
         # Calculate pagination details
         offset = (pagination.page - 1) * pagination.limit
-        total_items_query = await session.execute(select(func.count()).select_from(stmt.subquery()))
-        total_items = total_items_query.scalar_one()
+        total_mode = pagination.with_total or "true"
+        total_items, is_total_estimated = None, False
+
+        if total_mode == "estimated":
+            total_items = await _estimate_total(session, stmt, entity)
+            is_total_estimated = total_items is not None
+            if total_items is None:
+                total_mode = "true"
+
+        count_stmt = stmt
+        if total_mode == "true":
+            # Count in the same round trip as the page with a window aggregate
+            stmt = stmt.add_columns(func.count().over().label("total_items"))
 
         # Fetch paginated results
         stmt = stmt.offset(offset).limit(pagination.limit)
         result = await session.execute(stmt)
-        entities = result.scalars().all()
+
+        if total_mode == "true":
+            rows = result.all()
+            entities = [row[0] for row in rows]
+            if rows:
+                total_items = rows[0].total_items
+            elif offset == 0:
+                total_items = 0
+            else:
+                # Past the last page the window has no row to ride on, fall back to a count
+                total_items = await _count_total(session, count_stmt)
+        else:
+            entities = result.scalars().all()
 
         # Calculate total pages
-        total_pages = (total_items + pagination.limit - 1) // pagination.limit
-        data = [data_response_model.from_entity(item) for item in entities]
+        total_pages = None
+        if total_items is not None:
+            total_pages = (total_items + pagination.limit - 1) // pagination.limit
+        # Every row is loaded, the connection isn't needed while the page is serialized
+        await release_connection(session)
+        data = _serialize(data_response_model, entities, fields)
 
-        return PaginatedResponse(
+        return _render(PaginatedResponse(
             data=data,
             page=pagination.page,
             limit=pagination.limit,
             total_items=total_items,
             total_pages=total_pages,
+            is_total_estimated=is_total_estimated,
             message=message
-        )
+        ))
     else:
         # Fetch all data without pagination
         result = await session.execute(stmt)
         entities = result.scalars().all()
+        await release_connection(session)
 
-        return BaseResponse(
-            data=[data_response_model.from_entity(item) for item in entities],
+        return _render(BaseResponse(
+            data=_serialize(data_response_model, entities, fields),
             message=message
-        )
\ No newline at end of file
+        ))
+
+
+def apply_search_and_filters(stmt, entity, pagination: PaginationParam):
+    """Apply the `search` and `filter` parameters shared by every list query."""
+    # Apply search filter if provided
+    if pagination.search:
+        search_term = pagination.search.split(":")
+        if len(search_term) == 2:
+            field, value = search_term
+            stmt = apply_field_search(stmt, entity, field, value)
+        else:
+            stmt = apply_search(stmt, entity, pagination.search)
+
+    # Apply structured filters if provided
+    if pagination.filter:
+        stmt = apply_filters(stmt, entity, pagination.filter)
+
+    return stmt
+
+
+def apply_sort(stmt, entity, pagination: PaginationParam, order_by_field=None):
+    """
+    Apply the `sort` parameter, `field[:asc|desc]` with desc as the default direction.
+
+    NULLs sort last in both directions and the id breaks ties, so OFFSET pages never overlap.
+    """
+    if pagination.sort:
+        sort_field, ascending = _resolve_sort(entity, pagination.sort, order_by_field)
+        stmt = stmt.order_by(*_sort_terms(sort_field, entity.id, ascending))
+    return stmt
+
+
+def _serialize(data_response_model, entities, fields: Optional[set[str]]) -> list:
+    """
+    Turn entities into response rows.
+
+    Response models exposing `to_dict` take the fast path: rows stay plain dicts and are never
+    validated into per-row Pydantic models; `_render` then encodes the envelope with orjson.
+    """
+    if fields is not None:
+        return serialize_partial(data_response_model, entities, fields)
+    if hasattr(data_response_model, "to_dict"):
+        return [data_response_model.to_dict(item) for item in entities]
+    return [data_response_model.from_entity(item) for item in entities]
+
+
+def _render(response: Union[PaginatedResponse, BaseResponse]):
+    """Encode envelopes of plain dict rows with orjson, skipping FastAPI's jsonable_encoder pass."""
+    if not response.data or not isinstance(response.data[0], dict):
+        return response
+    return RowsJSONResponse(content=dict(response))
+
+
+async def _count_total(session: AsyncSession, stmt) -> int:
+    """Count the rows of `stmt` with a separate `SELECT count(*)` round trip."""
+    result = await session.execute(select(func.count()).select_from(stmt.order_by(None).subquery()))
+    return result.scalar_one()
+
+
+async def _estimate_total(session: AsyncSession, stmt, entity) -> Optional[int]:
+    """
+    Read the planner row estimate from `pg_class.reltuples` for unfiltered lists.
+
+    Returns None when the list is filtered or the table has never been analyzed,
+    in which case the caller falls back to an exact count.
+    """
+    if stmt.whereclause is not None or entity is None:
+        return None
+
+    result = await session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table_name AS regclass)"),
+        {"table_name": entity.__tablename__}
+    )
+    estimate = result.scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return estimate
+
+
+def _resolve_sort(entity, sort: str, order_by_field=None):
+    """Split a `field[:direction]` sort term into the mapped column and an ascending flag."""
+    sort_term = sort.split(":")
+    if len(sort_term) == 2:
+        field, direction = sort_term
+    else:
+        field, direction = sort, "desc"
+
+    return getattr(entity, field, order_by_field), direction.lower() == "asc"
+
+
+def _is_nullable(sort_field) -> bool:
+    return getattr(getattr(sort_field, "expression", None), "nullable", True)
+
+
+def _sort_terms(sort_field, id_field, ascending: bool) -> tuple:
+    """
+    ORDER BY terms for a sort: NULLs last in both directions and the id as the tie-breaker.
+
+    ASC already puts NULLs last in Postgres, DESC only needs `NULLS LAST` on nullable columns,
+    so NOT NULL sorts keep matching their plain btree indexes.
+    """
+    if ascending:
+        return sort_field.asc(), id_field.asc()
+    if _is_nullable(sort_field):
+        return sort_field.desc().nulls_last(), id_field.desc()
+    return sort_field.desc(), id_field.desc()
+
+
+def _seek_predicate(sort_field, id_field, ascending: bool, sort_value, last_id):
+    """
+    Build the keyset predicate selecting rows strictly after (sort_value, last_id).
+
+    Rows are ordered by `_sort_terms`, NULLs last in both directions, so nullable sort
+    columns get an extra branch for the trailing NULL group.
+    """
+    after_id = id_field > last_id if ascending else id_field < last_id
+    if sort_value is None:
+        # Already inside the trailing NULL group
+        return and_(sort_field.is_(None), after_id)
+
+    if ascending:
+        predicate = tuple_(sort_field, id_field) > tuple_(sort_value, last_id)
+    else:
+        predicate = tuple_(sort_field, id_field) < tuple_(sort_value, last_id)
+    return or_(predicate, sort_field.is_(None)) if _is_nullable(sort_field) else predicate
+
+
+async def _fetch_keyset_page(
+        session: AsyncSession,
+        stmt,
+        entity,
+        pagination: PaginationParam,
+        data_response_model,
+        order_by_field,
+        message: str,
+        load_options: Optional[dict] = None,
+) -> PaginatedResponse:
+    """
+    Fetch one page by seeking past the cursor on the (sort_field, id) tuple.
+
+    No OFFSET and, unless `with_total` asks for one, no count query are issued,
+    so every page costs the same as the first one.
+    """
+    sort_field, ascending = _resolve_sort(entity, pagination.sort or "created_at", order_by_field)
+    sort_key = sort_field.key
+
+    total_mode = pagination.with_total or "false"
+    total_items, is_total_estimated = None, False
+    if total_mode == "estimated":
+        total_items = await _estimate_total(session, stmt, entity)
+        is_total_estimated = total_items is not None
+    if total_mode == "true" or (total_mode == "estimated" and total_items is None):
+        total_items = await _count_total(session, stmt)
+
+    if pagination.cursor:
+        try:
+            cursor_key, sort_value, last_id = decode_cursor(pagination.cursor, sort_field)
+        except ValueError:
+            raise CustomHTTPException(status_code=400, message="Invalid cursor")
+
+        if cursor_key != sort_key:
+            raise CustomHTTPException(status_code=400, message="Cursor does not match the requested sort")
+
+        stmt = stmt.where(_seek_predicate(sort_field, entity.id, ascending, sort_value, last_id))
+
+    # The sort column is read back to build the next cursor, so keep it in sparse selects
+    fields = parse_fields(pagination.fields)
+    stmt = apply_projection(stmt, entity, fields, load_options, extra_columns=[sort_field])
+
+    # The keyset order must be total and match the seek predicate, so drop any preset ordering
+    stmt = stmt.order_by(None).order_by(*_sort_terms(sort_field, entity.id, ascending))
+
+    # Fetch one extra row to know whether a next page exists; the sort value is selected alongside
+    # the entity, so sort keys on joined tables don't depend on a relationship being loaded
+    result = await session.execute(stmt.add_columns(sort_field.label("sort_value")).limit(pagination.limit + 1))
+    rows = result.all()
+    entities = [row[0] for row in rows]
+
+    next_cursor = None
+    if len(entities) > pagination.limit:
+        entities = entities[:pagination.limit]
+        last = rows[pagination.limit - 1]
+        next_cursor = encode_cursor(sort_key, last.sort_value, last[0].id)
+
+    await release_connection(session)
+    return _render(PaginatedResponse(
+        data=_serialize(data_response_model, entities, fields),
+        page=pagination.page,
+        limit=pagination.limit,
+        total_items=total_items,
+        total_pages=(total_items + pagination.limit - 1) // pagination.limit if total_items is not None else None,
+        is_total_estimated=is_total_estimated,
+        next_cursor=next_cursor,
+        message=message
+    ))
@@ -0,0 +1,78 @@
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.resource_version import ResourceVersion
+
+
+async def resource_version(session: AsyncSession, entities, rows=()) -> tuple[str, object]:
+    """
+    Cheap version of the data behind a resource, read in one statement.
+
+    `entities` are read from their `resource_versions` counters, which writes to the table move
+    on commit, so a list costs a primary key lookup per table whatever its size. `rows` are
+    `(entity, whereclause)` pairs scoping a detail to its own rows: their count (hard deletes)
+    and `max(coalesce(updated_at, created_at))` (inserts, updates and soft deletes), read through
+    the index behind the clause.
+    Returns the version string and the latest change timestamp.
+    """
+    columns = []
+    for entity in entities:
+        counter = select(ResourceVersion).where(ResourceVersion.table_name == entity.__tablename__)
+        columns.append(counter.with_only_columns(ResourceVersion.version).scalar_subquery())
+        columns.append(counter.with_only_columns(ResourceVersion.changed_at).scalar_subquery())
+    for entity, whereclause in rows:
+        columns.append(select(func.count()).select_from(entity).where(whereclause).scalar_subquery())
+        columns.append(
+            select(func.max(func.coalesce(entity.updated_at, entity.created_at))).where(whereclause).scalar_subquery()
+        )
+
+    row = (await session.execute(select(*columns))).one()
+    changes = [value for value in row[1::2] if value is not None]
+    return "|".join(str(value) for value in row), max(changes, default=None)
+
+
+async def conditional_get(
+        request: Request,
+        session: AsyncSession,
+        entities,
+        fetch: Callable[[], Awaitable],
+        rows=()
+) -> Response:
+    """
+    Serve a read-only endpoint with `ETag`/`Last-Modified` validators.
+
+    The ETag covers the resource version (see `resource_version` for `entities` and `rows`) and
+    the request path and query, so each page and filter combination validates on its own. A matching `If-None-Match` is answered
+    with 304 before `fetch` runs the main query.
+    """
+    version, last_modified = await resource_version(session, entities, rows)
+    digest = hashlib.sha1(f"{version}|{request.url.path}?{request.url.query}".encode()).hexdigest()
+    headers = {"ETag": f'W/"{digest}"'}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+
+    if _etag_matches(request.headers.get("if-none-match"), digest):
+        return Response(status_code=304, headers=headers)
+
+    result = await fetch()
+    if not isinstance(result, Response):
+        result = JSONResponse(content=jsonable_encoder(result))
+    result.headers.update(headers)
+    return result
+
+
+def _etag_matches(if_none_match, digest: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/").strip('"') for tag in if_none_match.split(",")}
+    return digest in candidates
@@ -5,10 +5,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.config.security import hash_password
+from app.config.session import release_connection
 from app.models.customer import Customer
+from app.models.user import User
 from app.responses.customer import CustomerResponse, CustomerDataResponse
 from app.responses.paginated_response import PaginationParam
 from app.services.base_service import fetch_paginated_data
+from app.services.export import stream_export
+
+
+def _list_load_options() -> dict:
+    """Relationship loaders for customer lists, keyed by the response keys they feed"""
+    return {
+        ("username", "email", "active"): joinedload(Customer.user),
+    }
 
 
 async def reset_password(customer_id: str, password: str, session: AsyncSession):
@@ -32,7 +42,14 @@ async def reset_password(customer_id: str, password: str, session: AsyncSession)
     user = customer.user
 
     print("Password: ", password)
-    user.password = hash_password(password)
+    # Hash without holding a connection, then lock and re-check the row in the write transaction
+    await release_connection(session)
+    hashed_password = await hash_password(password)
+    user = await session.get(User, user.id, with_for_update=True, populate_existing=True)
+    if user is None:
+        raise Exception("Customer not found")
+
+    user.password = hashed_password
     await session.commit()
 
     return {
@@ -56,11 +73,7 @@ async def get_customer(customer_id: str, session: AsyncSession) -> CustomerRespo
 
 
 async def get_customers(session: AsyncSession, pagination: PaginationParam):
-    stmt = (
-        select(Customer)
-        .options(joinedload(Customer.user))
-        .order_by(Customer.created_at.desc())
-    )
+    stmt = select(Customer).order_by(Customer.created_at.desc())
 
     return await fetch_paginated_data(
         session=session,
@@ -69,5 +82,19 @@ async def get_customers(session: AsyncSession, pagination: PaginationParam):
         pagination=pagination,
         data_response_model=CustomerDataResponse,
         order_by_field=Customer.created_at,
-        message="Customers fetched successfully."
+        message="Customers fetched successfully.",
+        load_options=_list_load_options()
+    )
+
+
+def export_customers(pagination: PaginationParam, export_format: str):
+    return stream_export(
+        stmt=select(Customer).order_by(Customer.created_at.desc()),
+        entity=Customer,
+        pagination=pagination,
+        data_response_model=CustomerDataResponse,
+        order_by_field=Customer.created_at,
+        load_options=_list_load_options(),
+        export_format=export_format,
+        filename="customers"
     )
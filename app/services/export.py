@@ -0,0 +1,100 @@
+import csv
+import io
+import logging
+from typing import Optional
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from app.config.custom_exceptions import CustomHTTPException
+from app.config.database import async_session_maker
+from app.responses.paginated_response import PaginationParam
+from app.services.base_service import apply_search_and_filters, apply_sort
+from app.services.projection import apply_projection
+from app.utils import encoding
+
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def stream_export(
+        stmt=None,
+        entity=None,
+        pagination: PaginationParam = PaginationParam(),
+        data_response_model=None,
+        order_by_field=None,
+        load_options: Optional[dict] = None,
+        export_format: str = "ndjson",
+        filename: str = "export",
+) -> StreamingResponse:
+    """
+    Stream every row matching the list parameters as NDJSON or CSV.
+
+    Rows are read through a server-side cursor in batches of `EXPORT_BATCH_SIZE` and written
+    out batch by batch, so worker memory stays flat regardless of the table size. The stream
+    owns its session: request-scoped sessions are closed before a streaming body is sent.
+    """
+    export_format = export_format.lower()
+    if export_format not in EXPORT_MEDIA_TYPES:
+        raise CustomHTTPException(status_code=400, message=f"Unsupported export format: {export_format}")
+
+    if stmt is None:
+        stmt = select(entity)
+    stmt = apply_search_and_filters(stmt, entity, pagination)
+    stmt = apply_sort(stmt, entity, pagination, order_by_field)
+    stmt = apply_projection(stmt, entity, None, load_options)
+    stmt = stmt.execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+    encode = _encode_ndjson if export_format == "ndjson" else _encode_csv
+
+    async def iter_batches():
+        async with async_session_maker() as session:
+            result = await session.stream_scalars(stmt)
+            header_written = False
+            async for partition in result.partitions():
+                rows = [_to_row(data_response_model, item) for item in partition]
+                yield encode(rows, not header_written)
+                header_written = True
+
+    return StreamingResponse(
+        iter_batches(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'}
+    )
+
+
+def _to_row(data_response_model, item) -> dict:
+    if hasattr(data_response_model, "to_dict"):
+        return data_response_model.to_dict(item)
+    return data_response_model.from_entity(item).model_dump(mode="json")
+
+
+def _encode_ndjson(rows: list[dict], _with_header: bool) -> bytes:
+    return b"".join(encoding.dumps(row) + b"\n" for row in rows)
+
+
+def _encode_csv(rows: list[dict], with_header: bool) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if with_header and rows:
+        writer.writerow(rows[0].keys())
+    for row in rows:
+        writer.writerow(_csv_value(value) for value in row.values())
+    return buffer.getvalue().encode()
+
+
+def _csv_value(value):
+    """Flatten nested values: key/value pairs export their value, lists export as JSON."""
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return value.get("value", encoding.dumps(value).decode())
+    if isinstance(value, list):
+        return encoding.dumps(value).decode()
+    return value
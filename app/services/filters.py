@@ -0,0 +1,105 @@
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy import and_
+
+from app.config.custom_exceptions import CustomHTTPException
+from app.constants.filter_operators import FilterOperators
+
+
+def apply_filters(stmt, entity, filter_expr: str):
+    """
+    Compile a `field:op:value[,field:op:value...]` filter expression into WHERE predicates.
+
+    Only fields and operators declared in the model's `__filterable_columns__` are accepted.
+    Values are coerced to the column type and bound as parameters, so the predicates stay
+    plain column comparisons that Postgres can serve from an index.
+
+    - `in` takes `|` separated values, e.g. `order_status:in:pending|accepted`
+    - `between` takes an inclusive `low..high` range, e.g. `amount:between:10..500`
+    - `isnull` takes `true` or `false`
+    - datetimes are ISO 8601; values with an offset are converted to UTC
+    """
+    filterable = getattr(entity, "__filterable_columns__", {})
+    predicates = []
+
+    for term in filter_expr.split(","):
+        term = term.strip()
+        if not term:
+            continue
+
+        parts = term.split(":", 2)
+        if len(parts) != 3:
+            raise CustomHTTPException(status_code=400, message=f"Invalid filter '{term}', expected field:op:value")
+
+        field, op, raw_value = parts
+        op = op.lower()
+        if field not in filterable:
+            raise CustomHTTPException(status_code=400, message=f"Field '{field}' is not filterable")
+        if op not in filterable[field]:
+            raise CustomHTTPException(status_code=400, message=f"Operator '{op}' is not allowed on '{field}'")
+
+        column = getattr(entity, field)
+        try:
+            predicates.append(_build_predicate(column, op, raw_value))
+        except (ValueError, ArithmeticError):
+            raise CustomHTTPException(status_code=400, message=f"Invalid value '{raw_value}' for '{field}'")
+
+    if predicates:
+        stmt = stmt.where(and_(*predicates))
+    return stmt
+
+
+def _build_predicate(column, op: str, raw_value: str):
+    if op == FilterOperators.IS_NULL:
+        is_null = _coerce(bool, raw_value)
+        return column.is_(None) if is_null else column.isnot(None)
+
+    python_type = column.type.python_type
+
+    if op == FilterOperators.IN:
+        return column.in_([_coerce(python_type, value) for value in raw_value.split("|")])
+
+    if op == FilterOperators.BETWEEN:
+        low, separator, high = raw_value.partition("..")
+        if not separator:
+            raise ValueError(raw_value)
+        return column.between(_coerce(python_type, low), _coerce(python_type, high))
+
+    value = _coerce(python_type, raw_value)
+    if op == FilterOperators.EQ:
+        return column == value
+    if op == FilterOperators.NE:
+        return column != value
+    if op == FilterOperators.GT:
+        return column > value
+    if op == FilterOperators.GTE:
+        return column >= value
+    if op == FilterOperators.LT:
+        return column < value
+    return column <= value
+
+
+def _coerce(python_type, raw_value: str):
+    """Convert a filter value from the query string into the column's Python type."""
+    raw_value = raw_value.strip()
+    if python_type is bool:
+        if raw_value.lower() in ("true", "1"):
+            return True
+        if raw_value.lower() in ("false", "0"):
+            return False
+        raise ValueError(raw_value)
+    if python_type is datetime:
+        value = datetime.fromisoformat(raw_value)
+        # DateTime columns are naive UTC, asyncpg refuses to bind an aware value to them
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+    if python_type is date:
+        return date.fromisoformat(raw_value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(raw_value)
+    if python_type in (int, float, Decimal):
+        return python_type(raw_value)
+    return raw_value
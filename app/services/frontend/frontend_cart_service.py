@@ -216,33 +216,39 @@ async def remove_all_carts(user, session: AsyncSession):
 async def add_all_carts(req: list[CartRequest], user, session: AsyncSession):
     logger.info("Adding carts...")
     try:
-        # Check if cart items already exist for the user
-        stmt = (select(Cart).where(Cart.user_id == user.id))
+        # Check qty first if is null or less than 1 then raise error
+        if any(not cart_req.qty or cart_req.qty < 1 for cart_req in req):
+            logger.error("Quantity must be greater than 0")
+            return FrontendCartResponse(
+                data=None,
+                message="Quantity must be greater than 0"
+            )
+
+        product_price_ids = {cart_req.product_price_id for cart_req in req}
+
+        # Load every requested product price in one statement
+        stmt = (select(ProductPrice).options(
+            selectinload(ProductPrice.product),
+            selectinload(ProductPrice.product).selectinload(Product.brand),
+            selectinload(ProductPrice.product).selectinload(Product.category),
+            selectinload(ProductPrice.color)
+        ).where(ProductPrice.id.in_(product_price_ids)))
         result = await session.execute(stmt)
-        existing_carts = result.scalars().all()
+        product_prices = {str(product_price.id): product_price for product_price in result.scalars().all()}
 
-        # Create a dictionary of existing cart items for easy access
-        existing_cart_dict = {cart.product_price_id: cart for cart in existing_carts}
+        # Check if cart items already exist for the user and the requested product prices
+        stmt = (select(Cart).where(
+            Cart.user_id == user.id,
+            Cart.product_price_id.in_(product_price_ids)
+        ))
+        result = await session.execute(stmt)
+        existing_cart_dict = {str(cart.product_price_id): cart for cart in result.scalars().all()}
 
         new_carts = []
         for cart_req in req:
-            # Check qty first if is null or less than 1 then raise error
-            if not cart_req.qty or cart_req.qty < 1:
-                logger.error("Quantity must be greater than 0")
-                return FrontendCartResponse(
-                    data=None,
-                    message="Quantity must be greater than 0"
-                )
-
-            # Check if product_price_id exists
-            stmt = (select(ProductPrice).options(
-                selectinload(ProductPrice.product),
-                selectinload(ProductPrice.product).selectinload(Product.brand),
-                selectinload(ProductPrice.product).selectinload(Product.category),
-                selectinload(ProductPrice.color)
-            ).where(ProductPrice.id == cart_req.product_price_id))
-            result = await session.execute(stmt)
-            product_price = result.scalar()
+            # product_price_id may arrive as a string or a UUID
+            key = str(cart_req.product_price_id)
+            product_price = product_prices.get(key)
 
             if product_price is None:
                 logger.error("Product price not found")
@@ -251,30 +257,21 @@ async def add_all_carts(req: list[CartRequest], user, session: AsyncSession):
                     message="Product price not found"
                 )
 
-            product = product_price.product
-
             # Check if product exists or not
-            if product is None:
+            if product_price.product is None:
                 logger.error("Product not found")
                 return FrontendCartResponse(
                     data=None,
                     message="Product not found"
                 )
 
-            # Check if cart item already exists for the user and product price
-            stmt = (select(Cart).where(
-                Cart.user_id == user.id,
-                Cart.product_price_id == cart_req.product_price_id
-            ))
-            result = await session.execute(stmt)
-            existing_cart = result.scalar()
+            existing_cart = existing_cart_dict.get(key)
 
             if existing_cart:
                 # Update the quantity of the existing cart item
                 existing_cart.qty += cart_req.qty
                 existing_cart.updated_by = user.id
-                session.add(existing_cart)
-                await session.refresh(existing_cart, ['product_price'])
+                existing_cart.product_price = product_price
 
                 logger.info("Cart updated successfully")
                 new_carts.append(existing_cart)
@@ -286,10 +283,11 @@ async def add_all_carts(req: list[CartRequest], user, session: AsyncSession):
                     qty=cart_req.qty
                 )
                 new_cart.created_by = user.id
+                new_cart.product_price = product_price
 
                 session.add(new_cart)
-                await session.commit()
-                await session.refresh(new_cart, ['product_price'])
+                # A repeated product price in the same request adds to this cart
+                existing_cart_dict[key] = new_cart
 
                 logger.info("Cart added successfully")
                 new_carts.append(new_cart)
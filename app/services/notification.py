@@ -2,7 +2,8 @@ import datetime
 import logging
 
 import sqlalchemy as sa
-from sqlalchemy import select, insert, and_
+from sqlalchemy import select, and_, literal
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -102,20 +103,17 @@ class NotificationService:
             else:
                 target_condition = Notification.target == f'customer:{user_id}'
 
-            stmt = (
-                select(Notification)
-                .options(joinedload(Notification.seen_users))
-                .where(target_condition)
+            # One INSERT ... SELECT for every target notification, rows already seen are skipped
+            insert_stmt = (
+                insert(notification_seen_users)
+                .from_select(
+                    ["notification_id", "user_id"],
+                    select(Notification.id, literal(user_id, notification_seen_users.c.user_id.type))
+                    .where(target_condition)
+                )
+                .on_conflict_do_nothing()
             )
-
-            result = await self.session.execute(stmt)
-            notifications = result.scalars().unique().all()
-
-            for notification in notifications:
-                if user_id not in [user.id for user in notification.seen_users]:
-                    insert_stmt = (insert(notification_seen_users)
-                                   .values(notification_id=notification.id, user_id=user_id))
-                    await self.session.execute(insert_stmt)
+            await self.session.execute(insert_stmt)
 
             await self.session.commit()
             logger.debug("All notifications marked as seen")
@@ -19,20 +19,26 @@ from app.responses.order_history import OrderListHistoryResponse
 from app.responses.paginated_response import PaginationParam
 from app.schemas.notification import NotificationRequest
 from app.services.base_service import fetch_paginated_data
+from app.services.export import stream_export
 from app.services.notification import NotificationService
 from app.services.order_history import create_order_history
 
 logger = logging.getLogger(__name__)
 
 
+def _list_load_options() -> dict:
+    """Relationship loaders for order lists, keyed by the response key they feed"""
+    return {
+        "customer": selectinload(Order.customer),
+        "location": selectinload(Order.location),
+        "payment_method": selectinload(Order.payment_method),
+        "staff": selectinload(Order.staff),
+    }
+
+
 async def get_orders(session: AsyncSession, pagination: PaginationParam, current_user=None):
     try:
-        stmt = select(Order).options(
-            selectinload(Order.customer),
-            selectinload(Order.location),
-            selectinload(Order.payment_method),
-            selectinload(Order.staff)
-        ).order_by(Order.created_at.desc())
+        stmt = select(Order).order_by(Order.created_at.desc())
 
         if current_user is not None:
             stmt = stmt.where(Order.created_by == current_user.id)
@@ -44,7 +50,8 @@ async def get_orders(session: AsyncSession, pagination: PaginationParam, current
             pagination=pagination,
             data_response_model=OrderDataResponse,
             order_by_field=Order.created_at,
-            message="Orders fetched successfully"
+            message="Orders fetched successfully",
+            load_options=_list_load_options()
         )
     except Exception as e:
         # Handle the exception (e.g., log it, return an error response, etc.)
@@ -55,6 +62,19 @@ async def get_orders(session: AsyncSession, pagination: PaginationParam, current
         }
 
 
+def export_orders(pagination: PaginationParam, export_format: str):
+    return stream_export(
+        stmt=select(Order).order_by(Order.created_at.desc()),
+        entity=Order,
+        pagination=pagination,
+        data_response_model=OrderDataResponse,
+        order_by_field=Order.created_at,
+        load_options=_list_load_options(),
+        export_format=export_format,
+        filename="orders"
+    )
+
+
 async def get_order(order_id_or_number, session: AsyncSession, current_user=None):
     try:
         stmt = select(Order).options(
@@ -1,45 +1,260 @@
 import logging
-
-from sqlalchemy import and_
-from sqlalchemy import select
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, insert, update, delete, func, tuple_, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, contains_eager
 
+from app.config.custom_exceptions import CustomHTTPException
+from app.config.catalog_cache import (
+    cached, mark_catalog_changed, PRODUCT_NAMESPACE, PRODUCT_PAGE_NAMESPACE, PRODUCT_FACET_NAMESPACE
+)
 from app.config.settings import get_settings
 from app.models.brand import Brand
+from app.models.cart import Cart
 from app.models.category import Category
 from app.models.color import Color
 from app.models.product import Product
+from app.models.product_listing import ProductListing
 from app.models.product_price import ProductPrice
 from app.responses.paginated_response import PaginationParam
-from app.responses.product import ProductDataResponse, ProductResponse
-from app.schemas.product import ProductRequest
-from app.services.base_service import fetch_paginated_data
+from app.responses.product import (
+    ProductDataResponse, ProductListingDataResponse, ProductResponse, ProductFacetsDataResponse, ProductFacetsResponse
+)
+from app.schemas.product import ProductRequest, PriceRangeParam
+from app.services.base_service import fetch_paginated_data, apply_search_and_filters
+from app.services.export import stream_export
+from app.services.product_listing import refresh_product_listings
 
 settings = get_settings()
 
 
+def _product_list_stmt(*columns, by_price: bool = False):
+    """
+    Product list statement joined to the listing row, so `sort=price` and price ranges resolve.
+
+    Price sorts and ranges use an INNER join, so the planner can start from the listing price
+    indexes and take the order from them; every product has a listing row. Other lists keep
+    the OUTER join.
+    """
+    stmt = select(*(columns or (Product,)))
+    if by_price:
+        return stmt.join(ProductListing, ProductListing.product_id == Product.id)
+    return stmt.outerjoin(ProductListing, ProductListing.product_id == Product.id)
+
+
+def _by_price(pagination: PaginationParam, price_range: Optional[PriceRangeParam] = None) -> bool:
+    """True when the list is sorted or filtered by the listing price"""
+    sorts_by_price = (pagination.sort or "").split(":")[0] == "price"
+    filters_by_price = price_range is not None and (price_range.price_min is not None or price_range.price_max is not None)
+    return sorts_by_price or filters_by_price
+
+
+def _apply_price_range(stmt, price_range: PriceRangeParam):
+    """Keep products whose variant price span overlaps the range, served by the listing price index"""
+    if (
+            price_range.price_min is not None and price_range.price_max is not None
+            and price_range.price_min > price_range.price_max
+    ):
+        raise CustomHTTPException(status_code=400, message="price_min cannot be greater than price_max")
+    if price_range.price_min is not None:
+        stmt = stmt.where(ProductListing.max_price >= price_range.price_min)
+    if price_range.price_max is not None:
+        stmt = stmt.where(ProductListing.min_price <= price_range.price_max)
+    return stmt
+
+
+def _list_load_options() -> dict:
+    """Relationship loaders for product lists, keyed by the response key they feed"""
+    return {
+        "category": selectinload(Product.category),
+        "brand": selectinload(Product.brand),
+        # Load the color for product prices
+        "product_prices": selectinload(Product.product_prices).selectinload(ProductPrice.color),
+    }
+
+
 async def get_products(session: AsyncSession, pagination: PaginationParam):
-    stmt = (
-        select(Product).options(
-            selectinload(Product.category),
-            selectinload(Product.brand),
-            selectinload(Product.product_prices).selectinload(ProductPrice.color)  # Load the color for product prices
-        ).order_by(Product.created_at.desc())
+    body = await cached(
+        PRODUCT_PAGE_NAMESPACE, pagination.model_dump_json(), session,
+        lambda fill: _fetch_product_page(fill, pagination)
     )
+    return Response(content=body, media_type="application/json")
+
+
+async def _fetch_product_page(session: AsyncSession, pagination: PaginationParam) -> bytes:
+    """The encoded list page, cached as bytes so hits skip both the queries and the serialization"""
+    stmt = _product_list_stmt(by_price=_by_price(pagination))
 
-    return await fetch_paginated_data(
+    result = await fetch_paginated_data(
         session=session,
         stmt=stmt,
         entity=Product,
         pagination=pagination,
         data_response_model=ProductDataResponse,
         order_by_field=Product.created_at,
-        message="Products fetched successfully"
+        message="Products fetched successfully",
+        load_options=_list_load_options()
+    )
+    if isinstance(result, Response):
+        return result.body
+    return ORJSONResponse(content=jsonable_encoder(result)).body
+
+
+def _listing_load_options() -> dict:
+    """Loaders for listing cards, the price, color and rating aggregates come from one joined row"""
+    return {
+        "category": selectinload(Product.category),
+        "brand": selectinload(Product.brand),
+        # The listing row is already joined by _product_list_stmt
+        ("min_price", "max_price", "color_ids", "variant_count", "avg_rate", "rate_count"): contains_eager(Product.listing),
+    }
+
+
+async def get_product_listings(session: AsyncSession, pagination: PaginationParam,
+                               price_range: PriceRangeParam = PriceRangeParam()):
+    """Storefront product list served from the `product_listings` read model"""
+    body = await cached(
+        PRODUCT_PAGE_NAMESPACE, f"listing:{pagination.model_dump_json()}:{price_range.model_dump_json()}", session,
+        lambda fill: _fetch_product_listing_page(fill, pagination, price_range)
+    )
+    return Response(content=body, media_type="application/json")
+
+
+async def _fetch_product_listing_page(session: AsyncSession, pagination: PaginationParam,
+                                      price_range: PriceRangeParam) -> bytes:
+    result = await fetch_paginated_data(
+        session=session,
+        stmt=_apply_price_range(_product_list_stmt(by_price=_by_price(pagination, price_range)), price_range),
+        entity=Product,
+        pagination=pagination,
+        data_response_model=ProductListingDataResponse,
+        order_by_field=Product.created_at,
+        message="Products fetched successfully",
+        load_options=_listing_load_options()
+    )
+    if isinstance(result, Response):
+        return result.body
+    return ORJSONResponse(content=jsonable_encoder(result)).body
+
+
+def _price_bucket_edges() -> list[float]:
+    return sorted(float(edge) for edge in settings.CATALOG_PRICE_BUCKETS.split(",") if edge.strip())
+
+
+async def get_product_facets(session: AsyncSession, pagination: PaginationParam,
+                             price_range: PriceRangeParam = PriceRangeParam()) -> ProductFacetsResponse:
+    """
+    Product counts per category, brand, color and price bucket for the current `search`, `filter` and price range.
+
+    Only those parameters shape the counts, so they form the cache key. A product counts once
+    in every color and price bucket where it has at least one variant.
+    """
+    signature = f"{pagination.search}|{pagination.filter}|{price_range.price_min}|{price_range.price_max}"
+    data = await cached(
+        PRODUCT_FACET_NAMESPACE, signature, session,
+        lambda fill: _fetch_product_facets(fill, pagination, price_range)
+    )
+    return ProductFacetsResponse(data=data, message="Product facets fetched successfully")
+
+
+async def _fetch_product_facets(session: AsyncSession, pagination: PaginationParam,
+                                price_range: PriceRangeParam) -> ProductFacetsDataResponse:
+    edges = _price_bucket_edges()
+    filtered = apply_search_and_filters(
+        _apply_price_range(
+            _product_list_stmt(Product.id, Product.category_id, Product.brand_id, by_price=_by_price(pagination, price_range)),
+            price_range
+        ),
+        Product, pagination
+    ).order_by(None).subquery()
+    # 1-based index of the bucket whose lower edge is the highest one at or below the price, 0 below the first.
+    # The edges are floats parsed from settings and inlined, so GROUP BY matches the expression textually.
+    thresholds = literal_column(f"ARRAY[{', '.join(repr(edge) for edge in edges)}]::float8[]")
+    bucket = func.width_bucket(ProductPrice.price, thresholds).label("bucket")
+
+    # One grouped scan, each grouping set yields one facet and the empty set the total
+    stmt = (
+        select(
+            Category.id.label("category_id"), Category.name.label("category_name"),
+            Brand.id.label("brand_id"), Brand.name.label("brand_name"),
+            Color.id.label("color_id"), Color.name.label("color_name"),
+            bucket,
+            func.grouping(Category.id, Brand.id, Color.id, bucket).label("grouping"),
+            func.count(filtered.c.id.distinct()).label("count"),
+        )
+        .select_from(filtered)
+        .outerjoin(Category, Category.id == filtered.c.category_id)
+        .outerjoin(Brand, Brand.id == filtered.c.brand_id)
+        .outerjoin(ProductPrice, ProductPrice.product_id == filtered.c.id)
+        .outerjoin(Color, Color.id == ProductPrice.color_id)
+        .group_by(func.grouping_sets(
+            tuple_(Category.id, Category.name),
+            tuple_(Brand.id, Brand.name),
+            tuple_(Color.id, Color.name),
+            bucket,
+            tuple_(),
+        ))
+    )
+    rows = (await session.execute(stmt)).all()
+
+    # GROUPING() bits, most significant first: category, brand, color, bucket; a set bit means not grouped by
+    facets = {"total": 0, "categories": [], "brands": [], "colors": [], "price_buckets": []}
+    for row in rows:
+        if row.grouping == 0b1111:
+            facets["total"] = row.count
+        elif row.grouping == 0b0111 and row.category_id is not None:
+            facets["categories"].append({"key": str(row.category_id), "value": row.category_name, "count": row.count})
+        elif row.grouping == 0b1011 and row.brand_id is not None:
+            facets["brands"].append({"key": str(row.brand_id), "value": row.brand_name, "count": row.count})
+        elif row.grouping == 0b1101 and row.color_id is not None:
+            facets["colors"].append({"key": str(row.color_id), "value": row.color_name, "count": row.count})
+        elif row.grouping == 0b1110 and row.bucket:
+            upper = edges[row.bucket] if row.bucket < len(edges) else None
+            facets["price_buckets"].append({"min": edges[row.bucket - 1], "max": upper, "count": row.count})
+
+    for key in ("categories", "brands", "colors"):
+        facets[key].sort(key=lambda facet: (-facet["count"], facet["value"] or ""))
+    facets["price_buckets"].sort(key=lambda facet: facet["min"])
+    return ProductFacetsDataResponse(**facets)
+
+
+def export_products(pagination: PaginationParam, export_format: str):
+    return stream_export(
+        stmt=_product_list_stmt(by_price=_by_price(pagination)),
+        entity=Product,
+        pagination=pagination,
+        data_response_model=ProductDataResponse,
+        order_by_field=Product.created_at,
+        load_options=_list_load_options(),
+        export_format=export_format,
+        filename="products"
     )
 
 
 async def get_product(product_id: str, session: AsyncSession) -> ProductResponse:
+    data = await cached(
+        PRODUCT_NAMESPACE, str(product_id), session, lambda fill: _fetch_product_data(product_id, fill)
+    )
+
+    if data is None:
+        return ProductResponse(
+            data=None,
+            message="Product not found"
+        )
+
+    return ProductResponse(
+        data=data,
+        message="Product fetched successfully"
+    )
+
+
+async def _fetch_product_data(product_id: str, session: AsyncSession):
     stmt = (
         select(Product).options(
             selectinload(Product.category),
@@ -50,19 +265,13 @@ async def get_product(product_id: str, session: AsyncSession) -> ProductResponse
     result = await session.execute(stmt)
     product = result.scalars().first()
 
-    if product is None:
-        return ProductResponse(
-            data=None,
-            message="Product not found"
-        )
-
-    return ProductResponse.from_entity(product)
+    return ProductDataResponse.from_entity(product) if product else None
 
 
 async def create_product(req: ProductRequest, session: AsyncSession) -> ProductResponse:
     try:
-        await validate_category(req.category_id, session)
-        await validate_brand(req.brand_id, session)
+        category = await validate_category(req.category_id, session)
+        brand = await validate_brand(req.brand_id, session)
 
         if await validate_product_name(req.name, session):
             return ProductResponse(
@@ -70,6 +279,8 @@ async def create_product(req: ProductRequest, session: AsyncSession) -> ProductR
                 message="Product already exists"
             )
 
+        colors = await validate_colors(req.product_prices, session)
+
         product = Product(
             name=req.name,
             description=req.description,
@@ -80,18 +291,14 @@ async def create_product(req: ProductRequest, session: AsyncSession) -> ProductR
         session.add(product)
         await session.flush()
 
-        product_prices = await validate_and_add_product_prices(req.product_prices, product.id, session)
-        session.add_all(product_prices)
-        await session.flush()
-
-        await session.refresh(product, attribute_names=["category", "brand", "product_prices"])
-        for product_price in product.product_prices:
-            await session.refresh(product_price, attribute_names=["color"])
+        diff = diff_product_prices(product.id, req.product_prices, existing_product_prices=[])
+        await apply_product_price_diff(diff, session)
+        await refresh_product_listings(session, [product.id])
 
         await session.commit()
 
         return ProductResponse(
-            data=ProductDataResponse.from_entity(product),
+            data=_product_data(product, category, brand, diff.final_prices, colors),
             message="Product created successfully"
         )
     except ValueError as e:
@@ -107,11 +314,7 @@ async def create_product(req: ProductRequest, session: AsyncSession) -> ProductR
 
 async def update_product(product_id: str, req: ProductRequest, session: AsyncSession) -> ProductResponse:
     try:
-        stmt = select(Product).options(
-            selectinload(Product.category),
-            selectinload(Product.brand),
-            selectinload(Product.product_prices).selectinload(ProductPrice.color)
-        ).where(Product.id == product_id)
+        stmt = select(Product).options(selectinload(Product.product_prices)).where(Product.id == product_id)
         result = await session.execute(stmt)
         product = result.scalar()
 
@@ -121,8 +324,9 @@ async def update_product(product_id: str, req: ProductRequest, session: AsyncSes
                 message="Product not found"
             )
 
-        await validate_category(req.category_id, session)
-        await validate_brand(req.brand_id, session)
+        category = await validate_category(req.category_id, session)
+        brand = await validate_brand(req.brand_id, session)
+        colors = await validate_colors(req.product_prices, session)
 
         product.name = req.name
         product.description = req.description
@@ -130,64 +334,17 @@ async def update_product(product_id: str, req: ProductRequest, session: AsyncSes
         product.category_id = req.category_id
         product.brand_id = req.brand_id
 
-        # Collect existing ProductPrice IDs
-        existing_product_price_ids = {pp.id for pp in product.product_prices}
-
-        # Validate and process new and updated ProductPrice entries
-        new_product_prices = await validate_and_add_product_prices(
-            req.product_prices,
-            product.id,
-            session,
-            existing_product_price_ids
-        )
-
-        # Handle updates to existing ProductPrice entries
-        for product_price_request in req.product_prices:
-            stmt = select(ProductPrice).where(
-                and_(
-                    ProductPrice.product_id == product.id,
-                    ProductPrice.color_id == product_price_request.color_id
-                )
-            )
-            result = await session.execute(stmt)
-            existing_product_price = result.scalar()
-
-            if existing_product_price:
-                if existing_product_price.id in existing_product_price_ids:
-                    # Update existing ProductPrice
-                    existing_product_price.size = product_price_request.size
-                    existing_product_price.price = product_price_request.price
-                    existing_product_price_ids.remove(existing_product_price.id)
-            else:
-                # If not found, it should be a new ProductPrice entry
-                new_product_prices.append(ProductPrice(
-                    product_id=product.id,
-                    color_id=product_price_request.color_id,
-                    size=product_price_request.size,
-                    price=product_price_request.price
-                ))
-
-        # Delete product prices that are no longer valid
-        for product_price_id in existing_product_price_ids:
-            stmt = select(ProductPrice).where(ProductPrice.id == product_price_id)
-            result = await session.execute(stmt)
-            product_price = result.scalar()
-            if product_price:
-                await session.delete(product_price)
-
-        # Add new ProductPrice entries
-        session.add_all(new_product_prices)
-        await session.flush()
-
-        # Refresh the product with relationships, including product_prices
-        await session.refresh(product, attribute_names=["category", "brand", "product_prices"])
-        for product_price in product.product_prices:
-            await session.refresh(product_price, attribute_names=["color"])
+        diff = diff_product_prices(product.id, req.product_prices, product.product_prices)
+        await apply_product_price_diff(diff, session)
+        # The bulk statements never reach the cache's flush hook, and a variants-only change
+        # leaves the product itself clean, so drop its detail and the list pages explicitly
+        mark_catalog_changed(session, [product.id])
+        await refresh_product_listings(session, [product.id])
 
         await session.commit()
 
         return ProductResponse(
-            data=ProductDataResponse.from_entity(product),
+            data=_product_data(product, category, brand, diff.final_prices, colors),
             message="Product updated successfully"
         )
     except ValueError as e:
@@ -241,68 +398,118 @@ async def validate_brand(brand_id: str, session: AsyncSession) -> Brand:
     return brand
 
 
-async def validate_color(color_id: str, session: AsyncSession) -> Color:
-    stmt = select(Color).where(Color.id == color_id)
-    result = await session.execute(stmt)
-    color = result.scalar()
-    if not color:
-        raise ValueError(f"Invalid color_id: {color_id}. Color does not exist.")
-    return color
+async def validate_colors(req_prices, session: AsyncSession) -> dict:
+    """Load every color the variants reference with one IN query, keyed by id."""
+    # validate product must not empty
+    if not req_prices:
+        raise ValueError("Product prices cannot be empty.")
+
+    color_ids = {product_price_request.color_id for product_price_request in req_prices}
+    result = await session.execute(select(Color).where(Color.id.in_(color_ids)))
+    colors = {color.id: color for color in result.scalars()}
+
+    seen_colors = set()
+    for product_price_request in req_prices:
+        color_id = product_price_request.color_id
+        if color_id not in colors:
+            raise ValueError(f"Invalid color_id: {color_id}. Color does not exist.")
+        if color_id in seen_colors:
+            raise ValueError(f"Product price already exists with the same color {colors[color_id].name} and product.")
+        seen_colors.add(color_id)
+    return colors
 
 
 async def validate_product_name(name: str, session: AsyncSession) -> Product:
-    stmt = select(Product).options(
-        selectinload(Product.category),
-        selectinload(Product.brand),
-        selectinload(Product.product_prices).selectinload(ProductPrice.color)
-    ).where(Product.name == name)
+    stmt = select(Product).where(Product.name == name)
     result = await session.execute(stmt)
     return result.scalar()
 
 
-async def validate_and_add_product_prices(
-        req_prices,
-        product_id,
-        session: AsyncSession,
-        existing_product_prices_ids=None
-):
-    product_prices = []
-    if existing_product_prices_ids is None:
-        existing_product_prices_ids = set()
+@dataclass
+class ProductPriceDiff:
+    """Variant changes of one product, as rows for the bulk statements."""
+    inserts: list = field(default_factory=list)
+    updates: list = field(default_factory=list)
+    delete_ids: list = field(default_factory=list)
+    # (id, color_id, size, price) of every variant once the diff is applied, in request order
+    final_prices: list = field(default_factory=list)
 
-    # validate product must not empty
-    if not req_prices:
-        raise ValueError("Product prices cannot be empty.")
 
-    for product_price_request in req_prices:
-        color = await validate_color(product_price_request.color_id, session)
+def diff_product_prices(product_id, req_prices, existing_product_prices) -> ProductPriceDiff:
+    """
+    Match the requested variants to the existing ones by color, colors are validated and unique.
 
-        # Check if the ProductPrice entry already exists
-        stmt = select(ProductPrice).where(
-            and_(
-                ProductPrice.product_id == product_id,
-                ProductPrice.color_id == product_price_request.color_id
-            )
-        )
-        result = await session.execute(stmt)
-        existing_product_price = result.scalar()
+    A requested color that already has a variant updates it when size or price changed,
+    a new color is inserted and existing colors missing from the request are deleted.
+    """
+    diff = ProductPriceDiff()
+    existing_by_color = {product_price.color_id: product_price for product_price in existing_product_prices}
+    seen_colors = set()
 
-        if existing_product_price:
-            if existing_product_price.id not in existing_product_prices_ids:
-                # If it exists but is not in the list of IDs to update, raise an error
-                raise ValueError(f"Product price already exists with the same color {color.name} and product.")
-            # If it exists and is part of the IDs to update, no need to add to new entries
+    for product_price_request in req_prices:
+        color_id = product_price_request.color_id
+        seen_colors.add(color_id)
+
+        existing = existing_by_color.get(color_id)
+        if existing is None:
+            row = {
+                "id": uuid.uuid4(),
+                "product_id": product_id,
+                "color_id": color_id,
+                "size": product_price_request.size,
+                "price": product_price_request.price,
+            }
+            diff.inserts.append(row)
+            diff.final_prices.append((row["id"], color_id, row["size"], row["price"]))
             continue
 
-        # Add new ProductPrice to the list
-        product_prices.append(ProductPrice(
-            product_id=product_id,
-            color_id=product_price_request.color_id,
-            size=product_price_request.size,
-            price=product_price_request.price
-        ))
-
-    if not product_prices and not existing_product_prices_ids:
-        raise ValueError("Product prices cannot be empty.")
-
-    return product_prices
+        if (existing.size, existing.price) != (product_price_request.size, product_price_request.price):
+            diff.updates.append({
+                "id": existing.id,
+                "size": product_price_request.size,
+                "price": product_price_request.price,
+            })
+        diff.final_prices.append((existing.id, color_id, product_price_request.size, product_price_request.price))
+
+    diff.delete_ids = [
+        product_price.id for color_id, product_price in existing_by_color.items() if color_id not in seen_colors
+    ]
+    return diff
+
+
+async def apply_product_price_diff(diff: ProductPriceDiff, session: AsyncSession):
+    """Apply a variant diff with at most one statement per kind of change."""
+    if diff.delete_ids:
+        # Carts keep their rows with the variant unset, as the ORM delete used to do
+        await session.execute(
+            update(Cart).where(Cart.product_price_id.in_(diff.delete_ids)).values(product_price_id=None)
+        )
+        await session.execute(
+            delete(ProductPrice).where(ProductPrice.id.in_(diff.delete_ids)).execution_options(synchronize_session=False)
+        )
+    if diff.updates:
+        await session.execute(update(ProductPrice), diff.updates)
+    if diff.inserts:
+        await session.execute(insert(ProductPrice), diff.inserts)
+
+
+def _product_data(product: Product, category: Category, brand: Brand, final_prices: list, colors: dict) -> ProductDataResponse:
+    """Build the response from what the write already knows instead of refreshing every relationship."""
+    return ProductDataResponse(
+        id=product.id,
+        name=product.name,
+        description=product.description,
+        attachment=product.attachment,
+        category={"key": str(category.id), "value": category.name},
+        product_prices=[
+            {
+                "id": product_price_id,
+                "color": {"key": str(color_id), "value": colors[color_id].name},
+                "size": size,
+                "price": price,
+            }
+            for product_price_id, color_id, size, price in final_prices
+        ],
+        brand={"key": str(brand.id), "value": brand.name},
+        is_active=product.is_active,
+    )
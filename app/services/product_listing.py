@@ -0,0 +1,79 @@
+from typing import Iterable
+
+from sqlalchemy import select, func, distinct, cast, literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.catalog_cache import mark_catalog_changed
+from app.models.product import Product
+from app.models.product_listing import ProductListing
+from app.models.product_price import ProductPrice
+from app.models.product_rate import ProductRate
+
+LISTING_COLUMNS = ("min_price", "max_price", "color_ids", "variant_count", "avg_rate", "rate_count")
+
+
+async def refresh_product_listings(session: AsyncSession, product_ids: Iterable):
+    """
+    Recompute the listing rows of the given products inside the caller's transaction.
+
+    Called by the product, product price and product rate services after their changes are
+    flushed and before they commit. The product rows are locked first so two concurrent writers
+    to the same product serialize and the later one aggregates the earlier one's rows too.
+    The products' cached entries are dropped when the caller commits.
+    """
+    product_ids = sorted({product_id for product_id in product_ids if product_id is not None}, key=str)
+    if not product_ids:
+        return
+
+    # FOR NO KEY UPDATE, doesn't block inserts referencing the product
+    await session.execute(
+        select(Product.id).where(Product.id.in_(product_ids)).order_by(Product.id).with_for_update(key_share=True)
+    )
+
+    prices = (
+        select(
+            ProductPrice.product_id,
+            func.min(ProductPrice.price).label("min_price"),
+            func.max(ProductPrice.price).label("max_price"),
+            func.array_remove(func.array_agg(distinct(ProductPrice.color_id)), None).label("color_ids"),
+            func.count().label("variant_count"),
+        )
+        .where(ProductPrice.product_id.in_(product_ids))
+        .group_by(ProductPrice.product_id)
+        .subquery()
+    )
+    rates = (
+        select(
+            ProductRate.product_id,
+            func.avg(ProductRate.rate).label("avg_rate"),
+            func.count().label("rate_count"),
+        )
+        .where(ProductRate.product_id.in_(product_ids))
+        .group_by(ProductRate.product_id)
+        .subquery()
+    )
+    source = (
+        select(
+            Product.id,
+            prices.c.min_price,
+            prices.c.max_price,
+            func.coalesce(prices.c.color_ids, cast(literal_column("'{}'"), ProductListing.color_ids.type)),
+            func.coalesce(prices.c.variant_count, 0),
+            rates.c.avg_rate,
+            func.coalesce(rates.c.rate_count, 0),
+            func.now(),
+        )
+        .outerjoin(prices, prices.c.product_id == Product.id)
+        .outerjoin(rates, rates.c.product_id == Product.id)
+        .where(Product.id.in_(product_ids))
+    )
+
+    stmt = insert(ProductListing).from_select(["product_id", *LISTING_COLUMNS, "updated_at"], source)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ProductListing.product_id],
+        set_={column: stmt.excluded[column] for column in (*LISTING_COLUMNS, "updated_at")}
+    )
+    await session.execute(stmt)
+    # Core statements bypass the cache's flush hook
+    mark_catalog_changed(session, product_ids)
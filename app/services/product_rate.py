@@ -9,6 +9,7 @@ from app.responses.paginated_response import PaginationParam
 from app.responses.product_rate import ProductRate, ProductRateDataResponse, ProductRateResponse
 from app.schemas.product_rate import ProductRateRequest
 from app.services.base_service import fetch_paginated_data
+from app.services.product_listing import refresh_product_listings
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +53,8 @@ async def create_product_rate(req: ProductRateRequest, session: AsyncSession) ->
 
     try:
         session.add(product_rate)
+        await session.flush()
+        await refresh_product_listings(session, [product_rate.product_id])
         await session.commit()
         await session.refresh(product_rate)
         logger.info(f"Product Rate created successfully.")
@@ -79,11 +82,14 @@ async def update_product_rate(product_rate_id: str, req: ProductRateRequest, ses
             message="Product Rate not found"
         )
 
+    previous_product_id = product_rate.product_id
     update_data = req.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(product_rate, key, value)
 
     try:
+        await session.flush()
+        await refresh_product_listings(session, [previous_product_id, product_rate.product_id])
         await session.commit()
         await session.refresh(product_rate)
         logger.info(f"Product Rate with ID {product_rate_id} updated successfully.")
@@ -112,6 +118,8 @@ async def delete_product_rate(product_rate_id: str, session: AsyncSession) -> Pr
         )
 
     await session.delete(product_rate)
+    await session.flush()
+    await refresh_product_listings(session, [product_rate.product_id])
     await session.commit()
     return ProductRateResponse(
         data=ProductRateDataResponse.from_entity(product_rate),
@@ -0,0 +1,93 @@
+from typing import Optional
+
+from pydantic import create_model
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only, noload
+
+_partial_models = {}
+
+
+def parse_fields(fields: str) -> Optional[set[str]]:
+    """Split the `fields=` query parameter into a set of response keys, None when not given."""
+    requested = {field.strip() for field in fields.split(",") if field.strip()} if fields else set()
+    return requested or None
+
+
+def apply_projection(stmt, entity, fields: Optional[set[str]], load_options: Optional[dict] = None, extra_columns=()):
+    """
+    Narrow `stmt` to the requested response keys.
+
+    `load_options` maps a response key (or a tuple of keys) to the loader option that feeds it,
+    e.g. `{"category": selectinload(Product.category)}`. Without `fields` every loader is applied.
+    With `fields`, only the requested loaders run, every other relationship is `noload`-ed and
+    the SELECT is narrowed with `load_only` to the primary key, foreign keys and requested columns.
+    """
+    load_options = load_options or {}
+    if fields is None:
+        return stmt.options(*load_options.values())
+
+    options = [
+        option for keys, option in load_options.items()
+        if fields.intersection((keys,) if isinstance(keys, str) else keys)
+    ]
+
+    mapper = inspect(entity)
+    columns = [
+        getattr(entity, attr.key) for attr in mapper.column_attrs
+        if attr.key in fields or any(column.primary_key or column.foreign_keys for column in attr.columns)
+    ]
+    # Sort keys living on joined tables (e.g. `Product.price`) are selected by the caller instead
+    column_keys = {attr.key for attr in mapper.column_attrs}
+    columns.extend(column for column in extra_columns if column.key in column_keys)
+
+    # Relationships without an applied loader are noload-ed so from_entity never lazy-loads under asyncio
+    loaded = {option.path[1].key for option in options}
+    skipped = [
+        noload(getattr(entity, relationship.key))
+        for relationship in mapper.relationships if relationship.key not in loaded
+    ]
+
+    return stmt.options(load_only(*columns), *options, *skipped)
+
+
+def serialize_partial(data_response_model, entities, fields: set[str]) -> list[dict]:
+    """
+    Serialize entities loaded by `apply_projection` to dicts holding only the requested keys.
+
+    Each entity is read through a `_LoadedView` where unloaded columns read as None, and the
+    response model is rebuilt with every field optional, so the existing `from_entity` mapping
+    can be reused for the keys that were loaded. The entities themselves are left untouched.
+    """
+    partial_model = _get_partial_model(data_response_model)
+    return [partial_model.from_entity(_LoadedView(item)).model_dump(include=fields) for item in entities]
+
+
+class _LoadedView:
+    """Read-only stand-in for an entity, unloaded columns read as None instead of lazy-loading."""
+
+    __slots__ = ("_entity", "_unloaded")
+
+    def __init__(self, entity):
+        state = inspect(entity)
+        self._entity = entity
+        self._unloaded = {key for key in state.unloaded if key in state.mapper.column_attrs}
+
+    def __getattr__(self, name):
+        if name in self._unloaded:
+            return None
+        return getattr(self._entity, name)
+
+
+def _get_partial_model(data_response_model):
+    partial_model = _partial_models.get(data_response_model)
+    if partial_model is None:
+        partial_model = create_model(
+            f"Partial{data_response_model.__name__}",
+            __base__=data_response_model,
+            **{
+                name: (Optional[field.annotation], None)
+                for name, field in data_response_model.model_fields.items()
+            }
+        )
+        _partial_models[data_response_model] = partial_model
+    return partial_model
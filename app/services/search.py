@@ -0,0 +1,62 @@
+import uuid
+
+from sqlalchemy import func, cast
+from sqlalchemy.dialects.postgresql import REGCONFIG
+
+from app.config.custom_exceptions import CustomHTTPException
+
+
+def apply_search(stmt, entity, search: str):
+    """
+    Apply the free-text `search` term to `stmt`.
+
+    - An exact UUID becomes a primary key lookup.
+    - Entities with a `search_vector` column are matched with `websearch_to_tsquery`
+      against the GIN-indexed vector and ordered by `ts_rank`.
+    - Entities with a `name` column fall back to a name match.
+    - Anything else (orders, users) only supports UUID lookups and `field:value` searches,
+      other terms are rejected with a 400.
+    """
+    search = search.strip()
+
+    try:
+        return stmt.where(entity.id == uuid.UUID(search))
+    except ValueError:
+        pass
+
+    search_vector = getattr(entity, "search_vector", None)
+    if search_vector is None:
+        name = getattr(entity, "name", None)
+        if name is None:
+            raise CustomHTTPException(
+                status_code=400,
+                message="Free-text search is not supported here, search by id or use a field:value search",
+            )
+        return stmt.where(name.ilike(f"%{_escape_like(search)}%", escape="\\"))
+
+    config = search_vector.property.columns[0].info["search_config"]
+    query = func.websearch_to_tsquery(cast(config, REGCONFIG), search)
+
+    # Rank first; the requested sort is appended afterwards as the tie-breaker
+    return (
+        stmt.where(search_vector.op("@@")(query))
+        .order_by(None)
+        .order_by(func.ts_rank(search_vector, query).desc())
+    )
+
+
+def apply_field_search(stmt, entity, field: str, value: str):
+    """
+    Apply a `field:value` substring search.
+
+    Only columns listed in the model's `__searchable_columns__` are accepted; each of them
+    is backed by a `pg_trgm` GIN index so the `ILIKE '%value%'` match can use it.
+    """
+    if field not in getattr(entity, "__searchable_columns__", ()):
+        raise CustomHTTPException(status_code=400, message=f"Field '{field}' is not searchable")
+
+    return stmt.where(getattr(entity, field).ilike(f"%{_escape_like(value)}%", escape="\\"))
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
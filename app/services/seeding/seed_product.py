@@ -7,6 +7,7 @@ from app.models.category import Category
 from app.models.brand import Brand
 from app.models.color import Color
 from app.schemas.product import ProductRequest, ProductPriceRequest
+from app.services.product_listing import refresh_product_listings
 import uuid
 
 
@@ -231,6 +232,7 @@ class SeedProduct:
             )
         ]
 
+        seeded_ids = []
         for product in products:
             if not await self.product_exists(product.name):
                 new_product = Product(
@@ -243,6 +245,7 @@ class SeedProduct:
                 )
                 self.session.add(new_product)
                 await self.session.flush()  # Ensure the product ID is available
+                seeded_ids.append(new_product.id)
 
                 for price in product.product_prices:
                     new_product_price = ProductPrice(
@@ -253,6 +256,10 @@ class SeedProduct:
                     )
                     self.session.add(new_product_price)
 
+        # Seeded products go straight to the ORM, so build their listing rows like the product service does
+        await self.session.flush()
+        await refresh_product_listings(self.session, seeded_ids)
+
     async def run(self):
         async with self.session.begin():
             await self.seed_product()
@@ -25,7 +25,7 @@ class SeedUser:
             admin_user = User(
                 username="admin",
                 email="admin@example.com",
-                password=hash_password("admin@123"),
+                password=await hash_password("admin@123"),
                 is_active=True,
                 created_at=datetime.now(),
                 updated_at=datetime.now(),
@@ -39,7 +39,7 @@ class SeedUser:
             super_admin_user = User(
                 username="superadmin",
                 email="superadmin@example.com",
-                password=hash_password("superadmin@123"),
+                password=await hash_password("superadmin@123"),
                 is_active=True,
                 created_at=datetime.now(),
                 updated_at=datetime.now(),
@@ -45,7 +45,7 @@ async def create_user_account(data: RegisterUserRequest, session: AsyncSession):
             new_user = User(
                 username=data.username,
                 email=data.email,
-                password=hash_password(data.password),
+                password=await hash_password(data.password),
                 role=0,  # Default role is 0 = Customer, 1 = User, 2 = Admin, 3 = Super Admin
                 is_active=True,
                 updated_at=datetime.now()
@@ -0,0 +1,55 @@
+import base64
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+
+def encode_cursor(sort_key: str, sort_value, row_id) -> str:
+    """Encode the last row of a page into an opaque, url-safe cursor."""
+    if isinstance(sort_value, (datetime, date)):
+        sort_value = sort_value.isoformat()
+    elif isinstance(sort_value, (uuid.UUID, Decimal)):
+        sort_value = str(sort_value)
+
+    raw = json.dumps({"k": sort_key, "v": sort_value, "id": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_column) -> tuple[str, object, uuid.UUID]:
+    """
+    Decode a cursor into (sort_key, sort_value, row_id), coercing the value to the column type.
+
+    Anything that does not decode or coerce cleanly raises `ValueError("Invalid cursor")`.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        sort_key, sort_value, row_id = payload["k"], payload["v"], uuid.UUID(payload["id"])
+        if sort_value is not None:
+            sort_value = _coerce_sort_value(sort_value, sort_column)
+    except (ValueError, KeyError, TypeError, AttributeError, ArithmeticError):
+        raise ValueError("Invalid cursor")
+
+    return sort_key, sort_value, row_id
+
+
+def _coerce_sort_value(sort_value, sort_column):
+    try:
+        python_type = sort_column.type.python_type
+    except NotImplementedError:
+        return sort_value
+
+    if python_type is datetime:
+        return datetime.fromisoformat(sort_value)
+    if python_type is date:
+        return date.fromisoformat(sort_value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(sort_value)
+    if python_type in (int, float, Decimal):
+        if isinstance(sort_value, bool) or not isinstance(sort_value, (int, float, str)):
+            raise TypeError(sort_value)
+        return python_type(sort_value)
+    if python_type is str and not isinstance(sort_value, str):
+        raise TypeError(sort_value)
+    return sort_value
@@ -0,0 +1,29 @@
+import uuid
+from decimal import Decimal
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value):
+    # orjson only encodes exact uuid.UUID instances, asyncpg returns its own UUID subclass
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    # Same mapping as FastAPI's jsonable_encoder
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    raise TypeError
+
+
+def dumps(content) -> bytes:
+    """orjson.dumps that also handles the driver types found in plain dict rows."""
+    return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+class RowsJSONResponse(ORJSONResponse):
+    """ORJSONResponse for envelopes of plain dict rows built straight from ORM entities."""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
@@ -0,0 +1,119 @@
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+# Point the app at the test database before anything imports the settings.
+# TEST_POSTGRES_* override POSTGRES_*, so a local .env never aims the suite at a real database.
+for _key in ("HOST", "PORT", "USER", "PASSWORD", "DATABASE"):
+    if os.environ.get(f"TEST_POSTGRES_{_key}"):
+        os.environ[f"POSTGRES_{_key}"] = os.environ[f"TEST_POSTGRES_{_key}"]
+os.environ.setdefault("POSTGRES_HOST", "127.0.0.1")
+os.environ.setdefault("POSTGRES_USER", "postgres")
+os.environ.setdefault("POSTGRES_PASSWORD", "postgres")
+os.environ.setdefault("POSTGRES_DATABASE", "shop_test")
+os.environ.pop("POSTGRES_READ_HOST", None)
+os.environ.pop("POSTGRES_READ_PORT", None)
+
+# Importing the application registers every model, so mapper relationships resolve in unit tests
+from app.main import app as application  # noqa: E402
+
+from tests.helpers import connect  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="session")
+def app():
+    return application
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    # One client, and so one event loop, for the whole run: pooled asyncpg connections are bound to it
+    from fastapi.testclient import TestClient
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def database():
+    """
+    Migrated test database, emptied once per run.
+
+    Tests needing Postgres take this fixture and are skipped when the server is unreachable.
+    The database (POSTGRES_DATABASE, `shop_test` by default) is created when missing.
+    """
+    import asyncpg
+    from alembic import command
+    from alembic.config import Config
+    from app.config.settings import get_settings
+
+    settings = get_settings()
+    try:
+        asyncio.run(_ensure_database(settings))
+    except (OSError, asyncpg.PostgresError) as exc:
+        pytest.skip(f"Postgres test database not available: {exc}")
+
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    command.upgrade(config, "head")
+    asyncio.run(_truncate_all())
+
+
+async def _ensure_database(settings):
+    import asyncpg
+    try:
+        connection = await connect()
+    except asyncpg.InvalidCatalogNameError:
+        connection = await connect("postgres")
+        await connection.execute(f'CREATE DATABASE "{settings.PG_DB}"')
+    await connection.close()
+
+
+async def _truncate_all():
+    from app.config.database import Base
+    connection = await connect()
+    tables = ", ".join(f'"{table.name}"' for table in Base.metadata.sorted_tables)
+    await connection.execute(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+    await connection.close()
+
+
+@pytest.fixture(scope="session")
+def seeded(database, client):
+    """The demo catalog and users from `POST /seeds`."""
+    response = client.post("/seeds")
+    assert response.status_code == 201, response.text
+
+
+@pytest.fixture(scope="session")
+def admin_headers(seeded, client):
+    response = client.post("/auth/login", json={
+        "username": "admin", "email": "admin@example.com", "password": "admin@123"
+    })
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+
+@pytest.fixture(scope="session")
+def customer_headers(seeded, client):
+    credentials = {"username": "shopper", "email": "shopper@example.com", "password": "shopper@123"}
+    response = client.post("/auth/register", json=credentials)
+    assert response.status_code == 201, response.text
+    response = client.post("/auth/login", json=credentials)
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+
+@pytest.fixture(autouse=True)
+def fresh_catalog_cache():
+    """Every test starts with an empty catalog cache so statement counts do not depend on test order."""
+    from app.config.catalog_cache import InMemoryCatalogCache, get_catalog_cache, set_catalog_cache
+    from app.config.settings import get_settings
+
+    settings = get_settings()
+    previous = get_catalog_cache()
+    set_catalog_cache(InMemoryCatalogCache(settings.CATALOG_CACHE_SIZE, settings.CATALOG_CACHE_TTL_SECONDS))
+    yield
+    set_catalog_cache(previous)
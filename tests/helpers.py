@@ -0,0 +1,58 @@
+from contextlib import contextmanager
+
+
+@contextmanager
+def count_statements():
+    """
+    Collect the `QueryStats` of every statement run while the block is active.
+
+    Same accounting as the per-request instrumentation, but readable from the test once the
+    request is done (the request's own stats live in a context variable that is reset by then).
+    """
+    from sqlalchemy import event
+    from app.config.database import engine
+    from app.config.instrumentation import QueryStats
+
+    stats = QueryStats()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        stats.record(statement, 0.0)
+
+    event.listen(engine.sync_engine, "after_cursor_execute", record)
+    try:
+        yield stats
+    finally:
+        event.remove(engine.sync_engine, "after_cursor_execute", record)
+
+
+async def connect(database: str = None):
+    """Plain asyncpg connection to the test server, outside the app's pool and event loop."""
+    import asyncpg
+    from app.config.settings import get_settings
+
+    settings = get_settings()
+    return await asyncpg.connect(
+        host=settings.PG_HOST, port=int(settings.PG_PORT), user=settings.PG_USER,
+        password=settings.PG_PASSWORD, database=database or settings.PG_DB, timeout=5,
+    )
+
+
+def colors(client) -> list:
+    return [color["id"] for color in client.get("/frontend/colors", params={"limit": 10}).json()["data"]]
+
+
+def product_request(client, variants: int) -> dict:
+    """`ProductRequest` body in the first seeded product's category and brand, one color per variant."""
+    product = client.get("/frontend/products").json()["data"][0]
+    color_ids = colors(client)
+    return {
+        "name": f"Query count table {variants}",
+        "description": "Counted",
+        "category_id": product["category"]["key"],
+        "brand_id": product["brand"]["key"],
+        "product_prices": [
+            {"color_id": color_ids[index % len(color_ids)], "size": f"S{index}", "price": 10 + index}
+            for index in range(variants)
+        ],
+    }
+
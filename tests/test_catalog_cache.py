@@ -0,0 +1,75 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from app.config import catalog_cache
+from app.config.catalog_cache import (
+    PRODUCT_FACET_NAMESPACE,
+    PRODUCT_NAMESPACE,
+    PRODUCT_PAGE_NAMESPACE,
+    cached,
+    get_catalog_cache,
+    mark_catalog_changed,
+)
+
+
+class _PrimaryMaker:
+    """Stands in for `async_session_maker`, the "session" it opens is just a name."""
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return "primary"
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+async def _session_name(session):
+    return session
+
+
+def _cached_on_replica(monkeypatch, key):
+    monkeypatch.setattr(catalog_cache, "is_replica_session", lambda session: session == "replica")
+    monkeypatch.setattr(catalog_cache, "async_session_maker", _PrimaryMaker())
+    return asyncio.run(cached(PRODUCT_NAMESPACE, key, "replica", _session_name))
+
+
+def test_replica_miss_is_built_on_the_replica(monkeypatch):
+    monkeypatch.setattr(catalog_cache, "_last_invalidated", float("-inf"))
+    assert _cached_on_replica(monkeypatch, "settled") == "replica"
+
+
+def test_replica_miss_right_after_an_invalidation_is_built_on_the_primary(monkeypatch):
+    monkeypatch.setattr(catalog_cache, "_last_invalidated", time.monotonic())
+    assert _cached_on_replica(monkeypatch, "lagging") == "primary"
+    # What gets cached is the primary's answer
+    assert asyncio.run(get_catalog_cache().get(PRODUCT_NAMESPACE, "lagging")) == "primary"
+
+
+def test_marked_changes_are_dropped_on_commit(monkeypatch):
+    monkeypatch.setattr(catalog_cache, "_last_invalidated", float("-inf"))
+    session = SimpleNamespace(info={})
+    # Core writes mark the products themselves, alongside anything the flush hook collected
+    mark_catalog_changed(session, ["a", None])
+    mark_catalog_changed(session, ["b"])
+    assert session.info["catalog_changes"] == {"product_ids": {"a", "b"}, "shared": False}
+
+    async def commit():
+        cache = get_catalog_cache()
+        for key in ("a", "b", "c"):
+            await cache.set(PRODUCT_NAMESPACE, key, key)
+        await cache.set(PRODUCT_PAGE_NAMESPACE, "page", "page")
+        await cache.set(PRODUCT_FACET_NAMESPACE, "facet", "facet")
+
+        catalog_cache._invalidate_catalog(session)
+        await asyncio.gather(*catalog_cache._pending_invalidations)
+        return [await cache.get(namespace, key) for namespace, key in (
+            (PRODUCT_NAMESPACE, "a"), (PRODUCT_NAMESPACE, "b"), (PRODUCT_NAMESPACE, "c"),
+            (PRODUCT_PAGE_NAMESPACE, "page"), (PRODUCT_FACET_NAMESPACE, "facet"),
+        )]
+
+    assert asyncio.run(commit()) == [None, None, "c", None, None]
+    assert "catalog_changes" not in session.info
+    assert catalog_cache._replica_may_lag()
@@ -0,0 +1,96 @@
+"""
+ETags of the frontend catalog routes, versioned by the `resource_versions` counters.
+"""
+import asyncio
+
+import pytest
+
+from app.routes.frontend import (
+    frontend_brand_router,
+    frontend_category_router,
+    frontend_color_router,
+    frontend_location_router,
+    frontend_payment_method_router,
+    frontend_product_router,
+)
+from tests.helpers import connect, product_request
+
+pytestmark = pytest.mark.usefixtures("seeded")
+
+ROUTE_ENTITIES = (
+    *frontend_product_router.PRODUCT_ENTITIES,
+    *frontend_product_router.PRODUCT_DETAIL_ENTITIES,
+    *frontend_brand_router.BRAND_ENTITIES,
+    *frontend_category_router.CATEGORY_ENTITIES,
+    *frontend_color_router.COLOR_ENTITIES,
+    *frontend_location_router.LOCATION_ENTITIES,
+    *frontend_payment_method_router.PAYMENT_METHOD_ENTITIES,
+)
+
+
+async def _execute(sql: str, *args):
+    connection = await connect()
+    try:
+        return await connection.fetch(sql, *args)
+    finally:
+        await connection.close()
+
+
+def execute(sql: str, *args):
+    return asyncio.run(_execute(sql, *args))
+
+
+def etag(client, path: str) -> str:
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    return response.headers["ETag"]
+
+
+def create_product(client, admin_headers, name: str) -> str:
+    body = {**product_request(client, 2), "name": name}
+    response = client.post("/backend/products", json=body, headers=admin_headers)
+    assert response.status_code == 201, response.text
+    return response.json()["data"]["id"]
+
+
+def test_every_versioned_route_table_has_the_trigger():
+    tables = {entity.__tablename__ for entity in ROUTE_ENTITIES}
+    rows = execute(
+        "SELECT c.relname FROM pg_trigger t JOIN pg_class c ON c.oid = t.tgrelid "
+        "WHERE t.tgname = 'bump_resource_version' AND c.relname = ANY($1::text[])",
+        list(tables)
+    )
+    assert {row["relname"] for row in rows} == tables
+
+
+def test_matching_etag_answers_304(client):
+    tag = etag(client, "/frontend/products")
+    response = client.get("/frontend/products", headers={"If-None-Match": tag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == tag
+
+
+def test_list_etag_moves_with_writes_outside_the_orm(client):
+    before = etag(client, "/frontend/products")
+    assert etag(client, "/frontend/products") == before
+
+    # A Core or hand-written statement moves the counter as well, on commit
+    execute("UPDATE product_prices SET price = price WHERE id = (SELECT id FROM product_prices LIMIT 1)")
+    assert etag(client, "/frontend/products") != before
+
+
+def test_detail_etag_is_scoped_to_its_product(client, admin_headers):
+    product_id = create_product(client, admin_headers, "Conditional scoped")
+    other_id = create_product(client, admin_headers, "Conditional other")
+    before = etag(client, f"/frontend/products/{product_id}")
+
+    # Writes to another product leave this detail's validator alone
+    execute("UPDATE product_prices SET price = price + 1 WHERE product_id = $1::uuid", other_id)
+    assert etag(client, f"/frontend/products/{product_id}") == before
+
+    # Its own variants move it, deletes included
+    execute(
+        "DELETE FROM product_prices WHERE id = (SELECT id FROM product_prices WHERE product_id = $1::uuid LIMIT 1)",
+        product_id
+    )
+    assert etag(client, f"/frontend/products/{product_id}") != before
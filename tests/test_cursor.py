@@ -0,0 +1,40 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import Column, DateTime, Float, Numeric, String
+
+from app.utils.cursor import decode_cursor, encode_cursor
+
+ROW_ID = uuid.UUID("6a4f0c1e-5a8e-4f58-9d3c-1f1f8e0b7a11")
+
+
+@pytest.mark.parametrize("column, value", [
+    (Column("created_at", DateTime()), datetime(2024, 5, 1, 12, 30)),
+    (Column("price", Float()), 19.5),
+    (Column("price", Numeric()), Decimal("19.50")),
+    (Column("name", String()), "shoe"),
+    (Column("name", String()), None),
+])
+def test_round_trip(column, value):
+    assert decode_cursor(encode_cursor("k", value, ROW_ID), column) == ("k", value, ROW_ID)
+
+
+@pytest.mark.parametrize("column, value", [
+    (Column("created_at", DateTime()), "not a date"),
+    (Column("created_at", DateTime()), 12),
+    (Column("price", Float()), "cheap"),
+    (Column("price", Float()), [1]),
+    (Column("price", Numeric()), "1.2.3"),
+    (Column("name", String()), {"x": 1}),
+])
+def test_bad_sort_value_is_invalid_cursor(column, value):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(encode_cursor("k", value, ROW_ID), column)
+
+
+@pytest.mark.parametrize("cursor", ["!!!", "e30", "WzEsMiwzXQ"])
+def test_malformed_cursor_is_invalid(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, Column("price", Float()))
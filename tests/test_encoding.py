@@ -0,0 +1,35 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import orjson
+import pytest
+from asyncpg.pgproto.pgproto import UUID as DriverUUID
+
+from app.cli.serialization_benchmark import BENCHMARKS
+from app.utils.encoding import RowsJSONResponse, dumps
+
+# `data` of a five row page per response class, rendered by `from_entity`, `jsonable_encoder` and
+# `JSONResponse` before the `to_dict` fast path existed (commit bbed758). ProductListingDataResponse
+# was introduced with `to_dict`, its page pins the output it shipped with.
+SERIALIZATION_FIXTURES = Path(__file__).parent / "fixtures" / "serialization"
+
+
+def test_dumps_encodes_driver_uuids():
+    row_id = uuid.uuid4()
+    driver_id = DriverUUID(str(row_id))
+    assert type(driver_id) is not uuid.UUID
+
+    assert orjson.loads(dumps({"id": driver_id, "ids": [driver_id]})) == {"id": str(row_id), "ids": [str(row_id)]}
+
+
+def test_dumps_matches_jsonable_encoder_for_decimals_and_datetimes():
+    payload = {"price": Decimal("19.50"), "count": Decimal("3"), "at": datetime(2024, 5, 1, 12, 30, 5)}
+    assert orjson.loads(dumps(payload)) == {"price": 19.5, "count": 3, "at": "2024-05-01T12:30:05"}
+
+
+@pytest.mark.parametrize("model, build", BENCHMARKS, ids=[model.__name__ for model, _ in BENCHMARKS])
+def test_row_fast_path_is_byte_identical_to_the_original_serializers(model, build):
+    rows = RowsJSONResponse(content=[model.to_dict(entity) for entity in build(5)]).body
+    assert rows == (SERIALIZATION_FIXTURES / f"{model.__name__}.json").read_bytes()
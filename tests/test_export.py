@@ -0,0 +1,93 @@
+import asyncio
+import csv
+import io
+
+import orjson
+import pytest
+
+from app.services import export
+from tests.helpers import connect
+
+pytestmark = pytest.mark.usefixtures("seeded")
+
+# More female customers than fit in one `EXPORT_BATCH_SIZE` partition
+EXPORT_CUSTOMERS = 2 * (export.EXPORT_BATCH_SIZE + 100)
+TRICKY_ADDRESS = 'Street 1, "Corner"\nFloor 2'
+EXPORT_PARAMS = {"search": "name:Export customer", "filter": "gender:eq:1"}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def export_customers():
+    async def insert():
+        connection = await connect()
+        try:
+            await connection.executemany(
+                "INSERT INTO customers (id, name, gender, address, created_at) "
+                "VALUES (gen_random_uuid(), $1, $2, $3, now())",
+                [(f"Export customer {index:04d}", index % 2, TRICKY_ADDRESS if index == 1 else f"Street {index}")
+                 for index in range(EXPORT_CUSTOMERS)]
+            )
+        finally:
+            await connection.close()
+
+    asyncio.run(insert())
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Sizes of the batches handed to the encoders, one per `yield_per` partition."""
+    sizes = []
+
+    def recording(encode):
+        def wrapper(rows, with_header):
+            sizes.append(len(rows))
+            return encode(rows, with_header)
+        return wrapper
+
+    monkeypatch.setattr(export, "_encode_ndjson", recording(export._encode_ndjson))
+    monkeypatch.setattr(export, "_encode_csv", recording(export._encode_csv))
+    return sizes
+
+
+def test_ndjson_export_applies_search_and_filter_across_partitions(client, admin_headers, batches):
+    response = client.get("/backend/customers/export", params={**EXPORT_PARAMS, "format": "ndjson"},
+                          headers=admin_headers)
+
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="customers.ndjson"'
+    rows = [orjson.loads(line) for line in response.content.splitlines()]
+    assert len(rows) == EXPORT_CUSTOMERS // 2
+    assert {row["gender"] for row in rows} == {"Female"}
+    assert all(row["name"].startswith("Export customer ") for row in rows)
+    assert batches == [export.EXPORT_BATCH_SIZE, 100]
+
+
+def test_csv_export_writes_one_header_and_quotes_values(client, admin_headers, batches):
+    response = client.get("/backend/customers/export", params={**EXPORT_PARAMS, "format": "csv"},
+                          headers=admin_headers)
+
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.content.count(b"id,name,username,email,gender,") == 1
+    header, *rows = list(csv.reader(io.StringIO(response.text)))
+    assert header == ["id", "name", "username", "email", "gender", "phone_number", "address", "active", "created_at"]
+    assert len(rows) == EXPORT_CUSTOMERS // 2
+    assert batches == [export.EXPORT_BATCH_SIZE, 100]
+
+    tricky = next(row for row in rows if row[1] == "Export customer 0001")
+    assert tricky[6] == TRICKY_ADDRESS
+    assert tricky[2:4] == ["", ""] and tricky[7] == ""
+    assert b',"Street 1, ""Corner""\nFloor 2",' in response.content
+
+
+def test_encoders_return_bytes():
+    row = {"id": "1", "name": 'A "quoted", name', "brand": {"key": "b", "value": "Brand"}, "tags": ["x"]}
+    assert export._encode_ndjson([row], True) == b'{"id":"1","name":"A \\"quoted\\", name","brand":{"key":"b","value":"Brand"},"tags":["x"]}\n'
+    assert export._encode_csv([row], True) == b'id,name,brand,tags\r\n1,"A ""quoted"", name",Brand,"[""x""]"\r\n'
+    assert export._encode_csv([row], False) == b'1,"A ""quoted"", name",Brand,"[""x""]"\r\n'
+
+
+def test_unknown_format_is_a_400(client, admin_headers):
+    response = client.get("/backend/customers/export", params={"format": "xml"}, headers=admin_headers)
+    assert response.status_code == 400, response.text
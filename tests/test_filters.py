@@ -0,0 +1,77 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.config.custom_exceptions import CustomHTTPException
+from app.models.order import Order
+from app.models.user import User
+from app.services.filters import apply_filters
+
+
+def compile_where(entity, filter_expr: str) -> str:
+    stmt = apply_filters(select(entity.id), entity, filter_expr)
+    compiled = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    return " ".join(compiled.partition("WHERE")[2].split())
+
+
+@pytest.mark.parametrize("filter_expr,where", [
+    ("amount:eq:10", "orders.amount = 10.0"),
+    ("amount:ne:10", "orders.amount != 10.0"),
+    ("amount:gt:10", "orders.amount > 10.0"),
+    ("amount:gte:10.5", "orders.amount >= 10.5"),
+    ("amount:lt:10", "orders.amount < 10.0"),
+    ("amount:lte:10", "orders.amount <= 10.0"),
+    ("amount:between:10..500", "orders.amount BETWEEN 10.0 AND 500.0"),
+    ("order_status:in:pending|accepted", "orders.order_status IN ('pending', 'accepted')"),
+    ("staff_id:isnull:true", "orders.staff_id IS NULL"),
+    ("staff_id:isnull:false", "orders.staff_id IS NOT NULL"),
+    ("order_status:eq:pending, amount:gt:10", "orders.order_status = 'pending' AND orders.amount > 10.0"),
+])
+def test_operators(filter_expr, where):
+    assert compile_where(Order, filter_expr) == where
+
+
+def test_flag_is_coerced_to_bool():
+    assert compile_where(User, "is_active:eq:0") == "users.is_active = false"
+
+
+@pytest.mark.parametrize("raw,expected", [
+    ("2024-01-01T07:00:00", datetime(2024, 1, 1, 7)),
+    ("2024-01-01T00:00:00+00:00", datetime(2024, 1, 1)),
+    ("2024-01-01T07:00:00+07:00", datetime(2024, 1, 1)),
+    ("2024-01-01T00:00:00Z", datetime(2024, 1, 1)),
+])
+def test_datetimes_are_bound_as_naive_utc(raw, expected):
+    stmt = apply_filters(select(Order.id), Order, f"created_at:gte:{raw}")
+    [value] = stmt.compile(dialect=postgresql.dialect()).params.values()
+    assert value == expected and value.tzinfo is None
+
+
+@pytest.mark.parametrize("filter_expr,message", [
+    ("password:eq:secret", "Field 'password' is not filterable"),
+    ("order_status:gt:pending", "Operator 'gt' is not allowed on 'order_status'"),
+    ("amount:like:10", "Operator 'like' is not allowed on 'amount'"),
+    ("amount:10", "Invalid filter 'amount:10', expected field:op:value"),
+    ("amount:gt:lots", "Invalid value 'lots' for 'amount'"),
+    ("amount:between:10", "Invalid value '10' for 'amount'"),
+    ("customer_id:eq:not-a-uuid", "Invalid value 'not-a-uuid' for 'customer_id'"),
+    ("created_at:gte:yesterday", "Invalid value 'yesterday' for 'created_at'"),
+    ("staff_id:isnull:maybe", "Invalid value 'maybe' for 'staff_id'"),
+])
+def test_rejected_filters_are_a_400(filter_expr, message):
+    with pytest.raises(CustomHTTPException) as exc_info:
+        apply_filters(select(Order), Order, filter_expr)
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.message == message
+
+
+@pytest.mark.usefixtures("seeded")
+@pytest.mark.parametrize("filter_expr", [
+    "created_at:gte:2024-01-01T00:00:00+00:00",
+    "created_at:between:2024-01-01T00:00:00+07:00..2999-01-01T00:00:00Z",
+])
+def test_offset_datetimes_reach_the_database(client, admin_headers, filter_expr):
+    response = client.get("/backend/orders", params={"filter": filter_expr}, headers=admin_headers)
+    assert response.status_code == 200, response.text
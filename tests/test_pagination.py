@@ -0,0 +1,8 @@
+import pytest
+
+
+@pytest.mark.parametrize("with_total", ["yes", "TRUE", "estimate", "1"])
+def test_unknown_with_total_is_rejected(client, with_total):
+    response = client.get("/frontend/brands", params={"with_total": with_total})
+    assert response.status_code == 422
+    assert any(error["loc"][-1] == "with_total" for error in response.json()["details"])
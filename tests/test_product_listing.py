@@ -0,0 +1,22 @@
+import pytest
+
+pytestmark = pytest.mark.usefixtures("seeded")
+
+
+def test_seeded_products_have_listing_rows(client):
+    # Other tests add their own products, the seeder names its "Product <n>"
+    products = [
+        product for product in client.get("/frontend/products", params={"limit": 100}).json()["data"]
+        if product["name"].startswith("Product ")
+    ]
+    assert len(products) == 15
+    for product in products:
+        assert product["min_price"] is not None, product
+        assert product["variant_count"] == 3, product
+
+
+def test_price_range_matches_seeded_products(client):
+    # Seeded variants are priced 10..154, product n at n*10 .. n*10+4
+    body = client.get("/frontend/products", params={"price_min": 60, "price_max": 85, "with_total": "true"}).json()
+    assert sorted(product["name"] for product in body["data"]) == ["Product 6", "Product 7", "Product 8"]
+    assert body["total_items"] == 3
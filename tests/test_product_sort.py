@@ -0,0 +1,87 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.product import Product
+from app.responses.paginated_response import PaginationParam
+from app.services.base_service import apply_sort
+from app.services.product import _by_price, _product_list_stmt
+from tests.helpers import connect
+
+
+def compile_sql(stmt) -> str:
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+@pytest.mark.parametrize("sort, order_by", [
+    ("price:asc", "ORDER BY product_listings.min_price ASC, products.id ASC"),
+    ("price:desc", "ORDER BY product_listings.min_price DESC NULLS LAST, products.id DESC"),
+])
+def test_price_sort_uses_inner_join_nulls_last_and_id_tiebreaker(sort, order_by):
+    pagination = PaginationParam(sort=sort)
+    sql = compile_sql(apply_sort(_product_list_stmt(by_price=_by_price(pagination)), Product, pagination))
+    assert "JOIN product_listings" in sql and "LEFT OUTER JOIN" not in sql
+    assert order_by in sql
+
+
+def test_not_null_sort_keeps_plain_desc():
+    pagination = PaginationParam(sort="created_at:desc")
+    sql = compile_sql(apply_sort(_product_list_stmt(by_price=_by_price(pagination)), Product, pagination))
+    assert "LEFT OUTER JOIN product_listings" in sql
+    assert "ORDER BY products.created_at DESC, products.id DESC" in sql
+
+
+@pytest.fixture(scope="module")
+def unpriced_product(seeded):
+    """A product without variants, so its listing row has no price; the API refuses to create one."""
+    return asyncio.run(_insert_unpriced_product())
+
+
+async def _insert_unpriced_product() -> str:
+    connection = await connect()
+    try:
+        product_id = uuid.uuid4()
+        await connection.execute(
+            """INSERT INTO products (id, name, is_active, category_id, brand_id)
+               SELECT $1, 'Unpriced sort probe', true, category_id, brand_id FROM products LIMIT 1""",
+            product_id
+        )
+        await connection.execute("INSERT INTO product_listings (product_id) VALUES ($1)", product_id)
+        return str(product_id)
+    finally:
+        await connection.close()
+
+
+def walk_offset(client, sort: str, limit: int) -> list[dict]:
+    rows, page = [], 1
+    while True:
+        body = client.get("/frontend/products", params={"sort": sort, "limit": limit, "page": page}).json()
+        rows.extend(body["data"])
+        if page >= body["total_pages"]:
+            return rows
+        page += 1
+
+
+def walk_cursor(client, sort: str, limit: int) -> list[dict]:
+    rows, cursor = [], ""
+    while cursor is not None:
+        body = client.get("/frontend/products", params={"sort": sort, "limit": limit, "cursor": cursor}).json()
+        rows.extend(body["data"])
+        cursor = body["next_cursor"]
+    return rows
+
+
+@pytest.mark.parametrize("walk", [walk_offset, walk_cursor])
+@pytest.mark.parametrize("sort", ["price:asc", "price:desc"])
+def test_price_sort_puts_unpriced_last_and_pages_cleanly(client, unpriced_product, walk, sort):
+    everything = client.get("/frontend/products", params={"limit": 100}).json()["data"]
+
+    rows = walk(client, sort, 4)
+
+    ids = [row["id"] for row in rows]
+    assert len(ids) == len(set(ids)) == len(everything)
+    prices = [row["min_price"] for row in rows if row["min_price"] is not None]
+    assert prices == sorted(prices, reverse=sort.endswith("desc"))
+    assert rows[-1]["id"] == unpriced_product
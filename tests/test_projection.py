@@ -0,0 +1,39 @@
+import uuid
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.brand import Brand
+from app.responses.brand import BrandDataResponse
+from app.services.projection import serialize_partial
+
+
+def detached_brand(**loaded):
+    """A persistent-looking brand with only `loaded` columns in its state, like a load_only() row."""
+    brand = Brand()
+    for key, value in loaded.items():
+        set_committed_value(brand, key, value)
+    set_committed_value(brand, "products", [])
+    set_committed_value(brand, "order_details", [])
+    make_transient_to_detached(brand)
+    return brand
+
+
+def test_serialize_partial_reads_unloaded_columns_as_none():
+    brand_id = uuid.uuid4()
+    brand = detached_brand(id=brand_id, name="Acme")
+
+    # Touching an unloaded column on a detached instance would raise, so this also proves
+    # serialize_partial never reads them from the entity
+    assert serialize_partial(BrandDataResponse, [brand], {"id", "name"}) == [{"id": brand_id, "name": "Acme"}]
+
+
+def test_serialize_partial_leaves_entity_state_alone():
+    brand = detached_brand(id=uuid.uuid4(), name="Acme")
+    unloaded = set(inspect(brand).unloaded)
+
+    serialize_partial(BrandDataResponse, [brand], {"id", "name", "description"})
+
+    assert set(inspect(brand).unloaded) == unloaded
+    assert "description" not in brand.__dict__
@@ -0,0 +1,247 @@
+"""
+Statement counts per route, read from `QueryStats`.
+
+These pin the number of SQL statements each hot route issues against a seeded database, so an
+N+1 loop or a dropped eager load shows up as a failing test instead of a log line.
+"""
+import asyncio
+
+import pytest
+
+from tests.helpers import connect, count_statements, colors, product_request
+
+pytestmark = pytest.mark.usefixtures("seeded")
+
+
+def get(client, path, **kwargs):
+    with count_statements() as stats:
+        response = client.get(path, **kwargs)
+    assert response.status_code == 200, response.text
+    return response, stats
+
+
+def assert_no_repeats(stats):
+    assert not [shape for shape, count in stats.shapes.items() if count > 1], stats.shapes
+
+
+@pytest.mark.parametrize("path", ["/frontend/brands", "/frontend/categories", "/frontend/colors"])
+def test_lookup_lists(client, path):
+    _, stats = get(client, path)
+    # resource version for the ETag, then the page with its total as a window aggregate
+    assert stats.count == 2, stats.shapes
+
+
+@pytest.mark.parametrize("path", [
+    "/frontend/products",
+    "/frontend/products?cursor=",
+    "/frontend/products?sort=price:asc",
+    "/frontend/products?price_min=10&price_max=500",
+])
+def test_product_list(client, path):
+    _, stats = get(client, path)
+    # resource version, page joined to product_listings, then one selectin each for category and brand
+    assert stats.count == 4, stats.shapes
+    assert_no_repeats(stats)
+
+    _, stats = get(client, path)
+    # served from the catalog cache, only the resource version is read
+    assert stats.count == 1, stats.shapes
+
+
+def test_product_list_does_not_grow_with_page_size(client):
+    _, small = get(client, "/frontend/products?limit=2")
+    _, large = get(client, "/frontend/products?limit=15")
+    assert small.count == large.count
+
+
+def test_product_facets(client):
+    _, stats = get(client, "/frontend/products/facets")
+    # resource version and a single GROUPING SETS query
+    assert stats.count == 2, stats.shapes
+
+    _, stats = get(client, "/frontend/products/facets")
+    assert stats.count == 1, stats.shapes
+
+
+def test_product_detail(client):
+    products = client.get("/frontend/products", params={"limit": 100}).json()["data"]
+    product_id = next(product["id"] for product in products if product["variant_count"])
+
+    _, stats = get(client, f"/frontend/products/{product_id}")
+    # resource version, product, then selectins for prices, price colors, category and brand
+    assert stats.count == 6, stats.shapes
+    assert_no_repeats(stats)
+
+    _, stats = get(client, f"/frontend/products/{product_id}")
+    assert stats.count == 1, stats.shapes
+
+
+@pytest.mark.parametrize("variants", [1, 8])
+def test_create_product_statements_do_not_depend_on_variant_count(client, admin_headers, variants):
+    body = product_request(client, variants)
+    # Warm the principal cache so the count only covers the product work
+    client.get("/backend/products", headers=admin_headers)
+
+    with count_statements() as stats:
+        response = client.post("/backend/products", json=body, headers=admin_headers)
+
+    assert response.status_code == 201, response.text
+    assert len(response.json()["data"]["product_prices"]) == variants
+    # category, brand, duplicate name and colors checks, one product insert, one executemany for
+    # the prices, then the listing refresh (row lock and upsert)
+    assert stats.count == 8, stats.shapes
+
+
+@pytest.mark.parametrize("variants", [1, 8])
+def test_update_product_statements_do_not_depend_on_variant_count(client, admin_headers, variants):
+    body = product_request(client, variants)
+    body["name"] = f"Query count update {variants}"
+    response = client.post("/backend/products", json=body, headers=admin_headers)
+    assert response.status_code == 201, response.text
+    product_id = response.json()["data"]["id"]
+
+    # Reprice every variant but the last, drop the last and add one in an unused color
+    kept = body["product_prices"][:-1]
+    body["product_prices"] = [{**price, "price": price["price"] + 1} for price in kept]
+    body["product_prices"].append({"color_id": colors(client)[variants], "size": "New", "price": 99})
+
+    with count_statements() as stats:
+        response = client.put(f"/backend/products/{product_id}", json=body, headers=admin_headers)
+
+    assert response.status_code == 200, response.text
+    assert len(response.json()["data"]["product_prices"]) == variants
+    # product with its prices, category, brand and colors checks, the product update, one statement
+    # per kind of variant change (cart detach, delete, executemany update, insert) and the listing
+    # refresh; with a single variant nothing is left to reprice
+    assert stats.count == (12 if kept else 11), stats.shapes
+    assert_no_repeats(stats)
+
+
+def test_variants_only_update_drops_cached_detail_and_pages(client, admin_headers):
+    body = product_request(client, 2)
+    body["name"] = "Cache variants only"
+    response = client.post("/backend/products", json=body, headers=admin_headers)
+    assert response.status_code == 201, response.text
+    product_id = response.json()["data"]["id"]
+    page = {"search": "name:Cache variants only"}
+
+    # Fill the detail and list page entries
+    client.get(f"/frontend/products/{product_id}")
+    client.get("/frontend/products", params=page)
+
+    # Same product columns, only a variant price changes
+    body["product_prices"][0]["price"] += 5
+    response = client.put(f"/backend/products/{product_id}", json=body, headers=admin_headers)
+    assert response.status_code == 200, response.text
+
+    detail, stats = get(client, f"/frontend/products/{product_id}")
+    assert stats.count > 1, stats.shapes
+    assert sorted(price["price"] for price in detail.json()["data"]["product_prices"]) == sorted(
+        price["price"] for price in body["product_prices"]
+    )
+    listing, stats = get(client, "/frontend/products", params=page)
+    assert stats.count > 1, stats.shapes
+    assert listing.json()["data"][0]["min_price"] == min(price["price"] for price in body["product_prices"])
+
+
+def product_price_ids(client) -> list:
+    products = client.get("/frontend/products", params={"limit": 100}).json()["data"]
+    product_id = next(product["id"] for product in products if product["variant_count"] >= 2)
+    detail = client.get(f"/frontend/products/{product_id}").json()["data"]
+    return [price["id"] for price in detail["product_prices"]]
+
+
+def test_add_all_carts_statements_do_not_depend_on_item_count(client, customer_headers):
+    client.delete("/frontend/carts", headers=customer_headers)
+    first, second = product_price_ids(client)[:2]
+    client.get("/frontend/carts", headers=customer_headers)
+
+    with count_statements() as single:
+        response = client.post("/frontend/carts/all", json=[{"product_price_id": first, "qty": 1}],
+                               headers=customer_headers)
+    assert response.status_code == 201, response.text
+
+    # an existing cart, a new one and the new one repeated
+    body = [{"product_price_id": first, "qty": 2}, {"product_price_id": second, "qty": 1},
+            {"product_price_id": second, "qty": 3}]
+    with count_statements() as several:
+        response = client.post("/frontend/carts/all", json=body, headers=customer_headers)
+    assert response.status_code == 201, response.text
+    assert response.json()["data"] is not None, response.text
+    assert [cart["qty"] for cart in response.json()["data"]] == [3, 4, 4]
+
+    # product prices with selectins for product, category, brand and color, the user's matching
+    # carts, then one INSERT per new cart and one UPDATE per existing cart in the flush
+    assert single.count == 7, single.shapes
+    assert several.count == 8, several.shapes
+    assert_no_repeats(several)
+    carts = client.get("/frontend/carts", headers=customer_headers).json()["data"]
+    assert sorted(cart["qty"] for cart in carts) == [3, 4]
+
+
+def add_notifications(target: str, count: int):
+    async def insert():
+        connection = await connect()
+        try:
+            await connection.executemany(
+                "INSERT INTO notifications (id, description, date, type, target, created_at) "
+                "VALUES (gen_random_uuid(), $1, now(), 'order', $2, now())",
+                [(f"Notification {index}", target) for index in range(count)]
+            )
+        finally:
+            await connection.close()
+
+    asyncio.run(insert())
+
+
+@pytest.mark.parametrize("path,role", [
+    ("/frontend/notification", "customer"),
+    ("/backend/notifications", "admin"),
+])
+def test_mark_all_notifications_seen_is_one_statement(client, admin_headers, customer_headers, path, role):
+    headers = customer_headers if role == "customer" else admin_headers
+    user_id = client.get("/auth/me", headers=headers).json()["data"]["id"]
+    add_notifications("admin" if role == "admin" else f"customer:{user_id}", 3)
+
+    for notifications in (3, 0):
+        unseen = client.get(f"{path}/unseen", headers=headers).json()
+        assert unseen["total_items"] >= notifications, unseen
+
+        with count_statements() as stats:
+            response = client.post(f"{path}/seen-all", headers=headers)
+        assert response.status_code == 201, response.text
+        # a single INSERT ... SELECT, however many notifications there are
+        assert stats.count == 1, stats.shapes
+        assert client.get(f"{path}/unseen", headers=headers).json()["total_items"] == 0
+
+
+def test_strict_budget_fails_before_the_write_commits(app, client, monkeypatch):
+    from fastapi import Depends
+    from sqlalchemy import func, insert, select
+
+    from app.config.database import get_session
+    from app.config.instrumentation import query_budget, settings
+    from app.models.notification import Notification
+
+    async def over_budget(session=Depends(get_session)):
+        await session.execute(insert(Notification).values(description="over budget", target="nobody"))
+        await session.execute(select(func.count()).select_from(Notification))
+        await session.commit()
+
+    monkeypatch.setattr(settings, "SQL_QUERY_BUDGET_STRICT", True)
+    app.add_api_route("/query-budget-probe", over_budget, methods=["POST"], dependencies=[query_budget(1)])
+    try:
+        response = client.post("/query-budget-probe")
+    finally:
+        app.router.routes.pop()
+
+    assert response.status_code == 500, response.text
+
+    async def written():
+        connection = await connect()
+        try:
+            return await connection.fetchval("SELECT count(*) FROM notifications WHERE target = 'nobody'")
+        finally:
+            await connection.close()
+
+    assert asyncio.run(written()) == 0
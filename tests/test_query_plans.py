@@ -0,0 +1,41 @@
+"""
+Plan regression checks for the hot queries, the `app.cli.plan_check` expectations as assertions.
+
+Seeds plan_check's 10k-row dataset in a rolled back transaction and compares each plan with
+its committed snapshot in `app/cli/plan_snapshots/`. After an intended plan change, refresh
+the snapshots with `python -m app.cli.plan_check --update` and commit them.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.cli.plan_check import SNAPSHOT_DIR, check_plans, plan_checks
+from app.config.settings import get_settings
+
+PLAN_SCALE = 10000
+
+
+@pytest.fixture(scope="module")
+def checked_plans(database) -> dict:
+    async def run():
+        # A separate engine, the app's pool belongs to the test client's event loop
+        engine = create_async_engine(get_settings().DATABASE_URI, poolclass=NullPool)
+        try:
+            async with engine.connect() as connection:
+                return await check_plans(connection, PLAN_SCALE)
+        finally:
+            await engine.dispose()
+
+    return {check.name: check for check in asyncio.run(run())}
+
+
+@pytest.mark.parametrize("name", [check.name for check in plan_checks()])
+def test_plan(checked_plans, name):
+    check = checked_plans[name]
+    assert not check.findings, "\n".join(check.findings)
+
+
+def test_every_check_has_a_committed_snapshot():
+    assert {path.stem for path in SNAPSHOT_DIR.glob("*.txt")} == {check.name for check in plan_checks()}
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from app.config import rate_limit as rate_limits
+from app.config.rate_limit import InMemoryRateLimitStore, RateLimit, get_rate_limit_store, set_rate_limit_store
+from app.config.settings import get_settings
+
+pytestmark = pytest.mark.usefixtures("seeded")
+
+settings = get_settings()
+
+
+@pytest.fixture(autouse=True)
+def fresh_buckets(monkeypatch):
+    """Empty buckets per test, and client addresses taken from X-Forwarded-For."""
+    previous = get_rate_limit_store()
+    set_rate_limit_store(InMemoryRateLimitStore(1000))
+    monkeypatch.setattr(rate_limits.settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(rate_limits.settings, "RATE_LIMIT_TRUST_FORWARDED", True)
+    yield
+    set_rate_limit_store(previous)
+
+
+def login(client, account: str, ip: str):
+    return client.post("/auth/login", headers={"X-Forwarded-For": ip}, json={
+        "username": account, "email": f"{account}@example.com", "password": "wrong password"
+    })
+
+
+def assert_limited(response):
+    assert response.status_code == 429, response.text
+    assert response.json()["error"] == "Too many requests, please try again later"
+    assert 1 <= int(response.headers["Retry-After"]) <= 60
+
+
+def test_login_is_limited_per_ip(client):
+    for index in range(settings.RATE_LIMIT_LOGIN_PER_IP):
+        assert login(client, f"nobody{index}", "203.0.113.1").status_code == 400
+
+    assert_limited(login(client, "somebody-else", "203.0.113.1"))
+    assert login(client, "somebody-else", "203.0.113.2").status_code == 400
+
+
+def test_login_is_limited_per_account_and_ip(client):
+    for _ in range(settings.RATE_LIMIT_LOGIN_PER_ACCOUNT):
+        assert login(client, "victim", "203.0.113.1").status_code == 400
+
+    assert_limited(login(client, "victim", "203.0.113.1"))
+    # an attacker spending an account's tokens does not lock its owner out from elsewhere
+    assert login(client, "victim", "203.0.113.2").status_code == 400
+
+
+def test_reset_code_guesses_are_limited_per_token_from_any_address(client):
+    def verify(ip: str):
+        return client.post("/auth/verify-password", headers={"X-Forwarded-For": ip},
+                           json={"code": "000000", "token": "reset-token"})
+
+    for index in range(settings.RATE_LIMIT_PASSWORD_RESET_PER_ACCOUNT):
+        assert verify(f"203.0.113.{index + 1}").status_code != 429
+
+    assert_limited(verify("203.0.113.200"))
+
+
+def test_tokens_refill_over_time(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limits.time, "monotonic", lambda: now[0])
+    store = InMemoryRateLimitStore(10)
+    limit = RateLimit(2, 60)
+
+    async def hits(count: int) -> list:
+        return [await store.hit("key", limit) for _ in range(count)]
+
+    assert asyncio.run(hits(3)) == [0, 0, 30.0]
+    now[0] += 15
+    # half a token refilled, the rejected hit above did not spend any
+    assert asyncio.run(hits(1)) == [15.0]
+    now[0] += 15
+    assert asyncio.run(hits(2)) == [0, 30.0]
+    now[0] += 3600
+    # never more than the capacity
+    assert asyncio.run(hits(3)) == [0, 0, 30.0]
+
+
+def test_least_recently_used_buckets_are_dropped(monkeypatch):
+    monkeypatch.setattr(rate_limits.time, "monotonic", lambda: 1000.0)
+    store = InMemoryRateLimitStore(2)
+    limit = RateLimit(1, 60)
+
+    async def run():
+        await store.hit("a", limit)
+        await store.hit("b", limit)
+        await store.hit("c", limit)
+        return await store.hit("a", limit), await store.hit("c", limit)
+
+    assert asyncio.run(run()) == (0, 60.0)
@@ -0,0 +1,34 @@
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.config.custom_exceptions import CustomHTTPException
+from app.models.media_storage import MediaStorage
+from app.models.order import Order
+from app.models.user import User
+from app.services.search import apply_search
+
+
+def compile_sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.parametrize("entity", [Order, User])
+def test_free_text_search_without_name_is_a_400(entity):
+    with pytest.raises(CustomHTTPException) as exc_info:
+        apply_search(select(entity), entity, "pending")
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize("entity", [Order, User])
+def test_uuid_search_still_works_without_name(entity):
+    row_id = uuid.uuid4()
+    assert str(row_id) in compile_sql(apply_search(select(entity), entity, str(row_id)))
+
+
+def test_name_search_escapes_like_wildcards():
+    compiled = apply_search(select(MediaStorage), MediaStorage, "50%_off").compile(dialect=postgresql.dialect())
+    assert "ESCAPE" in str(compiled)
+    assert list(compiled.params.values()) == ["%50\\%\\_off%"]
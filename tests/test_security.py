@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+from app.config.principal_cache import get_principal_cache
+from tests.helpers import connect
+
+pytestmark = pytest.mark.usefixtures("seeded")
+
+
+def test_inactive_users_are_rejected_from_the_row_and_the_cache(client):
+    credentials = {"username": "dormant", "email": "dormant@example.com", "password": "dormant@123"}
+    assert client.post("/auth/register", json=credentials).status_code == 201
+    token = client.post("/auth/login", json=credentials).json()["data"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = client.get("/auth/me", headers=headers).json()["data"]["id"]
+
+    async def deactivate():
+        # Straight to the database, so only the principal cache stands between the token and the route
+        connection = await connect()
+        try:
+            await connection.execute("UPDATE users SET is_active = false WHERE username = 'dormant'")
+        finally:
+            await connection.close()
+        await get_principal_cache().invalidate(user_id)
+
+    asyncio.run(deactivate())
+
+    # loaded from the row, then served from the cache
+    for _ in range(2):
+        response = client.get("/auth/me", headers=headers)
+        assert response.status_code == 401, response.text
+        assert response.json()["error"] == "User is inactive"
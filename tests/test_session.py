@@ -0,0 +1,111 @@
+"""
+When `ReleasableSession` gives its connection back to the pool.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy import false, select, update
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.config.session import ReleasableSession, release_connection
+from app.config.settings import get_settings
+from app.models.color import Color
+
+pytestmark = pytest.mark.usefixtures("seeded")
+
+
+def in_session(work) -> dict:
+    """Run `work(session)` on a ReleasableSession of its own engine and report the transaction state afterwards."""
+    async def run():
+        # A separate engine, the app's pool belongs to the test client's event loop
+        engine = create_async_engine(get_settings().DATABASE_URI, poolclass=NullPool)
+        try:
+            async with sessionmaker(bind=engine, class_=ReleasableSession, expire_on_commit=False)() as session:
+                result = await work(session)
+                return {"in_transaction": session.in_transaction(), "result": result}
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_reads_keep_their_transaction_until_released():
+    async def read(session):
+        await session.execute(select(Color).limit(1))
+        return session.in_transaction()
+
+    assert in_session(read) == {"in_transaction": True, "result": True}
+
+
+def test_release_after_reads_frees_the_connection_and_keeps_objects_usable():
+    async def read_then_release(session):
+        colors = (await session.execute(select(Color).limit(2))).scalars().all()
+        await release_connection(session)
+        return [color.name for color in colors]
+
+    state = in_session(read_then_release)
+    assert state["in_transaction"] is False
+    assert len(state["result"]) == 2 and all(state["result"])
+
+
+@pytest.mark.parametrize("statement", [
+    update(Color).where(false()).values(name="unchanged"),
+    select(Color).limit(1).with_for_update(),
+], ids=["core_dml", "for_update"])
+def test_release_keeps_transactions_that_wrote_or_locked(statement):
+    async def write_then_release(session):
+        await session.execute(statement)
+        await release_connection(session)
+
+    assert in_session(write_then_release)["in_transaction"] is True
+
+
+def test_release_keeps_pending_changes_and_explicit_transactions():
+    async def pending(session):
+        color = (await session.execute(select(Color).limit(1))).scalar()
+        color.highlight = "changed, never committed"
+        await release_connection(session)
+
+    async def explicit(session):
+        await session.begin()
+        await session.execute(select(Color).limit(1))
+        await release_connection(session)
+
+    assert in_session(pending)["in_transaction"] is True
+    assert in_session(explicit)["in_transaction"] is True
+
+
+def test_password_reset_locks_the_user_row_for_its_write(client):
+    from tests.helpers import count_statements
+
+    credentials = {"username": "resetter", "email": "resetter@example.com", "password": "resetter@123"}
+    assert client.post("/auth/register", json=credentials).status_code == 201
+    token = client.post("/auth/login", json=credentials).json()["data"]["access_token"]
+
+    with count_statements() as stats:
+        response = client.post("/auth/reset-new-password", params={"new_password": "resetter@456"},
+                               headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200, response.text
+    # the user is read, the connection released for hashing, then re-read under a row lock
+    assert any(shape.startswith("SELECT users.") and shape.endswith("FOR UPDATE") for shape in stats.shapes), stats.shapes
+    assert client.post("/auth/login", json={**credentials, "password": "resetter@456"}).status_code == 200
+
+
+def test_customer_password_reset_locks_the_user_row_for_its_write(client, admin_headers):
+    from tests.helpers import count_statements
+
+    credentials = {"username": "reset-by-admin", "email": "reset-by-admin@example.com", "password": "customer@123"}
+    assert client.post("/auth/register", json=credentials).status_code == 201
+    customers = client.get("/backend/customers", params={"search": "name:Reset-by-admin"}, headers=admin_headers)
+    [customer] = customers.json()["data"]
+
+    with count_statements() as stats:
+        response = client.put(f"/backend/customers/reset_password/{customer['id']}",
+                              params={"password": "customer@456"}, headers=admin_headers)
+
+    assert response.status_code == 200, response.text
+    assert any(shape.startswith("SELECT users.") and shape.endswith("FOR UPDATE") for shape in stats.shapes), stats.shapes
+    assert client.post("/auth/login", json={**credentials, "password": "customer@456"}).status_code == 200